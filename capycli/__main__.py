@@ -8,6 +8,11 @@
 # -------------------------------------------------------------------------------
 
 """Module allowing for ``python -m CaPyCli ...``."""
+import multiprocessing
+
 from capycli.main import cli
 
-cli.main()
+if __name__ == "__main__":
+    # processes started by `project licenses` import this module again
+    multiprocessing.freeze_support()
+    cli.main()
@@ -1,5 +1,5 @@
 # -------------------------------------------------------------------------------
-# Copyright (c) 2025 Siemens
+# Copyright (c) 2025-2026 Siemens
 # All Rights Reserved.
 # Author: thomas.graf@siemens.com
 #
@@ -13,14 +13,17 @@ import posixpath
 import shutil
 import sys
 import tempfile
-from typing import Any
+from typing import Any, Optional, Tuple
 
 from cyclonedx.model import ExternalReference, ExternalReferenceType, HashAlgorithm, HashType, XsUri
 from cyclonedx.model.bom import Bom
+from cyclonedx.model.component import Component
 
 import capycli.common.script_base
 from capycli.bom.download_sources import BomDownloadSources
 from capycli.common.capycli_bom_support import CaPyCliBom, CycloneDxSupport, SbomWriter
+from capycli.common.download_support import DownloadScheduler, DownloadTask
+from capycli.common.parallel_support import get_worker_count, imap_ordered
 from capycli.common.print import print_red, print_text, print_yellow
 from capycli.common.script_support import ScriptSupport
 from capycli.main.result_codes import ResultCode
@@ -47,93 +50,101 @@ class BomPackage(capycli.common.script_base.ScriptBase):
         |    `--- another-sources.jar
         `--- (... more ...)
     """
-    def download_files(self, sbom: Bom, target_folder: str) -> None:
+    @staticmethod
+    def download_to_sha1_folder(task: DownloadTask, target_folder: str) -> Optional[Tuple[str, str]]:
+        """Download a file and move it to the folder `sources/<sha1>` or `binaries/<sha1>`"""
+        # every download gets its own folder, files of different components may have the same name
+        download_folder = tempfile.mkdtemp(dir=target_folder)
+        try:
+            result = BomDownloadSources.download_source_file(
+                task.url, download_folder, is_binary=task.is_binary, messages=task.messages)
+            if result is None:
+                return None
+
+            (path, sha1) = result
+            # move file to appropriate location
+            filename = pathlib.Path(path).name
+            targetsha = os.path.join(target_folder, "binaries" if task.is_binary else "sources", sha1)
+            os.makedirs(targetsha, exist_ok=True)
+            target = os.path.join(targetsha, filename)
+            shutil.move(path, target)
+            return (target, sha1)
+        finally:
+            shutil.rmtree(download_folder, ignore_errors=True)
+
+    @staticmethod
+    def update_file_ext_ref(component: Component, comment: str, folder: str, path: str, sha1: str) -> None:
+        """Update or add the external reference to a file in the package"""
+        new = False
+        ext_ref = CycloneDxSupport.get_ext_ref(
+            component, ExternalReferenceType.DISTRIBUTION, comment)
+        file_uri = posixpath.join(folder, sha1, pathlib.Path(path).name)
+        if not file_uri.startswith("file://"):
+            file_uri = "file:///" + file_uri
+        if not ext_ref:
+            ext_ref = ExternalReference(
+                type=ExternalReferenceType.DISTRIBUTION,
+                comment=comment,
+                url=XsUri(file_uri))
+            new = True
+        else:
+            ext_ref.url = XsUri(file_uri)
+        ext_ref.hashes.add(HashType(
+            alg=HashAlgorithm.SHA_1,
+            content=sha1))
+        if new:
+            component.external_references.add(ext_ref)
+
+    def download_files(self, sbom: Bom, target_folder: str, workers: int = 1) -> None:
         """Download source and binary files for all items of the SBOM.
 
         @params:
             bom           - Required : the bill of materials (BOM) (list)
             target_folder - Required : folder to store the source files (string)
+            workers       - Optional : number of parallel downloads (int, default: 1)
         """
+        # the target folder is a new temporary folder, no need for a checkpoint
+        scheduler = DownloadScheduler(target_folder, use_checkpoint=False)
 
-        for component in sbom.components:
-            item_name = ScriptSupport.get_full_name_from_component(component)
-            print_text("  " + item_name)
+        def download(task: DownloadTask) -> Optional[Tuple[str, str]]:
+            return self.download_to_sha1_folder(task, target_folder)
 
-            # download source file
+        def get_tasks(component: Component) -> Tuple[Optional[DownloadTask], Optional[DownloadTask]]:
+            source_task = None
             source_url = CycloneDxSupport.get_ext_ref_source_url(component)
             if source_url:
-                result = BomDownloadSources.download_source_file(source_url._uri, target_folder)
-            else:
-                result = None
-                print_red("    No source URL specified!")
+                source_task = scheduler.execute(DownloadTask(url=source_url._uri), download)
 
-            if result is not None:
-                (path, sha1) = result
-                # move file to appropriate location
-                filename = pathlib.Path(path).name
-                targetsha = os.path.join(target_folder, "sources", sha1)
-                os.makedirs(targetsha, exist_ok=True)
-                target = os.path.join(targetsha, filename)
-                shutil.move(path, target)
-
-                # update SBOM
-                new = False
-                ext_ref = CycloneDxSupport.get_ext_ref(
-                    component, ExternalReferenceType.DISTRIBUTION, CaPyCliBom.SOURCE_FILE_COMMENT)
-                file_uri = posixpath.join("sources", sha1, filename)
-                if not file_uri.startswith("file://"):
-                    file_uri = "file:///" + file_uri
-                if not ext_ref:
-                    ext_ref = ExternalReference(
-                        type=ExternalReferenceType.DISTRIBUTION,
-                        comment=CaPyCliBom.SOURCE_FILE_COMMENT,
-                        url=XsUri(file_uri))
-                    new = True
-                else:
-                    ext_ref.url = XsUri(file_uri)
-                ext_ref.hashes.add(HashType(
-                    alg=HashAlgorithm.SHA_1,
-                    content=sha1))
-                if new:
-                    component.external_references.add(ext_ref)
-
-            # download binary file
+            binary_task = None
             binary_url = CycloneDxSupport.get_ext_ref_binary_url(component)
             if binary_url:
-                result = BomDownloadSources.download_source_file(binary_url._uri, target_folder, is_binary=True)
+                binary_task = scheduler.execute(DownloadTask(url=binary_url._uri, is_binary=True), download)
+
+            return source_task, binary_task
+
+        # the downloads run in parallel, the SBOM is updated in the original order
+        components = list(sbom.components)
+        for component, (source_task, binary_task) in zip(components, imap_ordered(get_tasks, components, workers)):
+            item_name = ScriptSupport.get_full_name_from_component(component)
+            print_text("  " + item_name)
+
+            if source_task is None:
+                print_red("    No source URL specified!")
             else:
-                result = None
+                source_task.print_messages()
+                if source_task.ok:
+                    self.update_file_ext_ref(
+                        component, CaPyCliBom.SOURCE_FILE_COMMENT, "sources", source_task.path, source_task.sha1)
+
+            if binary_task is None:
                 print_yellow("    No binary URL specified!")
+            else:
+                binary_task.print_messages()
+                if binary_task.ok:
+                    self.update_file_ext_ref(
+                        component, CaPyCliBom.BINARY_FILE_COMMENT, "binaries", binary_task.path, binary_task.sha1)
 
-            if result is not None:
-                (path, sha1) = result
-                # move file to appropriate location
-                filename = pathlib.Path(path).name
-                targetsha = os.path.join(target_folder, "binaries", sha1)
-                os.makedirs(targetsha, exist_ok=True)
-                target = os.path.join(targetsha, filename)
-                shutil.move(path, target)
-
-                # update SBOM
-                new = False
-                ext_ref = CycloneDxSupport.get_ext_ref(
-                    component, ExternalReferenceType.DISTRIBUTION, CaPyCliBom.BINARY_FILE_COMMENT)
-                file_uri = posixpath.join("binaries", sha1, filename)
-                if not file_uri.startswith("file://"):
-                    file_uri = "file:///" + file_uri
-                if not ext_ref:
-                    ext_ref = ExternalReference(
-                        type=ExternalReferenceType.DISTRIBUTION,
-                        comment=CaPyCliBom.BINARY_FILE_COMMENT,
-                        url=XsUri(file_uri))
-                    new = True
-                else:
-                    ext_ref.url = XsUri(file_uri)
-                ext_ref.hashes.add(HashType(
-                    alg=HashAlgorithm.SHA_1,
-                    content=sha1))
-                if new:
-                    component.external_references.add(ext_ref)
+        scheduler.print_summary()
 
     def run(self, args: Any) -> None:
         """Main method
@@ -161,6 +172,7 @@ class BomPackage(capycli.common.script_base.ScriptBase):
             print("    -h, --help            show this help message and exit")
             print("    -i INPUTFILE,         input SBOM file to read from (JSON)")
             print("    -o OUTPUT ARCHIVE,    path of the output zip archive")
+            print("    -w WORKERS            number of parallel downloads")
             print("    -v                    be verbose")
             return
 
@@ -196,7 +208,7 @@ class BomPackage(capycli.common.script_base.ScriptBase):
 
         print_text("\nDownloading files to folder " + target_folder + " ...")
 
-        self.download_files(bom, target_folder)
+        self.download_files(bom, target_folder, get_worker_count(args))
 
         print_text("\nCreating BOM package " + args.outputfile)
         try:
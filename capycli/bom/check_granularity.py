@@ -9,7 +9,7 @@
 import importlib.resources as pkg_resources
 import os
 import sys
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import requests
 from cyclonedx.model import ExternalReferenceType
@@ -40,8 +40,12 @@ class CheckGranularity(capycli.common.script_base.ScriptBase):
     """
     Check the granularity of all releases in the SBOM.
     """
+    # the parsed default granularity list, it is read only once
+    default_granularity_list: Optional[List[PotentialGranularityIssue]] = None
+
     def __init__(self) -> None:
         self.granularity_list: List[PotentialGranularityIssue] = []
+        self.granularity_index: Optional[Dict[str, PotentialGranularityIssue]] = None
 
     @staticmethod
     def get_granularity_list(download_url: str) -> None:
@@ -55,6 +59,7 @@ class CheckGranularity(capycli.common.script_base.ScriptBase):
     def read_granularity_list(self, download_url: str = "", local_read_granularity: bool = False) -> None:
         """Reads the granularity list from file."""
         self.granularity_list = []
+        self.granularity_index = None
         text_list = ""
         if local_read_granularity:
             try:
@@ -73,10 +78,20 @@ class CheckGranularity(capycli.common.script_base.ScriptBase):
                 print(f"File not found: {e} \n Reading the default granularity list")
             except Exception as e:
                 print(f"An unexpected error occurred: {e}")
-        if not text_list:
+        if text_list:
+            self.granularity_list = self.parse_granularity_list(text_list)
+            return
+
+        if CheckGranularity.default_granularity_list is None:
             resources = pkg_resources.files("capycli.data")
             text_list = (resources / "granularity_list.csv").read_text()
+            CheckGranularity.default_granularity_list = self.parse_granularity_list(text_list)
+        self.granularity_list = list(CheckGranularity.default_granularity_list)
 
+    @staticmethod
+    def parse_granularity_list(text_list: str) -> List[PotentialGranularityIssue]:
+        """Parses the lines of a granularity list."""
+        granularity_list: List[PotentialGranularityIssue] = []
         for line in text_list.splitlines():
             # ignore header (first) line
             if line.startswith("component_name;replacement_name"):
@@ -106,15 +121,19 @@ class CheckGranularity(capycli.common.script_base.ScriptBase):
                 source_url = parts[3]
 
             issue = PotentialGranularityIssue(component, replacement, comment, source_url)
-            self.granularity_list.append(issue)
+            granularity_list.append(issue)
+
+        return granularity_list
 
     def find_match(self, name: str) -> Optional[PotentialGranularityIssue]:
         """Finds a match by component name."""
-        for match in self.granularity_list:
-            if match.component.lower() == name.lower():
-                return match
+        if self.granularity_index is None:
+            # case-insensitive index, the first entry for a name wins
+            self.granularity_index = {}
+            for match in self.granularity_list:
+                self.granularity_index.setdefault(match.component.lower(), match)
 
-        return None
+        return self.granularity_index.get(name.lower())
 
     def get_new_fixed_component(self, component: Component, new_name: str, new_src_url: str) -> Component:
         """Get a !NEW! CycloneDX component to replace the old one."""
@@ -165,13 +184,14 @@ class CheckGranularity(capycli.common.script_base.ScriptBase):
     def merge_duplicates(self, clist: List[Component]) -> List[Component]:
         """Checks for each release if there are duplicates after granularity check."""
         new_list: List[Component] = []
+        seen: Set[Tuple[str, Optional[str]]] = set()
         for release in clist:
-            count = len([item for item in new_list if item.name == release.name
-                         and item.version == release.version])
-            if count > 0:
+            key = (release.name, release.version)
+            if key in seen:
                 continue
-            else:
-                new_list.append(release)
+
+            seen.add(key)
+            new_list.append(release)
 
         print()
         print_text(str(len(clist) - len(new_list)) + " items can be reduced by granularity check")
@@ -0,0 +1,214 @@
+# -------------------------------------------------------------------------------
+# Copyright (c) 2026 Siemens
+# All Rights Reserved.
+# Author: thomas.graf@siemens.com
+#
+# SPDX-License-Identifier: MIT
+# -------------------------------------------------------------------------------
+
+"""
+Compiled filter rules for `bom filter`.
+"""
+
+import json
+import os
+from bisect import insort
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from cyclonedx.model.component import Component
+
+import capycli
+
+LOG = capycli.get_logger(__name__)
+
+
+class PrefixTrie:
+    """
+    Maps prefixes to the index of the first filter entry with this prefix.
+    find() returns the smallest index of all prefixes of a text.
+    """
+    # key of the index in a node, all other keys are single characters
+    INDEX = ""
+
+    def __init__(self) -> None:
+        self.root: Dict[str, Any] = {}
+
+    def add(self, prefix: str, index: int) -> None:
+        node = self.root
+        for char in prefix:
+            node = node.setdefault(char, {})
+        node.setdefault(self.INDEX, index)
+
+    def find(self, text: str) -> Optional[int]:
+        node = self.root
+        result: Optional[int] = node.get(self.INDEX)
+        for char in text:
+            node = node.get(char)
+            if node is None:
+                break
+            index = node.get(self.INDEX)
+            if index is not None and (result is None or index < result):
+                result = index
+
+        return result
+
+
+class CompiledFilter:
+    """
+    The remove entries of a filter, compiled into dictionaries for exact
+    names and package-urls and prefix tries for names and package-urls
+    ending with `*`. match() returns the index of the first remove entry
+    that matches a component, i.e. the same entry as testing all filter
+    entries one after the other.
+    """
+    def __init__(self, rules: Optional[Dict[str, Dict[str, int]]] = None) -> None:
+        rules = rules or {}
+        self.names: Dict[str, int] = rules.get("names", {})
+        self.name_prefixes: Dict[str, int] = rules.get("name_prefixes", {})
+        self.purls: Dict[str, int] = rules.get("purls", {})
+        self.purl_prefixes: Dict[str, int] = rules.get("purl_prefixes", {})
+        self.name_trie = PrefixTrie()
+        for prefix, index in self.name_prefixes.items():
+            self.name_trie.add(prefix, index)
+        self.purl_trie = PrefixTrie()
+        for prefix, index in self.purl_prefixes.items():
+            self.purl_trie.add(prefix, index)
+
+    @classmethod
+    def compile(cls, entries: List[Dict[str, Any]]) -> "CompiledFilter":
+        """Compile the remove entries of the filter entries"""
+        rules: Dict[str, Dict[str, int]] = {"names": {}, "name_prefixes": {}, "purls": {}, "purl_prefixes": {}}
+        for index, entry in enumerate(entries):
+            if entry.get("Mode") != "remove" or "component" not in entry:
+                continue
+
+            # a name is used if there is one, otherwise the package-url
+            name = entry["component"].get("Name", "") or entry["component"].get("name", "")
+            if name:
+                value, kind = name, "names"
+            elif "RepositoryId" in entry["component"]:
+                value, kind = entry["component"]["RepositoryId"], "purls"
+            else:
+                continue
+
+            # a single * is no prefix, it only matches itself
+            if value.endswith("*") and len(value) > 1:
+                value, kind = value[:-1], kind[:-1] + "_prefixes"
+            rules[kind].setdefault(value, index)
+
+        return cls(rules)
+
+    def to_dict(self) -> Dict[str, Dict[str, int]]:
+        return {
+            "names": self.names,
+            "name_prefixes": self.name_prefixes,
+            "purls": self.purls,
+            "purl_prefixes": self.purl_prefixes
+        }
+
+    def match(self, component: Component) -> Optional[int]:
+        """Return the index of the first remove entry that matches the component or None"""
+        found = [self.names.get(component.name), self.name_trie.find(component.name)]
+        if component.purl:
+            purl = component.purl.to_string()
+            found += [self.purls.get(purl), self.purl_trie.find(purl)]
+
+        indexes = [index for index in found if index is not None]
+        return min(indexes) if indexes else None
+
+
+class BomItemIndex:
+    """
+    Finds the first component of a SBOM with a given name and version, like
+    FilterBom.find_bom_item(), without testing all components. Call update()
+    after changing name or version of a component.
+    """
+    def __init__(self, components: Iterable[Component]) -> None:
+        self.components: List[Component] = []
+        self.positions: Dict[int, int] = {}
+        self.keys: Dict[int, Tuple[str, Optional[str]]] = {}
+        self.by_name: Dict[str, List[int]] = {}
+        self.by_name_version: Dict[Tuple[str, Optional[str]], List[int]] = {}
+        for position, component in enumerate(components):
+            self.components.append(component)
+            self.positions[id(component)] = position
+            self.add(position)
+
+    def add(self, position: int) -> None:
+        component = self.components[position]
+        key = (component.name, component.version)
+        self.keys[position] = key
+        insort(self.by_name.setdefault(key[0], []), position)
+        insort(self.by_name_version.setdefault(key, []), position)
+
+    def find(self, filterentry: Dict[str, Any]) -> Optional[Component]:
+        """Find the first component matching name and (optional) version of the filter entry"""
+        if "Version" in filterentry:
+            positions = self.by_name_version.get((filterentry.get("Name", "x"), filterentry["Version"]))
+        else:
+            positions = self.by_name.get(filterentry.get("Name", "x"))
+
+        return self.components[positions[0]] if positions else None
+
+    def update(self, component: Component) -> None:
+        position = self.positions[id(component)]
+        key = self.keys[position]
+        if key == (component.name, component.version):
+            return
+
+        self.by_name[key[0]].remove(position)
+        self.by_name_version[key].remove(position)
+        self.add(position)
+
+
+def get_file_state(filename: str) -> List[int]:
+    """Return modification time and size of a file or an empty list if it does not exist"""
+    try:
+        stat = os.stat(filename)
+    except OSError:
+        return []
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def get_filter_cache_file(filter_file: str) -> str:
+    """
+    Return the name of the compiled filter next to the filter file or an
+    empty string if the environment variable CAPYCLI_FILTER_CACHE is not set.
+    """
+    if os.environ.get("CAPYCLI_FILTER_CACHE", "").lower() not in ("1", "true", "yes"):
+        return ""
+    return filter_file + ".compiled.json"
+
+
+def read_filter_cache(cache_file: str) -> Optional[Tuple[Dict[str, Any], CompiledFilter]]:
+    """
+    Return the filter and the compiled filter or None if there is no
+    cache file or if any of the filter files has been changed.
+    """
+    try:
+        with open(cache_file, encoding="utf-8") as fin:
+            cache = json.load(fin)
+        for filename, state in cache["files"].items():
+            if get_file_state(filename) != state:
+                return None
+        return cache["filter"], CompiledFilter(cache["rules"])
+    except FileNotFoundError:
+        return None
+    except Exception as ex:
+        LOG.debug(f"  Ignoring invalid compiled filter {cache_file}: {ex!r}")
+        return None
+
+
+def write_filter_cache(cache_file: str, filter: Dict[str, Any], compiled: CompiledFilter,
+                       filenames: Iterable[str]) -> None:
+    """Write filter and compiled filter, together with the state of all filter files"""
+    cache = {
+        "files": {filename: get_file_state(filename) for filename in filenames},
+        "filter": filter,
+        "rules": compiled.to_dict()
+    }
+    try:
+        with open(cache_file, "w", encoding="utf-8") as fout:
+            json.dump(cache, fout)
+    except Exception as ex:
+        LOG.debug(f"  Unable to write compiled filter {cache_file}: {ex!r}")
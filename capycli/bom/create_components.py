@@ -25,7 +25,11 @@ from sw360 import SW360Error, SW360Keycloak
 import capycli.common.json_support
 import capycli.common.script_base
 from capycli.bom.download_sources import BomDownloadSources
+from capycli.common import http_support
+from capycli.common.artifact_store import get_artifact_store
 from capycli.common.capycli_bom_support import CaPyCliBom, CycloneDxSupport, SbomWriter
+from capycli.common.file_support import get_file_sha1
+from capycli.common.parallel_support import KeyedLocks, get_worker_count, imap_ordered_output
 from capycli.common.print import print_green, print_red, print_text, print_yellow
 from capycli.common.purl_utils import PurlUtils
 from capycli.common.script_support import ScriptSupport
@@ -55,7 +59,8 @@ class BomCreateComponents(capycli.common.script_base.ScriptBase):
         "    --dbx                         relaxed Debian version handling: when checking for existing releases,",
         "                                  ignore prefixes like \"2:\" (epoch) and suffixes like \".debian\"",
         "    -client_id CLIENT_ID          the SW360 client_id to be used for token generation",
-        "    -client_secret CLIENT_SECRET  the SW360 client_secret to be used for token generation"
+        "    -client_secret CLIENT_SECRET  the SW360 client_secret to be used for token generation",
+        "    -w WORKERS, --workers WORKERS number of SBOM items to process in parallel (default: 1)"
     ]
 
     def __init__(self, onlyCreateReleases: bool = False) -> None:
@@ -63,6 +68,8 @@ class BomCreateComponents(capycli.common.script_base.ScriptBase):
         self.download: bool = False
         self.relaxed_debian_parsing: bool = False
         self.onlyCreateReleases: bool = onlyCreateReleases
+        self.workers: int = 1
+        self.component_locks = KeyedLocks()
         self.allowed_licenses = [
             "Apache-2.0",
             "BSD-2-Clause", "BSD-3-Clause",
@@ -97,33 +104,75 @@ class BomCreateComponents(capycli.common.script_base.ScriptBase):
             errortext = "    Error uploading source file: " + self.get_error_message(swex)
             print(Fore.LIGHTRED_EX + errortext + Style.RESET_ALL)
 
+    def is_already_attached(self, path: str, attached_hashes: Dict[str, Dict[str, Any]],
+                            sha1: str = "") -> bool:
+        """Check whether a file with the same content is already attached to the release
+
+        @params:
+            path            - the file to check
+            attached_hashes - existing attachments of the same type by SHA1 hash
+            sha1            - SHA1 hash of the file, if already known
+        """
+        if not attached_hashes:
+            return False
+
+        if not sha1:
+            sha1 = get_file_sha1(path)
+        attachment = attached_hashes.get(sha1.lower())
+        if not attachment:
+            return False
+
+        print_yellow(
+            "      File", os.path.basename(path), "is already attached to release as",
+            attachment.get("filename", ""), "(" + attachment.get("attachmentType", "") + "). Skip the upload!")
+        return True
+
     def upload_file_from_url(self, release_id: str, url: Optional[str], filename: str,
                              filetype: str = "SOURCE", comment: str = "",
-                             attached_filenames: List[str] = []) -> None:
+                             attached_filenames: List[str] = [], filehash: str = "",
+                             attached_hashes: Optional[Dict[str, Dict[str, Any]]] = None) -> None:
         """Download a file from a URL if it's not available locally
         and upload the file as attachment to SW360.
 
         @params:
-            release_id - the id of the release (string)
-            url        - url of the file to get uploaded (string)
-            filename   - local file name
-            filetype   - SW360 attachment type ("SOURCE" or "SOURCE_SELF")
-            comment    - upload comment for SW360 attachment
+            release_id      - the id of the release (string)
+            url             - url of the file to get uploaded (string)
+            filename        - local file name
+            filetype        - SW360 attachment type ("SOURCE" or "SOURCE_SELF")
+            comment         - upload comment for SW360 attachment
+            filehash        - expected SHA1 hash of the file, if known
+            attached_hashes - existing attachments of the same type by SHA1 hash,
+                              files with the same content are not uploaded again
         """
+        attached_hashes = attached_hashes or {}
         if os.path.isfile(filename):
-            self.upload_source_file(release_id, filename, filetype, comment)
+            if not self.is_already_attached(filename, attached_hashes):
+                self.upload_source_file(release_id, filename, filetype, comment)
             return
 
         if self.source_folder:
             fullpath = os.path.join(self.source_folder, filename)
             if os.path.isfile(fullpath):
-                self.upload_source_file(release_id, fullpath, filetype, comment)
+                if not self.is_already_attached(fullpath, attached_hashes):
+                    self.upload_source_file(release_id, fullpath, filetype, comment)
                 return
 
         if not self.download:
             print_red("    File not found, perhaps you want --download?")
             return
 
+        store = get_artifact_store()
+        if store:
+            stored_path = store.find_by_sha1(filehash)
+            if not stored_path and url:
+                found = store.find_by_url(url)
+                stored_path = found[0] if found else None
+            if stored_path:
+                print_text("    Using file", os.path.basename(stored_path), "from artifact store")
+                if not self.is_already_attached(stored_path, attached_hashes):
+                    self.upload_source_file(release_id, stored_path, filetype, comment)
+                return
+
         print_text("    Downloading file", filename)
 
         if self.source_folder:
@@ -137,25 +186,28 @@ class BomCreateComponents(capycli.common.script_base.ScriptBase):
                 print_red("    No url specified!")
                 return
 
-            response = requests.get(url, allow_redirects=True)
+            # the file is streamed to disk, it is never held in memory as a whole
+            response = http_support.get(url, allow_redirects=True, stream=True)
             if (response.status_code == requests.codes["ok"]):
-                print_text("      Writing file", fullpath)
                 try:
-                    open(fullpath, "wb").write(response.content)
-                    if response.headers.__contains__("content-disposition"):
-                        header = response.headers.get("content-disposition")
-                        if header and header.__contains__("filename="):
-                            print_text("      Found header:", header)
-                            newfilename = header.split("=")[-1]
-                            newfilename = newfilename.strip('"')
-                            head, tail = os.path.split(fullpath)
-                            if newfilename != tail:
-                                newpath = str(fullpath).replace(tail, newfilename)
-                                print_text(
-                                    "      Rename downloaded file from", fullpath, "to", newpath,
-                                    "because content-disposition defines this files name")
-                                os.rename(fullpath, newpath)
-                                fullpath = newpath
+                    header = response.headers.get("content-disposition")
+                    if header and header.__contains__("filename="):
+                        print_text("      Found header:", header)
+                        newfilename = header.split("=")[-1]
+                        newfilename = newfilename.strip('"')
+                        head, tail = os.path.split(fullpath)
+                        if newfilename != tail:
+                            newpath = os.path.join(head, newfilename)
+                            print_text(
+                                "      Using file name", newpath, "instead of", fullpath,
+                                "because content-disposition defines this files name")
+                            fullpath = newpath
+
+                    print_text("      Writing file", fullpath)
+                    sha1 = http_support.download_file(response, fullpath)
+
+                    if store:
+                        store.add_file(fullpath, url, sha1)
 
                     head, tail = os.path.split(fullpath)
                     if tail in attached_filenames:
@@ -163,13 +215,14 @@ class BomCreateComponents(capycli.common.script_base.ScriptBase):
                         # attachment exists - but this code might be useful in future if this semantics changes
                         print_text(
                             "      File with the name '", tail, "' is already attached to release. Skip the upload!")
-                    else:
+                    elif not self.is_already_attached(fullpath, attached_hashes, sha1):
                         self.upload_source_file(release_id, fullpath, filetype, comment)
                         if not BomDownloadSources.is_good_source_file(fullpath):
                             print_yellow("    Downloaded file seems not to be a valid source file!")
                 except Exception as ex:
                     print_red("      Error writing downloaded file: " + repr(ex))
             else:
+                response.close()
                 print_red(
                     "    Error downloading file, http response = " +
                     str(response.status_code))
@@ -476,33 +529,50 @@ class BomCreateComponents(capycli.common.script_base.ScriptBase):
         else:
             filetype_pattern = filetype
 
-        attached_filenames = []
-        source_attachment_exists = False
+        # existing attachments of the same type that have not been rejected,
+        # newer SW360 versions include the check status in the attachment list,
+        # only older ones require reading every attachment
+        attachments = []
         for attachment in release_data.get("_embedded", {}).get("sw360:attachments", []):
-            if attachment["attachmentType"].startswith(filetype_pattern):
+            if not attachment["attachmentType"].startswith(filetype_pattern):
+                continue
+            check_status = attachment.get("checkStatus")
+            if check_status is None:
                 at_info = self.client.get_attachment_by_url(attachment['_links']['self']['href'])
-                if at_info and at_info.get("checkStatus", "") == "REJECTED":
-                    continue
-                source_attachment_exists = True
-                attached_filenames.append(attachment["filename"])
-                if attachment["filename"] != filename:
-                    print_yellow(
-                        "    WARNING: different source attachment - BOM:",
-                        filename, "SW360:", attachment["filename"])
-                    if attachment["filename"].endswith('.git'):
-                        source_attachment_exists = False
-                        print_yellow(
-                            "    WARNING: existing attachment has .git extension."
-                            + " Upload new archive attachment ", filename)
-                elif filehash and attachment["sha1"] != filehash:
+                check_status = at_info.get("checkStatus", "") if at_info else ""
+            if check_status != "REJECTED":
+                attachments.append(attachment)
+
+        # the same content is not uploaded again, whatever its file name
+        attached_hashes: Dict[str, Dict[str, Any]] = {
+            attachment["sha1"].lower(): attachment for attachment in attachments if attachment.get("sha1")}
+        if filehash and self.is_already_attached(filename, attached_hashes, filehash):
+            return
+
+        attached_filenames = []
+        source_attachment_exists = False
+        for attachment in attachments:
+            source_attachment_exists = True
+            attached_filenames.append(attachment["filename"])
+            if attachment["filename"] != filename:
+                print_yellow(
+                    "    WARNING: different source attachment - BOM:",
+                    filename, "SW360:", attachment["filename"])
+                if attachment["filename"].endswith('.git'):
+                    source_attachment_exists = False
                     print_yellow(
-                        "    WARNING: different hash for source attachment", filename,
-                        "- BOM:", filehash, "SW360:", attachment["sha1"])
-                else:
-                    print_green("     Attachment", filename, "ok")
+                        "    WARNING: existing attachment has .git extension."
+                        + " Upload new archive attachment ", filename)
+            elif filehash and attachment["sha1"] != filehash:
+                print_yellow(
+                    "    WARNING: different hash for source attachment", filename,
+                    "- BOM:", filehash, "SW360:", attachment["sha1"])
+            else:
+                print_green("     Attachment", filename, "ok")
 
         if not source_attachment_exists:
-            self.upload_file_from_url(release_id, url, filename, filetype, comment, attached_filenames)
+            self.upload_file_from_url(release_id, url, filename, filetype, comment, attached_filenames,
+                                      filehash or "", attached_hashes)
 
     def search_for_release(self, component: Dict[str, Any], cx_comp: Component) -> Optional[Dict[str, Any]]:
         """Checks whether the given component already contains
@@ -703,40 +773,75 @@ class BomCreateComponents(capycli.common.script_base.ScriptBase):
                 cx_comp, CycloneDxSupport.CDX_PROP_SW360ID, self.get_sw360_id(release))
             cx_comp.version = release["version"]
 
-    def create_items(self, sbom: Bom) -> None:
-        """Create missing components and releases
+    def create_item(self, cx_comp: Component) -> bool:
+        """Create or update a single SBOM item
 
-        :param bom: the bill of materials
-        :type bom: list of components
+        :param cx_comp: the SBOM item
+        :return: False if the release could not be created
         """
         if not self.client:
             print_red("  No client!")
             sys.exit(ResultCode.RESULT_ERROR_ACCESSING_SW360)
 
         ok = True
-
-        for cx_comp in sbom.components:
-            item_name = ScriptSupport.get_full_name_from_component(cx_comp)
+        item_name = ScriptSupport.get_full_name_from_component(cx_comp)
+        id = CycloneDxSupport.get_property_value(cx_comp, CycloneDxSupport.CDX_PROP_SW360ID)
+        if id:
+            print_text("  " + item_name + " already exists")
+            rel = self.client.get_release(id)
+            if rel:
+                self.update_release(cx_comp, rel)
+        else:
+            print_text("  " + item_name)
+            # releases of the same component are created one after the other,
+            # otherwise parallel workers might create the component twice
+            with self.component_locks.get(cx_comp.name.lower()):
+                self.create_component_and_release(cx_comp)
             id = CycloneDxSupport.get_property_value(cx_comp, CycloneDxSupport.CDX_PROP_SW360ID)
             if id:
-                print_text("  " + item_name + " already exists")
-                rel = self.client.get_release(id)
-                if rel:
-                    self.update_release(cx_comp, rel)
+                print("    Release id = " + id)
             else:
-                print_text("  " + item_name)
-                self.create_component_and_release(cx_comp)
-                id = CycloneDxSupport.get_property_value(cx_comp, CycloneDxSupport.CDX_PROP_SW360ID)
-                if id:
-                    print("    Release id = " + id)
-                else:
-                    ok = False
+                ok = False
+
+        # clear map result
+        CycloneDxSupport.remove_property(cx_comp, CycloneDxSupport.CDX_PROP_MAPRESULT)
+        return ok
+
+    def create_item_parallel(self, cx_comp: Component) -> bool:
+        """Create or update a single SBOM item in a worker thread.
+        Errors do not stop the other workers, they are reported after
+        all items have been processed."""
+        try:
+            return self.create_item(cx_comp)
+        except SystemExit as ex:
+            print_red("    Error creating item, exit code " + str(ex.code))
+        except Exception as ex:
+            print_red("    Error creating item: " + repr(ex))
+        return False
+
+    def create_items(self, sbom: Bom) -> None:
+        """Create missing components and releases
+
+        :param bom: the bill of materials
+        :type bom: list of components
+        """
+        if not self.client:
+            print_red("  No client!")
+            sys.exit(ResultCode.RESULT_ERROR_ACCESSING_SW360)
+
+        failed: List[str] = []
+        create = self.create_item_parallel if self.workers > 1 else self.create_item
 
-            # clear map result
-            CycloneDxSupport.remove_property(cx_comp, CycloneDxSupport.CDX_PROP_MAPRESULT)
+        # the output of every item is printed in the order of the SBOM
+        components = list(sbom.components)
+        for cx_comp, ok in zip(components, imap_ordered_output(create, components, self.workers)):
+            if not ok:
+                failed.append(ScriptSupport.get_full_name_from_component(cx_comp))
 
-        if not ok:
+        if failed:
             print_red("An error occurred during component/release creation!")
+            for item_name in failed:
+                print_red("  " + item_name)
             sys.exit(ResultCode.RESULT_ERROR_CREATING_ITEM)
 
     def run(self, args: Any) -> None:
@@ -772,6 +877,7 @@ class BomCreateComponents(capycli.common.script_base.ScriptBase):
             self.source_folder = args.source
 
         self.download = args.download
+        self.workers = get_worker_count(args)
 
         if args.dbx:
             print_text("Using relaxed debian version checks")
@@ -9,7 +9,7 @@
 import os
 import sys
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 from cyclonedx.model.bom import Bom
 from cyclonedx.model.component import Component
@@ -61,16 +61,25 @@ class DiffBom(capycli.common.script_base.ScriptBase):
 
         return None
 
+    @staticmethod
+    def get_keys(bom: Bom) -> Set[Tuple[Optional[str], str, Optional[str]]]:
+        """Return the keys (group, name, version) of all components of the SBOM"""
+        return {MergeBom.get_key(c) for c in bom.components}
+
     def compare_boms(self, bom_old: Bom, bom_new: Bom) -> Tuple[Bom, Bom]:
         equal_bom = SbomCreator.create([])
         diff_bom = SbomCreator.create([])
+        old_keys = self.get_keys(bom_old)
+        new_keys = self.get_keys(bom_new)
+        equal_keys = set()
         for comp_old in bom_old.components:
-            found = self.find_in_bom(bom_new, comp_old)
-            if found:
+            key = MergeBom.get_key(comp_old)
+            if key in new_keys:
                 print_green(
                     "  Release exists in both SBOMs: " +
                     comp_old.name + ", " + comp_old.version)
-                if not self.find_in_bom(equal_bom, comp_old):
+                if key not in equal_keys:
+                    equal_keys.add(key)
                     equal_bom.components.add(comp_old)
             else:
                 print_red(
@@ -79,8 +88,7 @@ class DiffBom(capycli.common.script_base.ScriptBase):
                 diff_bom.components.add(comp_old)
 
         for comp_new in bom_new.components:
-            found = self.find_in_bom(bom_old, comp_new)
-            if not found:
+            if MergeBom.get_key(comp_new) not in old_keys:
                 print_yellow(
                     "  New release:                  " +
                     comp_new.name + ", " + comp_new.version)
@@ -90,110 +98,143 @@ class DiffBom(capycli.common.script_base.ScriptBase):
 
     def compare_boms_with_updates(self, bom_old: Bom, bom_new: Bom) -> List[Dict[str, Any]]:
         """Determine differences in the bills or materials."""
-        result: List[Dict[str, Any]] = []
+        return list(self.diff_components(bom_old, bom_new))
+
+    def diff_components(self, bom_old: Bom, bom_new: Bom) -> Iterator[Dict[str, Any]]:
+        """
+        Determine differences in the bills or materials, including updates of
+        components. Both SBOMs are indexed once, then the result items are
+        returned one after the other, in the same order as by check_for_updates():
+        the items of the first SBOM, then the new items of the second SBOM.
+        """
+        old_keys = self.get_keys(bom_old)
+        new_keys = set()
+        new_items: List[Dict[str, Any]] = []
+        for comp_new in bom_new.components:
+            key = MergeBom.get_key(comp_new)
+            new_keys.add(key)
+            if key not in old_keys:
+                new_items.append({"Name": comp_new.name, "Version": comp_new.version, "Result": DiffType.NEW})
+        new_by_name = self.group_by_name(new_items)
 
         for comp_old in bom_old.components:
-            ritem = {}
+            ritem: Dict[str, Any] = {}
             ritem["Name"] = comp_old.name
             ritem["Version"] = comp_old.version
-
-            found = self.find_in_bom(bom_new, comp_old)
-            if found:
+            if MergeBom.get_key(comp_old) in new_keys:
                 ritem["Result"] = DiffType.IDENTICAL
-                result.append(ritem)
+                yield ritem
             else:
                 ritem["Result"] = DiffType.OBSOLETE
-                result.append(ritem)
+                if not self.find_update(ritem, new_by_name):
+                    yield ritem
 
-        for comp_new in bom_new.components:
-            found = self.find_in_bom(bom_old, comp_new)
-            if not found:
-                ritem = {}
-                ritem["Name"] = comp_new.name
-                ritem["Version"] = comp_new.version
-                ritem["Result"] = DiffType.NEW
-                result.append(ritem)
+        yield from new_items
 
-        return self.check_for_updates(result)
+    @staticmethod
+    def group_by_name(items: Iterable[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        """Group the new items by their (lowercase) name"""
+        new_by_name: Dict[str, List[Dict[str, Any]]] = {}
+        for item in items:
+            if item["Result"] == DiffType.NEW:
+                new_by_name.setdefault(item["Name"].lower(), []).append(item)
+        return new_by_name
+
+    @staticmethod
+    def find_update(item: Dict[str, Any], new_by_name: Dict[str, List[Dict[str, Any]]]) -> bool:
+        """
+        Check whether the new items with the same name as the obsolete item
+        are updates of it. These items are marked as major or minor update
+        and are not considered for other obsolete items.
+        """
+        candidates = new_by_name.get(item["Name"].lower())
+        if not candidates:
+            return False
 
-    def check_for_updates(self, result: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Try to determine if the differences are updates of existing components."""
-        removeList = []
+        try:
+            verOld = ComparableVersion(item["Version"])
+        except ValueError:
+            return False
 
-        for item in result:
-            if item["Result"] != DiffType.OBSOLETE:
+        found = False
+        remaining = []
+        for itemNew in candidates:
+            try:
+                verNew = ComparableVersion(itemNew["Version"])
+            except ValueError:
+                remaining.append(itemNew)
                 continue
 
-            for itemNew in result:
-                if itemNew["Result"] != DiffType.NEW:
-                    continue
-
-                if itemNew["Name"].lower() != item["Name"].lower():
-                    continue
+            itemNew["VersionOld"] = item["Version"]
+            if verOld.major != verNew.major:
+                itemNew["Result"] = DiffType.MAJOR_UPDATE
+            else:
+                itemNew["Result"] = DiffType.MINOR_UPDATE
+            found = True
 
-                try:
-                    verOld = ComparableVersion(item["Version"])
-                    verNew = ComparableVersion(itemNew["Version"])
+        new_by_name[item["Name"].lower()] = remaining
+        return found
 
-                    itemNew["VersionOld"] = item["Version"]
-                    if verOld.major != verNew.major:
-                        itemNew["Result"] = DiffType.MAJOR_UPDATE
-                    else:
-                        itemNew["Result"] = DiffType.MINOR_UPDATE
+    def check_for_updates(self, result: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Try to determine if the differences are updates of existing components."""
+        new_by_name = self.group_by_name(result)
 
-                    removeList.append(item)
-                except ValueError:
-                    pass
+        # obsolete entries that have been updated are removed
+        return [item for item in result
+                if item["Result"] != DiffType.OBSOLETE or not self.find_update(item, new_by_name)]
 
-        # remove obsolete entries
-        for entry in removeList:
-            result.remove(entry)
+    def display_item(self, item: Dict[str, Any], show_identical: bool) -> None:
+        if item["Result"] == DiffType.IDENTICAL:
+            if show_identical:
+                print_green(
+                    "  Release exists in both SBOMs: " +
+                    item["Name"] + ", " + item["Version"])
 
-        return result
+            return
 
-    def display_result(self, result: List[Dict[str, Any]], show_identical: bool) -> None:
-        for item in result:
-            if item["Result"] == DiffType.IDENTICAL:
-                if show_identical:
-                    print_green(
-                        "  Release exists in both SBOMs: " +
-                        item["Name"] + ", " + item["Version"])
+        if item["Result"] == DiffType.OBSOLETE:
+            print_red(
+                "  Release has been removed:     " +
+                item["Name"] + ", " + item["Version"])
+            return
 
-                continue
+        if item["Result"] == DiffType.NEW:
+            print_yellow(
+                "  New release:                  " +
+                item["Name"] + ", " + item["Version"])
+            return
 
-            if item["Result"] == DiffType.OBSOLETE:
-                print_red(
-                    "  Release has been removed:     " +
-                    item["Name"] + ", " + item["Version"])
-                continue
+        if item["Result"] == DiffType.MINOR_UPDATE:
+            print_yellow(
+                "  Minor update:                 " +
+                item["Name"] + ", " + item["VersionOld"] + " -> " + item["Version"])
+            return
 
-            if item["Result"] == DiffType.NEW:
-                print_yellow(
-                    "  New release:                  " +
-                    item["Name"] + ", " + item["Version"])
-                continue
+        if item["Result"] == DiffType.MAJOR_UPDATE:
+            print_yellow(
+                "  Major update:                 " +
+                item["Name"] + ", " + item["VersionOld"] + " -> " + item["Version"])
+            return
 
-            if item["Result"] == DiffType.MINOR_UPDATE:
-                print_yellow(
-                    "  Minor update:                 " +
-                    item["Name"] + ", " + item["VersionOld"] + " -> " + item["Version"])
-                continue
+        # fallback
+        print_red(
+            "  Unknown result:               " +
+            str(item["Result"]) + ": " +
+            item["Name"] + ", " + item["Version"])
 
-            if item["Result"] == DiffType.MAJOR_UPDATE:
-                print_yellow(
-                    "  Major update:                 " +
-                    item["Name"] + ", " + item["VersionOld"] + " -> " + item["Version"])
-                continue
+    def display_results(self, result: Iterable[Dict[str, Any]], show_identical: bool) -> Iterator[Dict[str, Any]]:
+        """Display the items and pass them on, e.g. to write_result_to_json()"""
+        for item in result:
+            self.display_item(item, show_identical)
+            yield item
 
-            # fallback
-            print_red(
-                "  Unknown result:               " +
-                str(item["Result"]) + ": " +
-                item["Name"] + ", " + item["Version"])
+    def display_result(self, result: Iterable[Dict[str, Any]], show_identical: bool) -> None:
+        for _ in self.display_results(result, show_identical):
+            pass
 
-    def write_result_to_json(self, filename: str, result: List[Dict[str, Any]]) -> None:
-        """Write comparison result to a JSON file."""
-        capycli.common.json_support.write_json_to_file(result, filename)
+    def write_result_to_json(self, filename: str, result: Iterable[Dict[str, Any]]) -> None:
+        """Write comparison result to a JSON file, one item after the other."""
+        capycli.common.json_support.write_json_items_to_file(result, filename)
 
     def run(self, args: Any) -> None:
         """Main method()"""
@@ -252,11 +293,13 @@ class DiffBom(capycli.common.script_base.ScriptBase):
 
         print_text()
         if args.verbose:
-            result = self.compare_boms_with_updates(bom_old, bom_new)
-            self.display_result(result, args.all)
+            # the result is displayed and written while it is determined
+            result = self.diff_components(bom_old, bom_new)
             if args.outputfile:
-                self.write_result_to_json(args.outputfile, result)
+                self.write_result_to_json(args.outputfile, self.display_results(result, args.all))
                 args.outputfile = None
+            else:
+                self.display_result(result, args.all)
         else:
             self.equal_bom, self.diff_bom = self.compare_boms(bom_old, bom_new)
 
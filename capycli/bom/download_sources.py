@@ -1,12 +1,11 @@
 # -------------------------------------------------------------------------------
-# Copyright (c) 2020-2025 Siemens
+# Copyright (c) 2020-2026 Siemens
 # All Rights Reserved.
 # Author: thomas.graf@siemens.com
 #
 # SPDX-License-Identifier: MIT
 # -------------------------------------------------------------------------------
 
-import hashlib
 import logging
 import os
 import pathlib
@@ -18,10 +17,15 @@ from urllib.parse import urlparse
 import requests
 from cyclonedx.model import ExternalReference, ExternalReferenceType, HashAlgorithm, HashType, XsUri
 from cyclonedx.model.bom import Bom
+from cyclonedx.model.component import Component
 
 import capycli.common.json_support
 import capycli.common.script_base
+from capycli.common import http_support
+from capycli.common.artifact_store import get_artifact_store
 from capycli.common.capycli_bom_support import CaPyCliBom, CycloneDxSupport, SbomWriter
+from capycli.common.download_support import DownloadScheduler, DownloadTask, Messages, report
+from capycli.common.parallel_support import get_worker_count, imap_ordered
 from capycli.common.print import print_red, print_text, print_yellow
 from capycli.common.script_support import ScriptSupport
 from capycli.main.result_codes import ResultCode
@@ -58,7 +62,8 @@ class BomDownloadSources(capycli.common.script_base.ScriptBase):
 
     @staticmethod
     def download_source_file(url: str, source_folder: str, is_binary: bool = False,
-                             filename_hint: str = "") -> Optional[Tuple[str, str]]:
+                             filename_hint: str = "",
+                             messages: Optional[Messages] = None) -> Optional[Tuple[str, str]]:
         """Download a file from a URL.
 
         @params:
@@ -66,11 +71,24 @@ class BomDownloadSources(capycli.common.script_base.ScriptBase):
             source_folder - Required : folder to store the source files (string)
             is_binary     - Optional : whether the file is a binary file (boolean, default: False)
             filename_hint - Optional : filename to use if there's no Content-Disposition header
+            messages      - Optional : collect the output instead of printing it
         """
-        print_text("    URL = " + url)
+        report(messages, print_text, "    URL = " + url)
+
+        store = get_artifact_store()
+        if store:
+            found = store.find_by_url(url)
+            if found:
+                try:
+                    with http_support.get_file_lock(os.path.join(source_folder, os.path.basename(found[0]))):
+                        path = store.copy_file(found[0], source_folder)
+                    report(messages, print_text, "    Using file " + os.path.basename(path) + " from artifact store")
+                    return (path, found[1])
+                except OSError as ex:
+                    LOG.debug("Unable to copy file from artifact store: " + repr(ex))
 
         try:
-            response = requests.get(url, allow_redirects=True)
+            response = http_support.get(url, allow_redirects=True, stream=True)
             filename = BomDownloadSources.get_filename_from_cd(response.headers.get("content-disposition", ""))
 
             if not filename:
@@ -82,50 +100,68 @@ class BomDownloadSources(capycli.common.script_base.ScriptBase):
                     filename = os.path.basename(filename_ps.path)
 
             if not filename:
-                print_red("    Unable to identify filename from url!")
+                response.close()
+                report(messages, print_red, "    Unable to identify filename from url!")
                 return None
 
-            print_text("    Downloading file " + filename)
+            report(messages, print_text, "    Downloading file " + filename)
             path = os.path.join(source_folder, filename)
             if (response.status_code == requests.codes["ok"]):
-                open(path, "wb").write(response.content)
+                sha1 = http_support.download_file(response, path)
+                if store:
+                    store.add_file(path, url, sha1)
                 if not is_binary and not BomDownloadSources.is_good_source_file(path):
-                    print_yellow("    Downloaded file seems not to be a valid source file!")
-                sha1 = hashlib.sha1(response.content).hexdigest()
+                    report(messages, print_yellow, "    Downloaded file seems not to be a valid source file!")
                 return (path, sha1)
             else:
-                print_red(
+                response.close()
+                report(
+                    messages, print_red,
                     "    Error downloading file, http response = " +
                     str(response.status_code))
         except Exception as ex:
-            print_red("      Error downloading file: " + repr(ex))
+            report(messages, print_red, "      Error downloading file: " + repr(ex))
 
         return None
 
-    def download_sources(self, sbom: Bom, source_folder: str) -> None:
+    def download_sources(self, sbom: Bom, source_folder: str, workers: int = 1) -> None:
         """Download source files for all items of the SBOM.
 
         @params:
             bom           - Required : the bill of materials (BOM) (list)
             source_folder - Required : folder to store the source files (string)
+            workers       - Optional : number of parallel downloads (int, default: 1)
         """
+        scheduler = DownloadScheduler(source_folder)
 
-        for component in sbom.components:
+        def download(task: DownloadTask) -> Optional[Tuple[str, str]]:
+            return self.download_source_file(task.url, source_folder, filename_hint=task.filename_hint,
+                                             messages=task.messages)
+
+        def get_task(component: Component) -> Optional[DownloadTask]:
+            source_url = CycloneDxSupport.get_ext_ref_source_url(component)
+            if not source_url:
+                return None
+
+            task = DownloadTask(
+                url=source_url._uri,
+                filename_hint=CycloneDxSupport.get_property_value(
+                    component, CycloneDxSupport.CDX_PROP_FILENAME))
+            return scheduler.execute(task, download)
+
+        # the downloads run in parallel, the SBOM is updated in the original order
+        components = list(sbom.components)
+        for component, task in zip(components, imap_ordered(get_task, components, workers)):
             item_name = ScriptSupport.get_full_name_from_component(component)
             print_text("  " + item_name)
 
-            source_url = CycloneDxSupport.get_ext_ref_source_url(component)
-            if source_url:
-                filename_hint = CycloneDxSupport.get_property_value(
-                    component, CycloneDxSupport.CDX_PROP_FILENAME)
-                result = self.download_source_file(source_url._uri, source_folder,
-                                                   filename_hint=filename_hint)
-            else:
-                result = None
+            if task is None:
                 print_red("    No URL specified!")
+                continue
 
-            if result is not None:
-                (path, sha1) = result
+            task.print_messages()
+            if task.ok:
+                path, sha1 = task.path, task.sha1
                 # update SBOM
                 # For Siemens CycloneDX SBOM the file location needs to be relative
                 # to the location of the SBOM file.
@@ -151,6 +187,8 @@ class BomDownloadSources(capycli.common.script_base.ScriptBase):
                 if new:
                     component.external_references.add(ext_ref)
 
+        scheduler.print_summary()
+
     def update_local_path(self, sbom: Bom, bomfile: str) -> None:
         bompath = pathlib.Path(bomfile).parent
         for component in sbom.components:
@@ -196,6 +234,7 @@ class BomDownloadSources(capycli.common.script_base.ScriptBase):
             print("    -i INPUTFILE,         input SBOM file to read from (JSON)")
             print("    -source SOURCE        source folder or additional source file")
             print("    -o OUTPUTFILE         output file to write to")
+            print("    -w WORKERS            number of parallel downloads")
             print("    -v                    be verbose")
             return
 
@@ -226,7 +265,7 @@ class BomDownloadSources(capycli.common.script_base.ScriptBase):
 
         print_text("\nDownloading source files to folder " + source_folder + " ...")
 
-        self.download_sources(bom, source_folder)
+        self.download_sources(bom, source_folder, get_worker_count(args))
 
         if args.outputfile:
             print_text("\nUpdating path information")
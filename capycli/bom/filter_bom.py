@@ -9,7 +9,7 @@
 import json
 import os
 import sys
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from cyclonedx.model import ExternalReferenceType
 from cyclonedx.model.bom import Bom
@@ -19,6 +19,13 @@ from packageurl import PackageURL
 import capycli.common.json_support
 import capycli.common.script_base
 from capycli import get_logger
+from capycli.bom.compiled_filter import (
+    BomItemIndex,
+    CompiledFilter,
+    get_filter_cache_file,
+    read_filter_cache,
+    write_filter_cache,
+)
 from capycli.bom.legacy import LegacySupport
 from capycli.common.capycli_bom_support import CaPyCliBom, CycloneDxSupport, SbomCreator, SbomWriter
 from capycli.common.print import print_red, print_text, print_yellow
@@ -147,10 +154,13 @@ class FilterBom(capycli.common.script_base.ScriptBase):
                 CycloneDxSupport.CDX_PROP_SW360ID,
                 filterentry.get("Sw360Id", ""))
 
-    def filter_bom(self, bom: Bom, filter_file: str) -> Bom:
-        list_temp = []
-
+    def load_filter(self, filter_file: str) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        Load a filter file and all filter files it includes.
+        Returns the filter and the names of all files it depends on.
+        """
         filter = self.load_filter_file(filter_file)
+        filenames = [filter_file]
         if self.verbose:
             print_text("  Got", len(filter["Components"]), "filter entries")
 
@@ -158,9 +168,11 @@ class FilterBom(capycli.common.script_base.ScriptBase):
         for include in filter.get("Include", []):
             # load additional filter files
 
+            filenames.append(include)
             if not os.path.exists(include):
                 # if include is not an absolute path, try relative path
                 include = os.path.join(filter_folder, include)
+                filenames.append(include)
 
             if not os.path.exists(include):
                 print_yellow("  Filter file " + include + " does not exist!")
@@ -172,6 +184,33 @@ class FilterBom(capycli.common.script_base.ScriptBase):
                 print_text("    Got", len(filter_include["Components"]), "filter entries")
             self.append_components(filter["Components"], filter_include["Components"])
 
+        return filter, filenames
+
+    def load_compiled_filter(self, filter_file: str) -> Tuple[Dict[str, Any], CompiledFilter]:
+        """
+        Load a filter file and compile it. If CAPYCLI_FILTER_CACHE is set,
+        the compiled filter is kept next to the filter file and used as
+        long as none of the filter files has been changed.
+        """
+        cache_file = get_filter_cache_file(filter_file)
+        if cache_file:
+            cached = read_filter_cache(cache_file)
+            if cached:
+                print_text("  Using compiled filter", cache_file)
+                return cached
+
+        filter, filenames = self.load_filter(filter_file)
+        compiled = CompiledFilter.compile(filter["Components"])
+        if cache_file:
+            write_filter_cache(cache_file, filter, compiled, filenames)
+
+        return filter, compiled
+
+    def filter_bom(self, bom: Bom, filter_file: str) -> Bom:
+        list_temp = []
+
+        filter, compiled = self.load_compiled_filter(filter_file)
+
         print_text("  Total", len(filter["Components"]), "filter entries")
         # self.show_filter(filter)
 
@@ -187,52 +226,23 @@ class FilterBom(capycli.common.script_base.ScriptBase):
                     mode)
 
         for component in bom.components:
-            del_item = False
-
-            for filterentry in filter["Components"]:
-                if "component" not in filterentry:
-                    continue
-
-                match = False
-                name = filterentry["component"].get("Name", "")
-                if not name:
-                    name = filterentry["component"].get("name", "")
-                if name:
-                    prefix = ""
-                    if name.endswith("*"):
-                        prefix = name[:-1]
-
-                    if prefix:
-                        match = component.name.startswith(prefix)
-                    else:
-                        match = component.name == name
-                elif "RepositoryId" in filterentry["component"]:
-                    prefix = ""
-                    if filterentry["component"]["RepositoryId"].endswith("*"):
-                        prefix = filterentry["component"]["RepositoryId"][:-1]
-
-                    if component.purl:
-                        if prefix:
-                            match = component.purl.to_string().startswith(prefix)
-                        else:
-                            match = component.purl.to_string() == filterentry["component"]["RepositoryId"]
-
-                if match:
-                    if filterentry["Mode"] == "remove":
-                        filterentry["Processed"] = True
-                        del_item = True
-                        if self.verbose:
-                            print_text("  Removing " + component.name + ", " + component.version)
-                        break
-
-            if not del_item:
+            # the first matching remove entry wins
+            index = compiled.match(component)
+            if index is None:
                 list_temp.append(component)
+                continue
+
+            filter["Components"][index]["Processed"] = True
+            if self.verbose:
+                print_text("  Removing " + component.name + ", " + component.version)
 
+        bom_index = BomItemIndex(bom.components)
         for filterentry in filter["Components"]:
             if filterentry["Mode"] == "add":
-                existing_entry = self.find_bom_item(bom, filterentry["component"])
+                existing_entry = bom_index.find(filterentry["component"])
                 if existing_entry:
                     self.update_bom_item_from_filter_entry(existing_entry, filterentry["component"])
+                    bom_index.update(existing_entry)
                     if self.verbose:
                         print_text("  Updated " + existing_entry.name + ", " + (existing_entry.version or ""))
                 else:
@@ -10,6 +10,7 @@ import logging
 import os
 import re
 import sys
+import threading
 import time
 from collections.abc import Iterable
 from typing import Any, Dict, List, Set, Tuple
@@ -29,8 +30,11 @@ from sw360.sw360keycloak import SW360Keycloak
 
 import capycli.common.script_base
 from capycli import get_logger
+from capycli.common import http_support
 from capycli.common.capycli_bom_support import CaPyCliBom, CycloneDxSupport, SbomWriter
+from capycli.common.github_cache import get_github_cache
 from capycli.common.github_support import GitHubSupport
+from capycli.common.parallel_support import ResponseMemo, get_worker_count, imap_ordered_output
 from capycli.common.print import print_green, print_red, print_text, print_yellow
 from capycli.main.result_codes import ResultCode
 
@@ -49,6 +53,7 @@ class FindSources(capycli.common.script_base.ScriptBase):
         """
         def __init__(self) -> None:
             self.data: Dict[Tuple[str, str], Set[str]] = {}
+            self.lock = threading.Lock()
 
         def __getitem__(self, key: Any) -> Set[str]:
             """Get the set of all cached tags for a key."""
@@ -80,11 +85,17 @@ class FindSources(capycli.common.script_base.ScriptBase):
 
         def filter_and_cache(self, project: str, version: str, data: Any) -> List[str]:
             """Convenience method to to filtering and adding in one run."""
-            candidates = set(self.filter(project, version, data))
-            for tag in candidates:
-                self.add(project, version, tag)
+            with self.lock:
+                candidates = set(self.filter(project, version, data))
+                for tag in candidates:
+                    self.add(project, version, tag)
             return list(candidates)
 
+    # results of find_source()
+    SOURCE_MISSING = 0
+    SOURCE_FOUND = 1
+    SOURCE_EXISTS = 2
+
     def __init__(self) -> None:
         self.verbose: bool = False
         self.version_regex = re.compile(r"(\d+[._])+\d+")
@@ -93,15 +104,22 @@ class FindSources(capycli.common.script_base.ScriptBase):
         self.github_token: str = ""
         self.sw360_url: str = os.environ.get("SW360ServerUrl", "")
         self.tag_cache = self.TagCache()
+        self.workers: int = 1
+        # GitHub repositories and matching source URLs are looked up only
+        # once, even if several SBOM items are processed in parallel
+        self.github_repos = ResponseMemo()
+        self.matching_source_urls = ResponseMemo()
+        # persistent cache, only if a response cache has been configured
+        self.github_cache = get_github_cache()
 
     @staticmethod
     def does_url_exist(url: str) -> bool:
         """Check if a URL exists"""
         try:
-            response = requests.head(url, allow_redirects=True)
+            response = http_support.head(url, allow_redirects=True)
             return response.ok
 
-        except requests.ConnectionError:
+        except (requests.ConnectionError, requests.Timeout):
             return False
 
     @staticmethod
@@ -139,7 +157,7 @@ class FindSources(capycli.common.script_base.ScriptBase):
     def is_sourcefile_accessible(self, sourcefile_url: str) -> bool:
         """Check if the URL is accessible."""
         try:
-            response = requests.head(sourcefile_url, allow_redirects=True)
+            response = http_support.head(sourcefile_url, allow_redirects=True)
             if not response.ok:
                 return False
 
@@ -178,6 +196,22 @@ class FindSources(capycli.common.script_base.ScriptBase):
         raise NotImplementedError(
             "Removed with introduction of get_matching_source_tag!")
 
+    def _github_request(self, url: str, return_response: bool = False) -> Any:
+        """Send a request to the GitHub API, use the persistent cache if available."""
+        if not self.github_cache:
+            return GitHubSupport.github_request(url, self.github_name, self.github_token,
+                                                return_response=return_response)
+
+        response = self.github_cache.request(
+            url, lambda url: GitHubSupport.github_request(url, self.github_name, self.github_token,
+                                                          return_response=True))
+        if return_response:
+            return response
+        try:
+            return response.json()
+        except ValueError:
+            return {}
+
     def _get_github_repo(self, github_ref: str) -> Dict[str, Any]:
         """Fetch GitHub API object identified by @github_ref.
            @github_ref can be a simple "<owner>/<repo>" string or any
@@ -204,7 +238,7 @@ class FindSources(capycli.common.script_base.ScriptBase):
         url = 'https://' + url.replace('//', '/')
         repo = {}
         while 'tags_url' not in repo and 'github.com' in url:
-            repo = GitHubSupport.github_request(url, self.github_name, self.github_token)
+            repo = self._github_request(url)
             url = url.rsplit('/', 1)[0]  # remove last path segment
         if 'tags_url' not in repo:
             raise ValueError(f"Unable to make @github_ref {github_ref} work!")
@@ -235,18 +269,49 @@ class FindSources(capycli.common.script_base.ScriptBase):
            search over all tags.
         """
         try:
-            repo = self._get_github_repo(github_ref)
+            repo = self.github_repos.get(github_ref, lambda: self._get_github_repo(github_ref))
         except ValueError as err:
             print_yellow("      " + str(err))
             return ""
 
+        return self.matching_source_urls.get(
+            (repo['full_name'], version, version_prefix),
+            lambda: self._get_cached_source_url(repo, version, version_prefix))
+
+    def _get_cached_source_url(self, repo: Dict[str, Any], version: Any,
+                               version_prefix: Any = None) -> str:
+        """Take the source URL from the persistent cache, search the
+           tags of the repository only if it is not cached.
+        """
+        if self.github_cache:
+            source_url = self.github_cache.get_source_url(repo['full_name'], version, version_prefix)
+            if source_url is not None:
+                if not source_url:
+                    print_yellow("      No matching tag for version " + str(version) + " found (cached)")
+                return source_url
+
+        source_url, complete = self._find_matching_source_url(repo, version, version_prefix)
+        # a missing tag is only remembered if all tags could be read
+        if self.github_cache and (source_url or complete):
+            self.github_cache.set_source_url(repo['full_name'], version, version_prefix, source_url)
+        return source_url
+
+    def _find_matching_source_url(self, repo: Dict[str, Any], version: Any,
+                                  version_prefix: Any = None) -> Tuple[str, bool]:
+        """Search the tags of the GitHub repository @repo for @version,
+           see get_matching_source_url().
+           Returns the source URL and whether all tags have been read
+           successfully, i.e. whether an empty source URL is reliable.
+        """
         tags_url = repo['tags_url'] + '?per_page=100'
         git_refs_url_tpl = repo['git_refs_url'].replace('{/sha}', '{sha}', 1)
 
-        res = GitHubSupport.github_request(tags_url, self.github_name,
-                                           self.github_token, return_response=True)
+        complete = True
+        res = self._github_request(tags_url, return_response=True)
         pages = self._get_link_page(res, 'last')
         for _ in range(pages):  # we prefer this over "while True"
+            if res.status_code != 200:
+                complete = False
             # note: in res.json() we already have the first results page
             try:
                 tags = [tag for tag in res.json()
@@ -254,12 +319,13 @@ class FindSources(capycli.common.script_base.ScriptBase):
                         or tag['name'].startswith(version_prefix)]
                 source_url = self.get_matching_tag(tags, version, tags_url)
                 if len(source_url) > 0:  # we found what we believe is
-                    return source_url    # the correct source_url
+                    return source_url, True  # the correct source_url
 
             except (TypeError, KeyError, AttributeError):
                 # res.json() did not give us an iterable of things where
                 # 'name' is a viable index, for instance an error message
                 tags = []
+                complete = False
 
             new_prefixes = self.tag_cache.filter_and_cache(
                 repo['full_name'], version,  # cache key
@@ -269,8 +335,11 @@ class FindSources(capycli.common.script_base.ScriptBase):
 
             for prefix in new_prefixes:
                 url = git_refs_url_tpl.format(sha=f'/tags/{prefix}')
-                w_prefix = GitHubSupport.github_request(url, self.github_name,
-                                                        self.github_token)
+                w_prefix = self._github_request(url)
+                if isinstance(w_prefix, dict) and 'message' in w_prefix:
+                    # error message, e.g. rate limit exceeded
+                    complete = False
+                    continue
                 if isinstance(w_prefix, dict):  # exact match
                     w_prefix = [w_prefix]
 
@@ -289,15 +358,14 @@ class FindSources(capycli.common.script_base.ScriptBase):
                 source_url = self.get_matching_tag(
                     transformed_for_get_matching_tags, version, tags_url)
                 if len(source_url) > 0:  # we found what we believe is
-                    return source_url    # the correct source_url
+                    return source_url, True  # the correct source_url
             try:
                 url = res.links['next']['url']
-                res = GitHubSupport.github_request(url, self.github_name,
-                                                   self.github_token, return_response=True)
+                res = self._github_request(url, return_response=True)
             except KeyError:  # no more result pages
                 break
         print_yellow("      No matching tag for version " + version + " found")
-        return ""
+        return "", complete
 
     def to_semver_string(self, version: str) -> str:
         """Bring all version information to a format we can compare."""
@@ -325,9 +393,7 @@ class FindSources(capycli.common.script_base.ScriptBase):
                 language = val.value
         if not use_language:
             language = ""
-        repositories = GitHubSupport.get_repositories(
-            component_name, language,
-            self.github_name, self.github_token)
+        repositories = self._github_request(GitHubSupport.get_search_url(component_name, language))
         if not repositories or repositories.get("total_count", 0) == 0:
             return ""
         name_match = [r for r in repositories.get("items") if r.get("name", "") == component_name]
@@ -604,124 +670,138 @@ class FindSources(capycli.common.script_base.ScriptBase):
         else:
             return url
 
-    def find_sources(self, bom: Bom) -> Tuple[int, int]:
-        """Go through the list of SBOM items and try to determine the source code."""
-
-        print_text("\nLooping through SBOM:")
-        found_count = 0
-        exist_count = 0
-        for component in bom.components:
-            print_text(" ", component.name, component.version)
+    def find_source(self, component: Component) -> int:
+        """Try to determine the source code of a single SBOM item.
+           The strategies are tried in a fixed order, the first one that
+           gives a source URL wins.
+        """
+        print_text(" ", component.name, component.version)
 
-            source_file_url = CycloneDxSupport.get_ext_ref_source_url(component)
-            if source_file_url:
-                exist_count += 1
-                print_green("    Source file URL already exists:", source_file_url)
-                continue
+        source_file_url = CycloneDxSupport.get_ext_ref_source_url(component)
+        if source_file_url:
+            print_green("    Source file URL already exists:", source_file_url)
+            return self.SOURCE_EXISTS
 
-            source_url = None
+        source_url = None
+        version = component.version or ""
 
-            # skip source URL check for debian components as github url s are invalid for Debian.
-            if str(component.purl).startswith("pkg:deb/debian/") or str(component.bom_ref).startswith("pkg:deb/debian"):
-                print_red("No source code check for debian components!")
-                continue
+        # skip source URL check for debian components as github url s are invalid for Debian.
+        if str(component.purl).startswith("pkg:deb/debian/") or str(component.bom_ref).startswith("pkg:deb/debian"):
+            print_red("No source code check for debian components!")
+            return self.SOURCE_MISSING
 
-            language = ""
-            for val in component.properties:
-                if val.name == "siemens:primaryLanguage":
-                    language = val.value
-            # first check if not already set on the release.
-            if self.use_sw360:
-                if self.verbose:
-                    print("    No Source code URL available",
-                          "try to find from sw360 component or releases")
-                try:
-                    source_url = self.find_source_url_on_release(component)
-                except SW360Error as swex:
-                    if swex.response is None:
-                        print_red("  Unknown error: " + swex.message)
-                    elif swex.response.status_code == requests.codes['not_found']:
-                        print(
-                            Fore.LIGHTYELLOW_EX + "  Release not found " + component.name +
-                            ", " + component.version + Style.RESET_ALL)
-                    else:
-                        print(Fore.LIGHTRED_EX + "  Error retrieving release data: ")
-                        print("  " + component.name + ", " + component.version)
-                        print("  Status Code: " + str(swex.response.status_code))
-                        if swex.message:
-                            print("    Message: " + swex.message)
-                        print(Style.RESET_ALL)
-
-            # then consider the package managers
-            if not source_url and language.lower() == "javascript":
-                if self.verbose:
-                    print("    No Source code URL available - try to find with language:")
-                source_url = self.find_source_url_by_language(component)
-            if not source_url and (language.lower() == "golang" or language.lower() == "go"):
-                if self.verbose:
-                    print("    No Source code URL available - try to find on pkg.go.dev:")
-                source_url = self.find_golang_url(component)
-
-            # finally look on github
-            repository_url = CycloneDxSupport.get_ext_ref_repository(component)
-            if repository_url and not source_url:
-                if self.verbose:
-                    print_text("    Repository URL available:", repository_url)
-                source_url = self.get_github_source_url(
-                    str(repository_url),
-                    component.version)
-            binary_url = CycloneDxSupport.get_ext_ref_binary_url(component)
-            if binary_url and not source_url:
-                if self.verbose:
-                    print_text("    Repository URL available:", repository_url)
-                source_url = self.get_github_source_url(
-                    str(binary_url),
-                    component.version)
-            website = CycloneDxSupport.get_ext_ref_website(component)
-            if website and not source_url:
-                if self.verbose:
-                    print_text("    Project site URL available:", website)
-                source_url = self.get_github_source_url(
-                    str(website),
-                    component.version)
-            source_code_url = CycloneDxSupport.get_ext_ref_source_code_url(component)
-            if source_code_url and not source_url:
-                if self.verbose:
-                    print_text("    Repository URL available:", source_code_url)
-                source_url = self.get_github_source_url(
-                    str(source_code_url),
-                    component.version)
-
-            # look via the component
-            if not source_url and self.use_sw360:
-                if self.verbose:
-                    print("    No Source code URL available",
-                          "try to find via the parent sw360 component")
-                source_url = self.find_source_url_recursive_by_sw360(component)
-
-            # deeper search on github
-            if not source_url:
-                if self.verbose:
-                    print("    No Source code URL available - try to find on github:")
-                source_url = self.find_github_url(component)
-            if not source_url and not language == "":
-                if self.verbose:
-                    print("    No Source code URL available - try to find on github without language:")
-                source_url = self.find_github_url(component, use_language=False)
-
-            if source_url:
-                if self.is_sourcefile_accessible(source_url):
-                    found_count += 1
-                    CycloneDxSupport.update_or_set_ext_ref(
-                        component,
-                        ExternalReferenceType.SOURCE_DISTRIBUTION,
-                        "", source_url)
-                    print_green("      Found source code: " + source_url)
+        language = ""
+        for val in component.properties:
+            if val.name == "siemens:primaryLanguage":
+                language = val.value
+        # first check if not already set on the release.
+        if self.use_sw360:
+            if self.verbose:
+                print("    No Source code URL available",
+                      "try to find from sw360 component or releases")
+            try:
+                source_url = self.find_source_url_on_release(component)
+            except SW360Error as swex:
+                if swex.response is None:
+                    print_red("  Unknown error: " + swex.message)
+                elif swex.response.status_code == requests.codes['not_found']:
+                    print(
+                        Fore.LIGHTYELLOW_EX + "  Release not found " + component.name +
+                        ", " + version + Style.RESET_ALL)
                 else:
-                    print_green("      Found source code URL found, but not accessible!")
+                    print(Fore.LIGHTRED_EX + "  Error retrieving release data: ")
+                    print("  " + component.name + ", " + version)
+                    print("  Status Code: " + str(swex.response.status_code))
+                    if swex.message:
+                        print("    Message: " + swex.message)
+                    print(Style.RESET_ALL)
+
+        # then consider the package managers
+        if not source_url and language.lower() == "javascript":
+            if self.verbose:
+                print("    No Source code URL available - try to find with language:")
+            source_url = self.find_source_url_by_language(component)
+        if not source_url and (language.lower() == "golang" or language.lower() == "go"):
+            if self.verbose:
+                print("    No Source code URL available - try to find on pkg.go.dev:")
+            source_url = self.find_golang_url(component)
+
+        # finally look on github
+        repository_url = CycloneDxSupport.get_ext_ref_repository(component)
+        if repository_url and not source_url:
+            if self.verbose:
+                print_text("    Repository URL available:", repository_url)
+            source_url = self.get_github_source_url(
+                str(repository_url),
+                version)
+        binary_url = CycloneDxSupport.get_ext_ref_binary_url(component)
+        if binary_url and not source_url:
+            if self.verbose:
+                print_text("    Repository URL available:", repository_url)
+            source_url = self.get_github_source_url(
+                str(binary_url),
+                version)
+        website = CycloneDxSupport.get_ext_ref_website(component)
+        if website and not source_url:
+            if self.verbose:
+                print_text("    Project site URL available:", website)
+            source_url = self.get_github_source_url(
+                str(website),
+                version)
+        source_code_url = CycloneDxSupport.get_ext_ref_source_code_url(component)
+        if source_code_url and not source_url:
+            if self.verbose:
+                print_text("    Repository URL available:", source_code_url)
+            source_url = self.get_github_source_url(
+                str(source_code_url),
+                version)
+
+        # look via the component
+        if not source_url and self.use_sw360:
+            if self.verbose:
+                print("    No Source code URL available",
+                      "try to find via the parent sw360 component")
+            source_url = self.find_source_url_recursive_by_sw360(component)
+
+        # deeper search on github
+        if not source_url:
+            if self.verbose:
+                print("    No Source code URL available - try to find on github:")
+            source_url = self.find_github_url(component)
+        if not source_url and not language == "":
+            if self.verbose:
+                print("    No Source code URL available - try to find on github without language:")
+            source_url = self.find_github_url(component, use_language=False)
+
+        if source_url:
+            if self.is_sourcefile_accessible(source_url):
+                CycloneDxSupport.update_or_set_ext_ref(
+                    component,
+                    ExternalReferenceType.SOURCE_DISTRIBUTION,
+                    "", source_url)
+                print_green("      Found source code: " + source_url)
+                return self.SOURCE_FOUND
             else:
-                print_red("      No source code URL found!")
-                continue
+                print_green("      Found source code URL found, but not accessible!")
+        else:
+            print_red("      No source code URL found!")
+
+        return self.SOURCE_MISSING
+
+    def find_sources(self, bom: Bom) -> Tuple[int, int]:
+        """Go through the list of SBOM items and try to determine the source code.
+           With more than one worker, several SBOM items are processed in
+           parallel. The output is printed in the order of the SBOM items.
+        """
+
+        print_text("\nLooping through SBOM:")
+        found_count = 0
+        exist_count = 0
+        for result in imap_ordered_output(self.find_source, bom.components, self.workers):
+            if result == self.SOURCE_FOUND:
+                found_count += 1
+            elif result == self.SOURCE_EXISTS:
+                exist_count += 1
 
         return (found_count, exist_count)
 
@@ -752,6 +832,7 @@ class FindSources(capycli.common.script_base.ScriptBase):
             print("    -url SW360_URL                (opt.) use this URL for access to SW360")
             print("    -name NAME                    (opt.) GitHub name for login")
             print("    -gt TOKEN                     (opt.) GitHub token for login")
+            print("    -w WORKERS, --workers WORKERS number of SBOM items to process in parallel (default: 1)")
             print("    -v                            be verbose")
             print("    -client_id CLIENT_ID          (opt.) the SW360 client_id to be used for token generation")
             print("    -client_secret CLIENT_SECRET  (opt.) the SW360 client_secret to be used for token generation")
@@ -766,6 +847,8 @@ class FindSources(capycli.common.script_base.ScriptBase):
             sys.exit(ResultCode.RESULT_FILE_NOT_FOUND)
 
         self.verbose = args.verbose
+        self.workers = get_worker_count(args)
+        self.github_cache = get_github_cache()
         self.github_name = args.name
         self.github_token = args.github_token
         if args.sw360_url:
@@ -815,6 +898,11 @@ class FindSources(capycli.common.script_base.ScriptBase):
         else:
             print_yellow(str(missing) + " source file URLs are missing!")
 
+        if self.verbose:
+            counters = GitHubSupport.get_counters()
+            print_text(f"\nGitHub requests: {counters.requests}, {counters.not_modified} not modified, "
+                       f"rate limit exceeded {counters.rate_limited} times, waited {counters.wait_seconds:.0f}s")
+
         if args.outputfile:
             print_text("Writing new SBOM to " + args.outputfile)
             try:
@@ -50,7 +50,7 @@ def run_bom_command(args: Any) -> None:
         print("    DownloadSources   download source files from the URL specified in the SBOM")
         print("    Granularity       check a bill of material for potential component granularity issues")
         print("    Diff              compare two bills of material")
-        print("    Merge             merge two bills of material")
+        print("    Merge             merge two or more bills of material")
         print("    Findsources       determine the source code for SBOM items")
         print("    Validate          validate an SBOM")
         print("    BomPackage        create a single archive that contains the SBOM and all source and binary files")
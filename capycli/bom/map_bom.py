@@ -15,7 +15,7 @@ import re
 import sys
 import urllib
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from cyclonedx.model import ExternalReference, ExternalReferenceType, XsUri
 from cyclonedx.model.bom import Bom
@@ -31,9 +31,11 @@ from capycli.common.capycli_bom_support import CaPyCliBom, CycloneDxSupport, Sbo
 from capycli.common.comparable_version import ComparableVersion
 from capycli.common.component_cache import ComponentCacheManagement
 from capycli.common.map_result import MapResult
+from capycli.common.parallel_support import ResponseMemo, get_worker_count, imap_ordered_output
 from capycli.common.print import print_green, print_red, print_text, print_yellow
 from capycli.common.purl_service import PurlService
 from capycli.common.purl_utils import PurlUtils
+from capycli.common.release_index import ReleaseIndex
 from capycli.main.result_codes import ResultCode
 
 LOG = get_logger(__name__)
@@ -62,6 +64,23 @@ class MapBom(capycli.common.script_base.ScriptBase):
         self.no_match_by_name_only = True
         self.full_search = False
         self.qualifier_match = False
+        self._release_index: Optional[ReleaseIndex] = None
+        self.purl_cachefile = ""
+        self.workers = 1
+        # SW360 responses of the online mapping, shared by all SBOM items
+        # during map_bom_to_releases()
+        self.response_memo: Optional[ResponseMemo] = None
+        self.refresh_purl_cache = False
+
+    @property
+    def release_index(self) -> ReleaseIndex:
+        """
+        Lookup index for the cached releases, (re)built whenever
+        the release list has been replaced or changed in size.
+        """
+        if not self._release_index or not self._release_index.is_valid_for(self.releases):
+            self._release_index = ReleaseIndex(self.releases)
+        return self._release_index
 
     def is_id_match(self, release: Dict[str, Any], component: Component) -> bool:
         """Determines whether this release is a match via identifier for the specified SBOM item"""
@@ -190,11 +209,18 @@ class MapBom(capycli.common.script_base.ScriptBase):
         result = self.map_bom_commons(component)
         result_release_ids = [r.split("/")[-1] for r in result.release_hrefs]
         result_component_ids = [r.split("/")[-1] for r in result.component_hrefs]
+        cmp_source_hash = CycloneDxSupport.get_source_file_hash(component)
+        cmp_binary_hash = CycloneDxSupport.get_binary_file_hash(component)
+        cmp_src_file = CycloneDxSupport.get_ext_ref_source_file(component)
 
-        for release in self.releases:
-            if ("Id" in release) and ("Sw360Id" not in release):
-                release["Sw360Id"] = release["Id"]
+        if check_similar:
+            # similar name checks need to look at every single release
+            candidates = self.release_index.releases
+        else:
+            candidates = self.release_index.find_candidates(
+                component, result_release_ids, result_component_ids)
 
+        for release in candidates:
             # first check: unique id
             if release["Sw360Id"] in result_release_ids or self.is_id_match(release, component):
                 self.add_match_if_better(result, release, MapResult.FULL_MATCH_BY_ID)
@@ -204,22 +230,20 @@ class MapBom(capycli.common.script_base.ScriptBase):
                     break
 
             # second check unique(?) file hashes
-            cmp_hash = CycloneDxSupport.get_source_file_hash(component)
             if (("SourceFileHash" in release)
-                    and cmp_hash
+                    and cmp_source_hash
                     and release["SourceFileHash"]):
-                if (cmp_hash.lower() == release["SourceFileHash"].lower()):
+                if (cmp_source_hash.lower() == release["SourceFileHash"].lower()):
                     self.add_match_if_better(result, release, MapResult.FULL_MATCH_BY_HASH)
                     if self.full_search:
                         continue
                     else:
                         break
 
-            cmp_hash = CycloneDxSupport.get_binary_file_hash(component)
             if (("BinaryFileHash" in release)
-                and cmp_hash
+                and cmp_binary_hash
                     and release["BinaryFileHash"]):
-                if (cmp_hash.lower() == release["BinaryFileHash"].lower()):
+                if (cmp_binary_hash.lower() == release["BinaryFileHash"].lower()):
                     self.add_match_if_better(result, release, MapResult.FULL_MATCH_BY_HASH)
                     if self.full_search:
                         continue
@@ -245,7 +269,6 @@ class MapBom(capycli.common.script_base.ScriptBase):
                 name_match = False
 
             # fourth check: source filename
-            cmp_src_file = CycloneDxSupport.get_ext_ref_source_file(component)
             if (("SourceFile" in release)
                 and cmp_src_file
                     and release["SourceFile"]):
@@ -291,23 +314,29 @@ class MapBom(capycli.common.script_base.ScriptBase):
         new_version = parts[0]
         return new_version
 
+    def get_memo_response(self, key: Tuple[str, str], func: Callable[[str], Any], arg: str) -> Any:
+        """Return the result of func(arg), use the response memo if available"""
+        if self.response_memo is None:
+            return func(arg)
+
+        return self.response_memo.get(key, lambda: func(arg))
+
     def map_bom_item_no_cache(self, component: Component) -> MapResult:
         """Maps a single SBOM item to SW360 via online checks (no cache!)"""
 
         def get_release_details(href: str) -> Optional[Dict[str, Any]]:
             """Get release data from SW360 for match result"""
-            if not self.client:
-                return None
-            real_release = self.client.get_release_by_url(href)
+            real_release = self.get_memo_response(("release", href), client.get_release_by_url, href)
             if not real_release:
                 print_red("Error accessing release " + href)
                 return None
-            release = ComponentCacheManagement.convert_release_details(self.client, real_release)
+            release = ComponentCacheManagement.convert_release_details(client, real_release)
             return release
 
         if not self.client:
             print_red("  No client!")
             sys.exit(ResultCode.RESULT_ERROR_ACCESSING_SW360)
+        client = self.client
 
         result = self.map_bom_commons(component)
         components = []
@@ -327,7 +356,7 @@ class MapBom(capycli.common.script_base.ScriptBase):
             components += result.component_hrefs
         else:
             # if there's no purl match for components, search by name
-            components2 = self.client.get_component_by_name(component.name)
+            components2 = self.get_memo_response(("name", component.name), client.get_component_by_name, component.name)
             if not components2:
                 return result
             components = [
@@ -337,7 +366,7 @@ class MapBom(capycli.common.script_base.ScriptBase):
             ]
 
         for compref in components:
-            comp = self.client.get_component_by_url(compref)
+            comp = self.get_memo_response(("component", compref), client.get_component_by_url, compref)
             if not comp:
                 continue
             rel_list = comp["_embedded"].get("sw360:releases", [])
@@ -444,18 +473,28 @@ class MapBom(capycli.common.script_base.ScriptBase):
                 purl_types.add(component.purl.type)
         self.external_id_svc.build_purl_cache(purl_types, self.verbosity <= 1)
 
-        mapresult: list[MapResult] = []
-        for component in sbom.components:
+        def map_component(component: Component) -> Optional[MapResult]:
             try:
-                print_text("  " + component.name + ", " + component.version)
+                print_text("  " + component.name + ", " + (component.version or ""))
                 if nocache:
-                    res = self.map_bom_item_no_cache(component)
+                    return self.map_bom_item_no_cache(component)
                 else:
-                    res = self.map_bom_item(component, check_similar, result_required)
-
-                mapresult.append(res)
+                    return self.map_bom_item(component, check_similar, result_required)
             except Exception as ex:
                 print_text("    Error mapping SBOM item: " + repr(ex))
+                return None
+
+        # only the online mapping benefits from parallel requests,
+        # the results and the output are always in the order of the SBOM components
+        workers = self.workers if nocache else 1
+        mapresult: list[MapResult] = []
+        self.response_memo = ResponseMemo()
+        try:
+            for res in imap_ordered_output(map_component, sbom.components, workers):
+                if res:
+                    mapresult.append(res)
+        finally:
+            self.response_memo = None
 
         return mapresult
 
@@ -744,8 +783,8 @@ class MapBom(capycli.common.script_base.ScriptBase):
 
     def refresh_component_cache(
             self, cachefile: str, use_existing_data: bool, token: str, oauth2: bool,
-            sw360_url: str) -> List[Dict[str, Any]]:
-        """Refreshes the component cache."""
+            sw360_url: str, workers: int = 1, delta: bool = False) -> List[Dict[str, Any]]:
+        """Refreshes the component cache, with `delta` only new or changed releases are read."""
         cache_mgr = ComponentCacheManagement()
 
         if use_existing_data:
@@ -756,7 +795,7 @@ class MapBom(capycli.common.script_base.ScriptBase):
         print(" Refreshing component cache...")
         print(" This may take 1-3 minutes...")
         rel_data = cache_mgr.refresh_component_cache(
-            cachefile, True, token, oauth2=oauth2, url=sw360_url)
+            cachefile, delta, token, oauth2=oauth2, url=sw360_url, workers=workers)
         return rel_data
 
     def map_bom_commons(self, component: Component) -> MapResult:
@@ -791,7 +830,8 @@ class MapBom(capycli.common.script_base.ScriptBase):
 
         if not self.purl_service:
             # Initialize external id service
-            self.purl_service = PurlService(self.client)
+            self.purl_service = PurlService(
+                self.client, cachefile=self.purl_cachefile, refresh=self.refresh_purl_cache)
         return self.purl_service
 
     def setup_cache(self, args: Any) -> None:
@@ -803,22 +843,31 @@ class MapBom(capycli.common.script_base.ScriptBase):
                 cachefile = os.path.join(cachefile, ComponentCacheManagement.CACHE_FILENAME)
             print_text("\nCachefile is ", cachefile)
 
+            # the package-url ids are cached next to the component cache
+            self.purl_cachefile = os.path.join(
+                os.path.dirname(os.path.abspath(cachefile)), PurlService.CACHE_FILENAME)
+            self.refresh_purl_cache = args.refresh_cache or args.refresh_cache_delta
+
             print_text("  Creating backups...")
             capycli.common.file_support.create_backup(cachefile)
             capycli.common.file_support.create_backup(ComponentCacheManagement.CACHE_ALL_RELEASES)
 
-            if args.refresh_cache:
+            if args.refresh_cache or args.refresh_cache_delta:
                 print_text("  Running forced component cache refresh...")
                 self.releases = self.refresh_component_cache(
-                    cachefile, True, args.sw360_token, oauth2=args.oauth2, sw360_url=args.sw360_url)
+                    cachefile, True, args.sw360_token, oauth2=args.oauth2, sw360_url=args.sw360_url,
+                    workers=get_worker_count(args), delta=args.refresh_cache_delta)
 
             print_text("  Loading cache...")
-            self.releases = ComponentCacheManagement.read_component_cache(cachefile)
+            # the full release data is only needed for the mapping result file
+            fields = None if args.write_mapresult else ComponentCacheManagement.MATCH_FIELDS
+            self.releases = ComponentCacheManagement.read_component_cache(cachefile, fields)
             if self.releases:
                 print_text("  " + str(len(self.releases)) + " cached releases read from cache file.")
             else:
                 self.releases = self.refresh_component_cache(
-                    cachefile, False, args.sw360_token, oauth2=args.oauth2, sw360_url=args.sw360_url)
+                    cachefile, False, args.sw360_token, oauth2=args.oauth2, sw360_url=args.sw360_url,
+                    workers=get_worker_count(args))
 
         if not self.releases:
             if args.nocache:
@@ -826,10 +875,12 @@ class MapBom(capycli.common.script_base.ScriptBase):
             else:
                 print_red("No cached releases available!")
                 sys.exit(ResultCode.RESULT_NO_CACHED_RELEASES)
+        else:
+            self._release_index = ReleaseIndex(self.releases)
 
     def show_help(self) -> None:
         """Show help text."""
-        print("usage: CaPyCLI bom map [-h] [-cf CACHEFILE] [-rc] [-sc] [--nocache]")
+        print("usage: CaPyCLI bom map [-h] [-cf CACHEFILE] [-rc] [-rcd] [-w WORKERS] [-sc] [--nocache]")
         print("                            [-ov CREATE_OVERVIEW] [-mr WRITE_MAPRESULT] [-rr]")
         print("                            [-url SW360_URL] [-t SW360_TOKEN] [-oa] [-v] ")
         print("                            -i bomfile [-o UPDATED_BOM]")
@@ -840,8 +891,15 @@ class MapBom(capycli.common.script_base.ScriptBase):
         print("    -h, --help            show this help message and exit")
         print("    -i INPUTFILE          input file to read from (JSON)")
         print("    -cf CACHEFILE, --cachefile CACHEFILE")
-        print("                          cache file name to use")
-        print("    -rc, --refresh_cache  refresh component cache")
+        print("                          cache file name to use, files ending with .db or .sqlite")
+        print("                          are SQLite databases (an existing .json cache is converted)")
+        print("    -rc, --refresh_cache  refresh component cache and package-url cache")
+        print("    -rcd, --refresh_cache_delta")
+        print("                          like -rc, but only new releases and releases with a")
+        print("                          different name or version are read from SW360")
+        print("    -w WORKERS, --workers WORKERS")
+        print("                          number of parallel requests to SW360 (default: 1), used for")
+        print("                          the cache refresh and for mapping with --nocache")
         print("    -sc, --similar        look for components with similar name")
         print("    -ov CREATE_OVERVIEW, --overview CREATE_OVERVIEW")
         print("                          create an mapping overview JSON file")
@@ -926,6 +984,8 @@ class MapBom(capycli.common.script_base.ScriptBase):
         if "qualifier-match" in args.matchmode:
             self.qualifier_match = True
 
+        self.workers = get_worker_count(args)
+
         print_text("Loading SBOM file", args.inputfile)
         try:
             sbom = CaPyCliBom.read_sbom(args.inputfile)
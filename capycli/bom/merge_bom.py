@@ -8,7 +8,7 @@
 
 import os
 import sys
-from typing import Any, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from cyclonedx.model.bom import Bom
 from cyclonedx.model.bom_ref import BomRef
@@ -55,9 +55,17 @@ If there is the need to do better or a great idea on how to do better, we can ch
 
 
 class MergeBom(capycli.common.script_base.ScriptBase):
-    """Merge two SBOM files.
+    """Merge two or more SBOM files.
     """
 
+    @staticmethod
+    def get_key(component: Component) -> Tuple[Optional[str], str, Optional[str]]:
+        """
+        Return group, name and version of a component. Components with the
+        same key are the same according to are_same().
+        """
+        return (component.group, component.name, component.version)
+
     @staticmethod
     def are_same(c1: Component, c2: Component, deep: bool = False) -> bool:
         """
@@ -94,26 +102,82 @@ class MergeBom(capycli.common.script_base.ScriptBase):
 
     def merge_boms(self, bom_old: Bom, bom_new: Bom) -> Bom:
         """Merges two SBOMs."""
+        return self.merge_all_boms(bom_old, [bom_new])
+
+    def merge_all_boms(self, bom_result: Bom, boms: Iterable[Bom]) -> Bom:
+        """
+        Merges all given SBOMs into the first one, one after the other.
+
+        The components and dependencies of the result are indexed once, so
+        merging takes linear time. Dependencies are rewired to the component
+        of the result, i.e. if a component already exists in the result, the
+        dependencies refer to its bom-ref.
+        """
+        components: Dict[Tuple[Optional[str], str, Optional[str]], Component] = {}
+        for component in bom_result.components:
+            components.setdefault(self.get_key(component), component)
+        dependencies: Dict[BomRef, Dependency] = {dep.ref: dep for dep in bom_result.dependencies}
+
+        for bom in boms:
+            # step 1: merge components
+            merged: Dict[BomRef, Component] = {}
+            component_new: Component
+            for component_new in bom.components:
+                key = self.get_key(component_new)
+                found = components.get(key)
+                if not found:
+                    found = components[key] = component_new
+                    bom_result.components.add(component_new)
+                merged[component_new.bom_ref] = found
+
+            # step 2: reconstruct dependencies
+            dep: Dependency
+            for dep in bom.dependencies:
+                cr = merged.get(dep.ref)
+                if not cr:
+                    continue
+                children = [merged[d.ref] for d in dep.dependencies if d.ref in merged]
+                if children:
+                    self.add_dependencies(bom_result, dependencies, cr, children)
+
+        return bom_result
 
-        # step 1: merge components
-        component_new: Component
-        for component_new in bom_new.components:
-            found = self.find_in_bom(bom_old, component_new)
-            if not found:
-                bom_old.components.add(component_new)
-
-        # step 2: reconstruct dependencies
-        dep: Dependency
-        for dep in bom_new.dependencies:
-            cr = self.find_dependency(dep.ref, bom_new)
-            if not cr:
-                continue
-            for d in dep.dependencies:
-                cd = self.find_dependency(d.ref, bom_new)
-                if cd:
-                    bom_old.register_dependency(cr, [cd])
-
-        return bom_old
+    @staticmethod
+    def add_dependencies(bom: Bom, dependencies: Dict[BomRef, Dependency],
+                         component: Component, children: List[Component]) -> None:
+        """
+        Register the dependencies of a component like Bom.register_dependency(),
+        but use and update the given index of the dependencies of the SBOM.
+        """
+        refs = [Dependency(ref=child.bom_ref) for child in children]
+        existing = dependencies.get(component.bom_ref)
+        if existing:
+            # the hash of a dependency changes with its dependencies
+            bom.dependencies.discard(existing)
+            refs.extend(existing.dependencies)
+        dependencies[component.bom_ref] = Dependency(ref=component.bom_ref, dependencies=refs)
+        bom.dependencies.add(dependencies[component.bom_ref])
+
+        for child in children:
+            if child.bom_ref not in dependencies:
+                dependencies[child.bom_ref] = Dependency(ref=child.bom_ref)
+                bom.dependencies.add(dependencies[child.bom_ref])
+
+    @staticmethod
+    def get_file_text(index: int) -> str:
+        if index < 2:
+            return ("first", "second")[index] + " SBOM file"
+        return "SBOM file " + str(index + 1)
+
+    def read_bom(self, filename: str, index: int) -> Bom:
+        print_text("Loading " + self.get_file_text(index), filename)
+        try:
+            bom = CaPyCliBom.read_sbom(filename)
+        except Exception as ex:
+            print_red("Error reading input SBOM file: " + repr(ex))
+            sys.exit(ResultCode.RESULT_ERROR_READING_BOM)
+        print_text(" ", self.get_comp_count_text(bom), "read from SBOM")
+        return bom
 
     def run(self, args: Any) -> None:
         """Main method()"""
@@ -123,54 +187,48 @@ class MergeBom(capycli.common.script_base.ScriptBase):
 
         print_text(
             "\n" + capycli.get_app_signature() +
-            " - Merge two SBOM files.\n")
+            " - Merge SBOM files.\n")
 
         if args.help:
-            print("usage: CaPyCli bom merge [-h] [-v] bomfile1 bomfile2 [outputfile]")
+            print("usage: CaPyCli bom merge [-h] [-v] [-o OUTPUTFILE] bomfile1 bomfile2 [bomfile3 ...] [outputfile]")
             print("")
             print("positional arguments:")
             print("    bomfile1              first bill of material, JSON")
             print("    bomfile2              second bill of material, JSON")
+            print("    bomfile3 ...          further bills of material, JSON")
             print("")
             print("optional arguments:")
             print("    -h, --help            show this help message and exit")
-            print("    outputfile            if outputfile is specified the new SBOM will be written")
-            print("                          to this file. Default is overwrite bomfile1")
+            print("    -o OUTPUTFILE         write the new SBOM to this file, all positional arguments")
+            print("                          are input files. Required for more than two input files")
+            print("    outputfile            without -o, a third positional argument is the file the")
+            print("                          new SBOM will be written to. Default is overwrite bomfile1")
             return
 
         if len(args.command) < 4:
             print_red("Not enough input files specified!")
             sys.exit(ResultCode.RESULT_COMMAND_ERROR)
 
-        if not os.path.isfile(args.command[2]):
-            print_red("First SBOM file not found!")
-            sys.exit(ResultCode.RESULT_FILE_NOT_FOUND)
-
-        if not os.path.isfile(args.command[3]):
-            print_red("Second SBOM file not found!")
-            sys.exit(ResultCode.RESULT_FILE_NOT_FOUND)
-
-        output = args.command[2]
-        if len(args.command) == 5:
-            output = args.command[4]
-
-        print_text("Loading first SBOM file", args.command[2])
-        try:
-            bom_old = CaPyCliBom.read_sbom(args.command[2])
-        except Exception as ex:
-            print_red("Error reading input SBOM file: " + repr(ex))
-            sys.exit(ResultCode.RESULT_ERROR_READING_BOM)
-        print_text(" ", self.get_comp_count_text(bom_old), "read from SBOM")
+        inputs = args.command[2:]
+        output = inputs[0]
+        if args.outputfile:
+            output = args.outputfile
+        elif len(inputs) == 3:
+            output = inputs.pop()
+        elif len(inputs) > 3:
+            # do not guess which of the files is the output file
+            print_red("More than two input files require an output file (-o)!")
+            sys.exit(ResultCode.RESULT_COMMAND_ERROR)
 
-        print_text("Loading second SBOM file", args.command[3])
-        try:
-            bom_new = CaPyCliBom.read_sbom(args.command[3])
-        except Exception as ex:
-            print_red("Error reading input SBOM file: " + repr(ex))
-            sys.exit(ResultCode.RESULT_ERROR_READING_BOM)
-        print_text(" ", self.get_comp_count_text(bom_new), "read from SBOM")
+        for index, filename in enumerate(inputs):
+            if not os.path.isfile(filename):
+                print_red(self.get_file_text(index).capitalize() + " not found!")
+                sys.exit(ResultCode.RESULT_FILE_NOT_FOUND)
 
-        bom_merged = self.merge_boms(bom_old, bom_new)
+        # the SBOMs are read one after the other while merging
+        bom_merged = self.merge_all_boms(
+            self.read_bom(inputs[0], 0),
+            (self.read_bom(filename, index) for index, filename in enumerate(inputs[1:], 1)))
 
         print_text("Writing combined SBOM with", self.get_comp_count_text(bom_merged), "to", output)
         try:
@@ -12,7 +12,7 @@ Display the contents of a SBOM.
 
 import os
 import sys
-from typing import Any
+from typing import Any, Dict, List, Optional
 
 from cyclonedx.model import XsUri
 from cyclonedx.model.bom import Bom
@@ -57,6 +57,22 @@ class ShowBom(capycli.common.script_base.ScriptBase):
 
         return ""
 
+    def display_name(self, group: Optional[str], name: str, version: Optional[str]) -> None:
+        if group:
+            name = group + "/" + name
+        if not version:
+            print_text("  " + name)
+            print_yellow("  component version is missing!")
+        else:
+            print_text("  " + name + ", " + version)
+
+    def display_components(self, components: List[Dict[str, Any]]) -> None:
+        """Print name and version of the JSON components to stdout"""
+        for bomitem in components:
+            self.display_name(bomitem.get("group"), bomitem.get("name", ""), bomitem.get("version"))
+
+        print_text("\n" + str(len(components)) + " items in bill of material\n")
+
     def display_bom(self, bom: Bom) -> None:
         """Print SBOM contents to stdout"""
         if not bom:
@@ -64,14 +80,7 @@ class ShowBom(capycli.common.script_base.ScriptBase):
             return
 
         for bomitem in bom.components:
-            name = bomitem.name
-            if bomitem.group:
-                name = bomitem.group + "/" + bomitem.name
-            if not bomitem.version:
-                print_text("  " + name)
-                print_yellow("  component version is missing!")
-            else:
-                print_text("  " + name + ", " + bomitem.version)
+            self.display_name(bomitem.group, bomitem.name, bomitem.version)
 
             if self.verbose:
                 if bomitem.purl:
@@ -133,12 +142,19 @@ class ShowBom(capycli.common.script_base.ScriptBase):
             self.verbose = True
 
         try:
-            bom = CaPyCliBom.read_sbom(args.inputfile)
+            if self.verbose:
+                bom = CaPyCliBom.read_sbom(args.inputfile)
+            else:
+                # only name and version are shown, no need to create the CycloneDX object model
+                components = CaPyCliBom.read_sbom_components(args.inputfile)
         except Exception as ex:
             print_red("Error reading SBOM: " + repr(ex))
             sys.exit(ResultCode.RESULT_ERROR_READING_BOM)
 
-        self.display_bom(bom)
+        if self.verbose:
+            self.display_bom(bom)
+        else:
+            self.display_components(components)
 
         if args.force_error and self.has_error:
             sys.exit(ResultCode.RESULT_PREREQUISITE_ERROR)
@@ -0,0 +1,315 @@
+# -------------------------------------------------------------------------------
+# Copyright (c) 2026 Siemens
+# All Rights Reserved.
+# Author: thomas.graf@siemens.com
+#
+# SPDX-License-Identifier: MIT
+# -------------------------------------------------------------------------------
+
+"""
+Local content-addressed store for downloaded source and binary files.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import capycli
+from capycli.common.file_support import get_file_sha1
+
+LOG = capycli.get_logger(__name__)
+
+
+class ArtifactStore:
+    """
+    Store for downloaded files, shared by all commands that download
+    source or binary files. Every file is stored as
+
+        <folder>/objects/<sha1[:2]>/<sha1>/<filename>
+
+    and the URL it has been downloaded from is recorded in
+
+        <folder>/urls/<sha256 of url>.json
+
+    so that a file can be found by its SHA1 hash and by its URL. Data
+    derived from a file, like the parsed content, can be stored next to it
+    in `.<name>.json`. If the store gets larger than `max_size`, the least
+    recently used files are removed.
+
+    Stored files are hard links of the downloaded files if possible. A file
+    that has been changed in place after it was stored is detected by its
+    size and modification time, recorded in `.stat.json`, and removed.
+    """
+    # default maximum size of the store in bytes
+    DEFAULT_MAX_SIZE = 10 * 1024 * 1024 * 1024
+
+    # name of the data with size and modification time of a stored file
+    STAT_INFO = "stat"
+
+    def __init__(self, folder: str, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        self.folder = folder
+        self.max_size = max_size
+        self.objects_folder = os.path.join(folder, "objects")
+        self.urls_folder = os.path.join(folder, "urls")
+        self.lock = threading.Lock()
+        self.total_size: Optional[int] = None
+
+    def get_object_folder(self, sha1: str) -> str:
+        sha1 = sha1.lower()
+        return os.path.join(self.objects_folder, sha1[:2], sha1)
+
+    def get_url_file(self, url: str) -> str:
+        return os.path.join(self.urls_folder, hashlib.sha256(url.encode("utf-8")).hexdigest() + ".json")
+
+    def find_by_sha1(self, sha1: str) -> Optional[str]:
+        """Return the path of the file with the given SHA1 hash or None"""
+        if not sha1 or len(sha1) != 40:
+            return None
+
+        folder = self.get_object_folder(sha1)
+        try:
+            names = [name for name in os.listdir(folder) if not name.startswith(".")]
+        except OSError:
+            return None
+        if not names:
+            return None
+
+        path = os.path.join(folder, names[0])
+        if not self.is_unchanged(path, sha1):
+            LOG.debug("  Removing changed file " + path + " from the artifact store")
+            shutil.rmtree(folder, ignore_errors=True)
+            return None
+
+        # remember the last access for the LRU eviction
+        try:
+            os.utime(folder)
+        except OSError:
+            pass
+        return path
+
+    @staticmethod
+    def get_file_state(path: str) -> List[int]:
+        stat = os.stat(path)
+        return [stat.st_size, stat.st_mtime_ns]
+
+    def is_unchanged(self, path: str, sha1: str) -> bool:
+        """
+        Check whether a stored file still has the given SHA1 hash. The hash
+        is only calculated again if size or modification time have changed.
+        """
+        try:
+            state = self.get_file_state(path)
+            info = self.read_info(sha1, self.STAT_INFO)
+            if info and info.get("state") == state:
+                return True
+            if get_file_sha1(path) != sha1.lower():
+                return False
+        except OSError:
+            return False
+
+        self.write_info(sha1, self.STAT_INFO, {"state": state})
+        return True
+
+    def find_by_url(self, url: str) -> Optional[Tuple[str, str]]:
+        """Return path and SHA1 hash of the file downloaded from the URL or None"""
+        if not url:
+            return None
+
+        try:
+            with open(self.get_url_file(url), encoding="utf-8") as fin:
+                entry = json.load(fin)
+        except FileNotFoundError:
+            return None
+        except Exception as ex:
+            LOG.debug(f"  Ignoring invalid artifact store entry for {url}: {ex!r}")
+            return None
+
+        if entry.get("url") != url:
+            return None
+
+        path = self.find_by_sha1(entry.get("sha1", ""))
+        if not path:
+            return None
+
+        return path, entry["sha1"]
+
+    def add_file(self, path: str, url: str = "", sha1: str = "") -> Optional[str]:
+        """
+        Add a file to the store and record the URL it has been downloaded from.
+        The file is hard linked if possible, otherwise it is copied.
+
+        :return: the path of the file in the store or None on error
+        """
+        try:
+            if not sha1:
+                sha1 = get_file_sha1(path)
+            sha1 = sha1.lower()
+            stored = self.find_by_sha1(sha1)
+            if not stored:
+                stored = self.store_object(path, sha1)
+            if url:
+                self.write_url_entry(url, sha1)
+        except Exception as ex:
+            LOG.debug(f"  Unable to add {path} to the artifact store: {ex!r}")
+            return None
+
+        return stored
+
+    def store_object(self, path: str, sha1: str) -> str:
+        folder = self.get_object_folder(sha1)
+        parent = os.path.dirname(folder)
+        os.makedirs(parent, exist_ok=True)
+
+        # prepare the new object in a temporary folder and rename it, so that
+        # other processes never see incomplete files
+        tmp_folder = tempfile.mkdtemp(dir=parent, prefix="." + sha1)
+        target = os.path.join(tmp_folder, os.path.basename(path))
+        try:
+            try:
+                os.link(path, target)
+            except OSError:
+                shutil.copyfile(path, target)
+            os.replace(tmp_folder, folder)
+        except OSError:
+            shutil.rmtree(tmp_folder, ignore_errors=True)
+            if not os.path.isdir(folder):
+                raise
+            # another process has added the same file in the meantime
+
+        stored = os.path.join(folder, os.path.basename(path))
+        self.add_size(os.path.getsize(path))
+        self.write_info(sha1, self.STAT_INFO, {"state": self.get_file_state(stored)})
+        return stored
+
+    def read_info(self, sha1: str, name: str) -> Optional[Dict[str, Any]]:
+        """Return the data with the given name stored for a file or None"""
+        if not sha1 or len(sha1) != 40:
+            return None
+
+        try:
+            with open(os.path.join(self.get_object_folder(sha1), "." + name + ".json"), encoding="utf-8") as fin:
+                return json.load(fin)
+        except FileNotFoundError:
+            return None
+        except Exception as ex:
+            LOG.debug(f"  Ignoring invalid {name} data for {sha1}: {ex!r}")
+            return None
+
+    def write_info(self, sha1: str, name: str, data: Dict[str, Any]) -> None:
+        """Store data with the given name for a file that is already in the store"""
+        folder = self.get_object_folder(sha1)
+        if not os.path.isdir(folder):
+            return
+
+        info_file = os.path.join(folder, "." + name + ".json")
+        tmp_file = info_file + ".tmp" + str(threading.get_ident())
+        try:
+            with open(tmp_file, "w", encoding="utf-8") as fout:
+                json.dump(data, fout)
+            os.replace(tmp_file, info_file)
+            self.add_size(os.path.getsize(info_file))
+        except Exception as ex:
+            LOG.debug(f"  Unable to write {name} data for {sha1}: {ex!r}")
+
+    @staticmethod
+    def copy_file(stored_path: str, target_folder: str) -> str:
+        """Copy a file from the store to the target folder and return the new path"""
+        target = os.path.join(target_folder, os.path.basename(stored_path))
+        if os.path.exists(target):
+            os.remove(target)
+        try:
+            os.link(stored_path, target)
+        except OSError:
+            shutil.copyfile(stored_path, target)
+        return target
+
+    def write_url_entry(self, url: str, sha1: str) -> None:
+        url_file = self.get_url_file(url)
+        os.makedirs(self.urls_folder, exist_ok=True)
+        tmp_file = url_file + ".tmp" + str(threading.get_ident())
+        with open(tmp_file, "w", encoding="utf-8") as fout:
+            json.dump({"url": url, "sha1": sha1, "timestamp": time.time()}, fout)
+        os.replace(tmp_file, url_file)
+
+    def get_all_objects(self) -> List[Tuple[float, int, str]]:
+        """Return last access time, size and folder of all stored files"""
+        result: List[Tuple[float, int, str]] = []
+        if not os.path.isdir(self.objects_folder):
+            return result
+
+        for prefix in os.scandir(self.objects_folder):
+            if not prefix.is_dir():
+                continue
+            for item in os.scandir(prefix.path):
+                if not item.is_dir() or item.name.startswith("."):
+                    continue
+                try:
+                    size = sum(f.stat().st_size for f in os.scandir(item.path))
+                    result.append((item.stat().st_mtime, size, item.path))
+                except OSError:
+                    pass
+
+        return result
+
+    def add_size(self, size: int) -> None:
+        with self.lock:
+            if self.total_size is None:
+                self.total_size = sum(s for _, s, _ in self.get_all_objects())
+            else:
+                self.total_size += size
+            if self.total_size > self.max_size:
+                self.evict()
+
+    def evict(self) -> None:
+        """Remove the least recently used files until the store uses
+        not more than 90% of the maximum size"""
+        objects = sorted(self.get_all_objects())
+        total_size = sum(size for _, size, _ in objects)
+        limit = self.max_size * 0.9
+        for _, size, folder in objects:
+            if total_size <= limit:
+                break
+            LOG.debug("  Removing " + folder + " from the artifact store")
+            shutil.rmtree(folder, ignore_errors=True)
+            total_size -= size
+
+        self.total_size = total_size
+
+
+_artifact_store: Optional[ArtifactStore] = None
+_artifact_store_config: Tuple[Any, ...] = ()
+_artifact_store_lock = threading.Lock()
+
+
+def get_artifact_store() -> Optional[ArtifactStore]:
+    """
+    Return the artifact store configured by the environment variables
+    CAPYCLI_ARTIFACT_STORE (folder) and CAPYCLI_ARTIFACT_STORE_SIZE
+    (maximum size in MB) or None if no folder has been specified.
+    """
+    global _artifact_store, _artifact_store_config
+
+    folder = os.environ.get("CAPYCLI_ARTIFACT_STORE", "")
+    if not folder:
+        return None
+
+    max_size = ArtifactStore.DEFAULT_MAX_SIZE
+    try:
+        size_mb = float(os.environ.get("CAPYCLI_ARTIFACT_STORE_SIZE", "0"))
+        if size_mb > 0:
+            max_size = int(size_mb * 1024 * 1024)
+    except ValueError:
+        LOG.warning("Ignoring invalid value for CAPYCLI_ARTIFACT_STORE_SIZE")
+
+    config = (folder, max_size)
+    with _artifact_store_lock:
+        if _artifact_store is None or config != _artifact_store_config:
+            _artifact_store = ArtifactStore(folder, max_size)
+            _artifact_store_config = config
+
+    return _artifact_store
@@ -6,11 +6,10 @@
 # SPDX-License-Identifier: MIT
 # -------------------------------------------------------------------------------
 
-import json
 import os
 import pathlib
 from enum import Enum
-from typing import TYPE_CHECKING, Any, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 from cyclonedx.exception import MissingOptionalDependencyException
 from cyclonedx.factory.license import LicenseFactory
@@ -468,6 +467,14 @@ class SbomWriter():
             for component in sbom.components:
                 cls.remove_empty_properties(component)
 
+    @staticmethod
+    def is_compact() -> bool:
+        """
+        Pretty printing large SBOMs takes time. If the environment variable
+        CAPYCLI_SBOM_COMPACT is set, SBOMs are always written without it.
+        """
+        return os.environ.get("CAPYCLI_SBOM_COMPACT", "").lower() in ("1", "true", "yes")
+
     @classmethod
     def write_to_json(cls, sbom: Bom, outputfile: str, pretty_print: bool = False) -> None:
         """Write CaPyCLI/CycloneDX JSON."""
@@ -478,9 +485,9 @@ class SbomWriter():
         writer: 'JsonOutputter' = JsonV1Dot6(sbom)
         cls.remove_empty_properties_in_sbom(sbom)
 
-        if pretty_print:
+        if pretty_print and not cls.is_compact():
             jsondata = writer.output_as_string().encode('utf-8')
-            json_support.write_json_to_file(json.loads(jsondata), outputfile)
+            json_support.write_json_to_file(json_support.loads(jsondata), outputfile)
         else:
             writer.output_to_file(filename=outputfile, allow_overwrite=True)
 
@@ -513,15 +520,51 @@ class CaPyCliBom():
     @classmethod
     def read_sbom(cls, inputfile: str) -> Bom:
         LOG.debug(f"Reading from file {inputfile}")
-        with open(inputfile, encoding="utf-8") as fin:
+        json_data = cls.read_sbom_data(inputfile)
+        bom = Bom.from_json(  # type: ignore[attr-defined]
+            json_data)
+        return bom
+
+    @classmethod
+    def read_sbom_data(cls, inputfile: str) -> Any:
+        """Read the raw JSON data of a SBOM file."""
+        with open(inputfile, "rb") as fin:
             try:
-                json_data = json.load(fin)
+                return json_support.loads(fin.read())
             except Exception as exp:
                 raise CaPyCliException("Error reading raw JSON file: " + str(exp))
 
-            bom = Bom.from_json(  # type: ignore[attr-defined]
-                json_data)
-            return bom
+    @staticmethod
+    def get_component_sort_key(component: Dict[str, Any]) -> Tuple[Tuple[bool, str], ...]:
+        """
+        Return a key to sort JSON components in the same order as the
+        components of a Bom: by type, group, name, version and bom-ref,
+        missing values last.
+        """
+        values = (component.get("type", ComponentType.LIBRARY.value), component.get("group"),
+                  component.get("name"), component.get("version"), component.get("bom-ref"))
+        return tuple((value is None, str(value or "")) for value in values)
+
+    @classmethod
+    def read_sbom_components(cls, inputfile: str) -> List[Dict[str, Any]]:
+        """
+        Read only the components of a SBOM file as JSON objects, without
+        creating the CycloneDX object model. This is much faster for large
+        SBOMs, if only a few fields of the components are needed. The
+        components are sorted like the components of read_sbom().
+        """
+        LOG.debug(f"Reading components from file {inputfile}")
+        json_data = cls.read_sbom_data(inputfile)
+        if not isinstance(json_data, dict) or not isinstance(json_data.get("components", []), list):
+            raise CaPyCliException("Not a CycloneDX JSON file: " + inputfile)
+
+        components: List[Dict[str, Any]] = []
+        for component in sorted(json_data.get("components", []), key=cls.get_component_sort_key):
+            # like a sorted set, equal components are kept only once
+            if not components or components[-1] != component:
+                components.append(component)
+
+        return components
 
     @classmethod
     def read_sbom_xml(cls, inputfile: str) -> Bom:
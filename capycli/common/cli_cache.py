@@ -0,0 +1,79 @@
+# -------------------------------------------------------------------------------
+# Copyright (c) 2026 Siemens
+# All Rights Reserved.
+# Author: thomas.graf@siemens.com
+#
+# SPDX-License-Identifier: MIT
+# -------------------------------------------------------------------------------
+
+"""
+Cache for CLI files (component license information) and their parsed data.
+"""
+
+from typing import Any, Dict, Optional
+
+from cli_support import CliFile
+
+import capycli
+from capycli.common.artifact_store import ArtifactStore, get_artifact_store
+from capycli.common.file_support import get_file_sha1
+
+LOG = capycli.get_logger(__name__)
+
+
+def read_cli_data(filename: str) -> Dict[str, Any]:
+    """
+    Read the licenses and copyrights of a CLI file.
+    This is a module level function, so that it can run in another process.
+    """
+    clifile = CliFile()
+    clifile.read_from_file(filename)
+    return {
+        "licenses": [{"name": lic.name, "spdx_identifier": lic.spdx_identifier} for lic in clifile.licenses],
+        "copyrights": [copyright.text for copyright in clifile.copyrights]
+    }
+
+
+class CliCache:
+    """
+    CLI files never change once they are attached to a release. They are
+    kept in the artifact store (see CAPYCLI_ARTIFACT_STORE), keyed by their
+    SHA1 hash, together with the licenses and copyrights read from them.
+    Without an artifact store, nothing is cached.
+    """
+    # name of the parsed data in the artifact store
+    DATA_NAME = "cli"
+
+    def __init__(self, store: Optional[ArtifactStore] = None) -> None:
+        self.store = store or get_artifact_store()
+
+    def find_file(self, sha1: str) -> Optional[str]:
+        """Return the path of the cached CLI file with the given SHA1 hash or None"""
+        if not self.store:
+            return None
+        return self.store.find_by_sha1(sha1)
+
+    def add_file(self, filename: str) -> str:
+        """Add a downloaded CLI file to the cache and return its SHA1 hash"""
+        if not self.store:
+            return ""
+
+        try:
+            sha1 = get_file_sha1(filename)
+        except OSError as ex:
+            LOG.debug(f"  Unable to cache CLI file {filename}: {ex!r}")
+            return ""
+
+        self.store.add_file(filename, sha1=sha1)
+        return sha1
+
+    def get_data(self, sha1: str) -> Optional[Dict[str, Any]]:
+        """Return the cached data of the CLI file with the given SHA1 hash or None"""
+        if not self.store or not sha1:
+            return None
+        return self.store.read_info(sha1, self.DATA_NAME)
+
+    def set_data(self, sha1: str, data: Dict[str, Any]) -> None:
+        """Cache the data of the CLI file with the given SHA1 hash"""
+        if self.store and sha1:
+            self.store.write_info(sha1, self.DATA_NAME, data)
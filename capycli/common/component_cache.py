@@ -8,12 +8,14 @@
 
 import json
 import os
+import sqlite3
 import sys
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import sw360
 
 from capycli import get_logger
+from capycli.common.parallel_support import imap_ordered
 from capycli.common.print import print_red, print_text, print_yellow
 from capycli.common.script_support import ScriptSupport
 from capycli.main.result_codes import ResultCode
@@ -27,19 +29,36 @@ class ComponentCacheManagement():
     CACHE_FILENAME = "ComponentCache.json"
     CACHE_ALL_RELEASES = "AllReleases.json"
 
+    # cache files with one of these extensions are SQLite databases
+    CACHE_DB_EXTENSIONS = (".db", ".sqlite")
+
+    # maximum number of new or changed releases for an incremental refresh,
+    # above this limit reading all release details at once is faster
+    MAX_DELTA_RELEASES = 2000
+
+    # number of releases per page when reading all release details in parallel
+    PAGE_SIZE = 500
+
+    # release properties needed by bom map, stored as separate columns in the
+    # SQLite cache, so that they can get read without the full release data
+    MATCH_FIELDS = [
+        "Id", "Sw360Id", "Name", "Version", "ComponentId", "ExternalIds",
+        "SourceFile", "SourceFileHash", "BinaryFile", "BinaryFileHash", "RepositoryId"]
+
     def __init__(self, token: Optional[str] = None, oauth2: bool = False, url: Optional[str] = None) -> None:
         if token:
             self.token: str = token
         self.oauth2: bool = oauth2
         self.releases: List[Dict[str, Any]] = []
-        self.old_releases = None
+        self.old_releases: Optional[List[Dict[str, Any]]] = None
 
         if url:
             self.sw360_url: str = url
 
     @classmethod
-    def read_component_cache(cls, cachefile: str) -> List[Dict[str, Any]]:
-        """Read the cached list of SW360 releases"""
+    def read_component_cache(cls, cachefile: str, fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Read the cached list of SW360 releases. `fields` restricts the
+        release properties read from a SQLite cache file."""
 
         """
         Cache data:
@@ -64,6 +83,18 @@ class ComponentCacheManagement():
           },
         """
 
+        if cls.is_db_cache(cachefile):
+            json_cachefile = os.path.splitext(cachefile)[0] + ".json"
+            if not os.path.isfile(cachefile) and os.path.isfile(json_cachefile):
+                print_text("  Converting component cache file '" + json_cachefile + "'...")
+                cls.convert_json_cache(json_cachefile, cachefile)
+
+            if not os.path.isfile(cachefile):
+                print_yellow("Component cache file '" + cachefile + "'not found!")
+                return None  # type: ignore
+
+            return cls.read_db_cache(cachefile, fields)
+
         try:
             with open(cachefile) as fin:
                 release_cache = json.load(fin)
@@ -73,6 +104,87 @@ class ComponentCacheManagement():
 
         return release_cache
 
+    @classmethod
+    def is_db_cache(cls, cachefile: str) -> bool:
+        """Returns True if the cache file is a SQLite database"""
+        return os.path.splitext(cachefile)[1].lower() in cls.CACHE_DB_EXTENSIONS
+
+    @classmethod
+    def read_db_cache(cls, cachefile: str, fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Read the releases from a SQLite cache file. If `fields` is given, only
+        these release properties are read, otherwise the full release data.
+        """
+        releases: List[Dict[str, Any]] = []
+        with sqlite3.connect("file:" + cachefile + "?mode=ro", uri=True) as con:
+            con.execute("PRAGMA mmap_size = 1073741824")
+            if fields is None:
+                for (data,) in con.execute("SELECT Data FROM releases ORDER BY Pos"):
+                    releases.append(json.loads(data))
+                return releases
+
+            columns = [field for field in cls.MATCH_FIELDS if field in fields]
+            if not columns:
+                return releases
+            sql = "SELECT " + ", ".join(columns) + " FROM releases ORDER BY Pos"
+            for row in con.execute(sql):
+                release: Dict[str, Any] = {}
+                for column, value in zip(columns, row):
+                    if value is None:
+                        continue
+                    if column == "ExternalIds":
+                        value = json.loads(value)
+                    release[column] = value
+                releases.append(release)
+
+        return releases
+
+    @classmethod
+    def write_component_cache(cls, cachefile: str, releases: List[Dict[str, Any]]) -> None:
+        """Write the list of releases to the cache file, format depends on the file extension"""
+        if not cls.is_db_cache(cachefile):
+            with open(cachefile, "w") as fout:
+                json.dump(releases, fout, indent=4)
+            return
+
+        tmpfile = cachefile + ".tmp"
+        if os.path.isfile(tmpfile):
+            os.remove(tmpfile)
+
+        con = sqlite3.connect(tmpfile)
+        try:
+            con.execute(
+                "CREATE TABLE releases (Pos INTEGER PRIMARY KEY, " +
+                ", ".join(field + " TEXT" for field in cls.MATCH_FIELDS) + ", Data TEXT)")
+            sql = ("INSERT INTO releases VALUES (?, " +
+                   ", ".join("?" for _ in cls.MATCH_FIELDS) + ", ?)")
+            rows = []
+            for pos, release in enumerate(releases):
+                row: List[Any] = [pos]
+                for field in cls.MATCH_FIELDS:
+                    value = release.get(field)
+                    if field == "ExternalIds" and value is not None:
+                        value = json.dumps(value)
+                    row.append(value)
+                row.append(json.dumps(release))
+                rows.append(row)
+            con.executemany(sql, rows)
+            con.commit()
+        finally:
+            con.close()
+
+        os.replace(tmpfile, cachefile)
+
+    @classmethod
+    def convert_json_cache(cls, json_cachefile: str, cachefile: str) -> int:
+        """Convert an existing JSON cache file to the format given by the
+        extension of `cachefile`. Returns the number of releases."""
+        with open(json_cachefile) as fin:
+            releases = json.load(fin)
+
+        cls.write_component_cache(cachefile, releases)
+        return len(releases)
+
     @classmethod
     def get_attachment(cls, release: Dict[str, Any], att_type: str) -> Optional[Dict[str, Any]]:
         """Return the first attachment that matches the specified type"""
@@ -109,14 +221,20 @@ class ComponentCacheManagement():
 
     def read_existing_component_cache(self, cachefile: str) -> int:
         """Read the (already existing) cache file"""
-        try:
-            with open(cachefile) as fin:
-                self.old_releases = json.load(fin)
-        except FileNotFoundError:
-            self.old_releases = None
+        if self.is_db_cache(cachefile):
+            if os.path.isfile(cachefile):
+                self.old_releases = self.read_db_cache(cachefile)
+            else:
+                self.old_releases = None
+        else:
+            try:
+                with open(cachefile) as fin:
+                    self.old_releases = json.load(fin)
+            except FileNotFoundError:
+                self.old_releases = None
 
         if self.old_releases:
-            return len(self.old_releases)  # type: ignore  # code is used!
+            return len(self.old_releases)
         else:
             return 0
 
@@ -216,34 +334,135 @@ class ComponentCacheManagement():
 
             return {}
 
+    def get_release_delta(self, client: sw360.SW360, workers: int = 1) -> Optional[List[Dict[str, Any]]]:
+        """
+        Update the existing cache data: releases that are new or have a
+        different name or version get read from SW360, releases that do
+        no longer exist on SW360 are removed.
+        Returns None if a full refresh is needed.
+        """
+        print_text(" Retrieving list of all releases...")
+        try:
+            all_releases = client.get_all_releases()
+        except Exception as ex:
+            print_yellow("  Error retrieving list of all releases, doing a full refresh: " + repr(ex))
+            return None
+
+        if not all_releases:
+            return None
+
+        old_by_id: Dict[str, Dict[str, Any]] = {}
+        for release in self.old_releases or []:
+            release_id = release.get("Id") or release.get("Sw360Id")
+            if release_id:
+                old_by_id[release_id] = release
+
+        # keep the order of the release list, i.e. the order of a full refresh
+        entries: List[Tuple[str, Optional[Dict[str, Any]]]] = []
+        new_hrefs: List[str] = []
+        for entry in all_releases:
+            href = entry["_links"]["self"]["href"]
+            old = old_by_id.pop(client.get_id_from_href(href), None)
+            if (old
+                    and old.get("Name", "") == entry.get("name", "")
+                    and old.get("Version", "") == entry.get("version", "")):
+                entries.append((href, old))
+            else:
+                entries.append((href, None))
+                new_hrefs.append(href)
+
+        if len(new_hrefs) > self.MAX_DELTA_RELEASES:
+            print_text(" " + str(len(new_hrefs)) + " new or changed releases, doing a full refresh...")
+            return None
+
+        print_text(
+            " " + str(len(new_hrefs)) + " new or changed releases, " +
+            str(len(old_by_id)) + " deleted releases.")
+
+        def read_release(entry: Tuple[str, Optional[Dict[str, Any]]]) -> Dict[str, Any]:
+            href, old = entry
+            if old:
+                return old
+
+            return self.convert_release_details(client, client.get_release_by_url(href) or {})
+
+        result: List[Dict[str, Any]] = []
+        for internal in imap_ordered(read_release, entries, workers):
+            if internal:
+                result.append(internal)
+
+        return result
+
+    def read_all_release_details(self, client: sw360.SW360, workers: int) -> List[Dict[str, Any]]:
+        """
+        Read the details of all releases page by page, using up
+        to `workers` parallel requests. Each page is converted as
+        soon as it has been received.
+        """
+        print(" Retrieving information on all release details (" + str(workers) + " parallel requests)...")
+        first_page = client.get_all_releases(all_details=True, page=0, page_size=self.PAGE_SIZE)
+        if not first_page:
+            return []
+
+        total_pages = first_page.get("page", {}).get("totalPages", 1)
+        pages: Dict[int, Any] = {0: first_page}
+
+        def read_page(page: int) -> List[Dict[str, Any]]:
+            resp = pages.pop(page, None)
+            if resp is None:
+                resp = client.get_all_releases(all_details=True, page=page, page_size=self.PAGE_SIZE)
+
+            converted = []
+            for newdata in (resp or {}).get("_embedded", {}).get("sw360:releases", []):
+                internal = self.convert_release_details(client, newdata)
+                if internal:
+                    converted.append(internal)
+            return converted
+
+        releases: List[Dict[str, Any]] = []
+        for page_releases in imap_ordered(read_page, range(total_pages), workers):
+            releases.extend(page_releases)
+
+        return releases
+
     def refresh_component_cache(
             self, cachefile: str, fast: bool, token: Optional[str] = None,
-            oauth2: bool = False, url: Optional[str] = None) -> List[Dict[str, Any]]:
+            oauth2: bool = False, url: Optional[str] = None, workers: int = 1) -> List[Dict[str, Any]]:
         """
-        Read all releases from SW360. May take 90 minutes!
-        The new multi-threaded approach takes about one hour for 25.000
-        releases.
+        Read all releases from SW360.
+        If `fast` is set and existing cache data has been read before (see
+        `read_existing_component_cache()`), only the new or changed releases
+        are read from SW360.
+        With `workers` > 1, the release details are read using parallel requests.
         """
         client = self.get_rest_client(token, oauth2, url)
 
-        print(" Retrieving information on all release details (approx. 2 minutes)...")
-        allnew = client.get_all_releases(all_details=True)
+        delta = None
+        if fast and self.old_releases:
+            delta = self.get_release_delta(client, workers)
+
+        if delta is not None:
+            self.releases = delta
+        elif workers > 1:
+            self.releases = self.read_all_release_details(client, workers)
+        else:
+            print(" Retrieving information on all release details (approx. 2 minutes)...")
+            allnew = client.get_all_releases(all_details=True)
 
-        # reset global list
-        self.releases = []
+            # reset global list
+            self.releases = []
 
-        if not allnew:
-            return []
+            if not allnew:
+                return []
 
-        for newdata in allnew:
-            internal = self.convert_release_details(client, newdata)
-            if internal:
-                self.releases.append(internal)
+            for newdata in allnew:
+                internal = self.convert_release_details(client, newdata)
+                if internal:
+                    self.releases.append(internal)
 
         print_text(" Got all " + str(len(self.releases)) + " releases.")
 
-        with open(cachefile, "w") as fout:
-            json.dump(self.releases, fout, indent=4)
+        self.write_component_cache(cachefile, self.releases)
 
         print_text(ScriptSupport.get_time() + " end.")
 
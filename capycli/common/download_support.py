@@ -0,0 +1,216 @@
+# -------------------------------------------------------------------------------
+# Copyright (c) 2026 Siemens
+# All Rights Reserved.
+# Author: thomas.graf@siemens.com
+#
+# SPDX-License-Identifier: MIT
+# -------------------------------------------------------------------------------
+
+"""
+Support to download many files in parallel.
+"""
+
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import capycli
+from capycli.common.file_support import get_file_sha1
+from capycli.common.parallel_support import ResponseMemo
+from capycli.common.print import print_red, print_text, print_yellow
+
+LOG = capycli.get_logger(__name__)
+
+# maximum number of parallel downloads from a single host
+MAX_DOWNLOADS_PER_HOST = 4
+
+# messages of a download: print function and text
+Messages = List[Tuple[Callable[..., None], str]]
+
+
+def report(messages: Optional[Messages], printer: Callable[..., None], text: str) -> None:
+    """Print the text or add it to the messages, if given"""
+    if messages is None:
+        printer(text)
+    else:
+        messages.append((printer, text))
+
+
+@dataclass
+class DownloadTask:
+    """A single file to download"""
+    url: str
+    is_binary: bool = False
+    filename_hint: str = ""
+
+    # result: full path and SHA1 hash of the file
+    path: str = ""
+    sha1: str = ""
+
+    # the file was already available from an earlier run
+    skipped: bool = False
+
+    # output of the download, printed in the order of the tasks
+    messages: Messages = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return bool(self.path)
+
+    def print_messages(self) -> None:
+        for printer, text in self.messages:
+            printer(text)
+
+
+class DownloadScheduler:
+    """
+    Run downloads with a bounded number of parallel workers and a limit
+    for the number of parallel downloads from a single host.
+
+    If `use_checkpoint` is set, successful downloads are recorded in a
+    checkpoint file in the target folder, one JSON object per line. When the
+    downloads get started again, files that are still present and have the
+    recorded SHA1 hash are not downloaded again.
+
+    Every URL is downloaded only once, tasks with the same URL get the
+    result of the first download.
+    """
+    CHECKPOINT_FILE = ".capycli_downloads.jsonl"
+
+    def __init__(self, folder: str, max_per_host: int = MAX_DOWNLOADS_PER_HOST,
+                 use_checkpoint: bool = True) -> None:
+        self.folder = folder
+        self.max_per_host = max_per_host
+        self.checkpoint_file = os.path.join(folder, self.CHECKPOINT_FILE) if use_checkpoint else ""
+        self.lock = threading.Lock()
+        self.host_limits: Dict[str, threading.Semaphore] = {}
+        self.checkpoint: Dict[str, Dict[str, str]] = self.read_checkpoint()
+        self.downloads = ResponseMemo()
+        self.downloaded = 0
+        self.failed: List[str] = []
+        self.skipped = 0
+
+    def read_checkpoint(self) -> Dict[str, Dict[str, str]]:
+        """Read the downloads of earlier runs, later entries win"""
+        checkpoint: Dict[str, Dict[str, str]] = {}
+        if not self.checkpoint_file:
+            return checkpoint
+
+        try:
+            with open(self.checkpoint_file, encoding="utf-8") as fin:
+                for line in fin:
+                    try:
+                        entry = json.loads(line)
+                        checkpoint[entry["url"]] = entry
+                    except (ValueError, KeyError, TypeError):
+                        # incomplete line of an interrupted run
+                        continue
+        except FileNotFoundError:
+            pass
+        except Exception as ex:
+            print_yellow("  Ignoring invalid download checkpoint file: " + repr(ex))
+
+        return checkpoint
+
+    def add_to_checkpoint(self, entry: Dict[str, str]) -> None:
+        """Record a download, must be called with self.lock held"""
+        self.checkpoint[entry["url"]] = entry
+        if not self.checkpoint_file:
+            return
+
+        try:
+            with open(self.checkpoint_file, "a", encoding="utf-8") as fout:
+                fout.write(json.dumps(entry) + "\n")
+        except Exception as ex:
+            LOG.debug("Unable to write download checkpoint: " + repr(ex))
+
+    def get_host_limit(self, url: str) -> threading.Semaphore:
+        host = urlsplit(url).netloc.lower()
+        with self.lock:
+            limit = self.host_limits.get(host)
+            if limit is None:
+                limit = threading.Semaphore(self.max_per_host)
+                self.host_limits[host] = limit
+        return limit
+
+    def find_previous_download(self, task: DownloadTask) -> bool:
+        """Check whether the file has been downloaded by an earlier run"""
+        with self.lock:
+            entry = self.checkpoint.get(task.url)
+        if not entry:
+            return False
+
+        path = os.path.join(self.folder, entry.get("path", ""))
+        try:
+            if not os.path.isfile(path) or get_file_sha1(path) != entry.get("sha1"):
+                return False
+        except OSError:
+            return False
+
+        task.path = path
+        task.sha1 = entry["sha1"]
+        task.skipped = True
+        return True
+
+    def execute(self, task: DownloadTask,
+                download: Callable[[DownloadTask], Optional[Tuple[str, str]]]) -> DownloadTask:
+        """
+        Download a single file, unless it is already available.
+        `download` gets called with the task and returns the path and the
+        SHA1 hash of the file. It must add its output to `task.messages`.
+        """
+        if self.find_previous_download(task):
+            report(task.messages, print_text, "    Using previously downloaded file " + task.path)
+            with self.lock:
+                self.skipped += 1
+            return task
+
+        owner = False
+
+        def run() -> Optional[Tuple[str, str]]:
+            nonlocal owner
+            owner = True
+            with self.get_host_limit(task.url):
+                try:
+                    return download(task)
+                except Exception as ex:
+                    report(task.messages, print_red, "    Error downloading file: " + repr(ex))
+                    return None
+
+        result = self.downloads.get(task.url, run)
+        if not owner:
+            # another task has downloaded the same URL
+            if result is None:
+                report(task.messages, print_red, "    Error downloading file, see above")
+                return task
+
+            task.path, task.sha1 = result
+            task.skipped = True
+            report(task.messages, print_text, "    Using file " + task.path + " downloaded for the same URL")
+            with self.lock:
+                self.skipped += 1
+            return task
+
+        with self.lock:
+            if result is None:
+                self.failed.append(task.url)
+                return task
+
+            task.path, task.sha1 = result
+            self.downloaded += 1
+            self.add_to_checkpoint({
+                "url": task.url,
+                "path": os.path.relpath(task.path, self.folder),
+                "sha1": task.sha1
+            })
+
+        return task
+
+    def print_summary(self) -> None:
+        print_text(f"\n{self.downloaded} files downloaded, {self.skipped} files already available, "
+                   f"{len(self.failed)} downloads failed")
+        for url in self.failed:
+            print_yellow("  Failed: " + url)
@@ -10,6 +10,7 @@
 File support methods
 """
 
+import hashlib
 import os
 import shutil
 
@@ -26,3 +27,12 @@ def create_backup(filename: str) -> None:
             Fore.LIGHTRED_EX +
             "Error creating file backup: " + repr(ex) +
             Style.RESET_ALL)
+
+
+def get_file_sha1(filename: str, chunk_size: int = 1024 * 1024) -> str:
+    """Compute the SHA1 hash of a file without reading it completely into memory"""
+    sha1 = hashlib.sha1()
+    with open(filename, "rb") as fin:
+        for chunk in iter(lambda: fin.read(chunk_size), b""):
+            sha1.update(chunk)
+    return sha1.hexdigest()
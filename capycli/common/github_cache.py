@@ -0,0 +1,89 @@
+# -------------------------------------------------------------------------------
+# Copyright (c) 2026 Siemens
+# All Rights Reserved.
+# Author: thomas.graf@siemens.com
+#
+# SPDX-License-Identifier: MIT
+# -------------------------------------------------------------------------------
+
+"""
+Persistent cache for the results of GitHub requests of `bom findsources`.
+"""
+
+import json
+import time
+from typing import Any, Callable, Optional
+
+import requests
+
+import capycli
+from capycli.common import http_support
+from capycli.common.response_cache import CacheEntry, ResponseCache
+
+LOG = capycli.get_logger(__name__)
+
+
+class GitHubCache:
+    """
+    Keeps the responses of the GitHub API (repository meta data, tag pages
+    and matching refs) and the source URL found for a version of a
+    repository in the response cache, see CAPYCLI_HTTP_CACHE.
+
+    Responses are revalidated after the TTL of the response cache. Tags
+    of released versions hardly ever change, so a source URL that has been
+    found is kept for SOURCE_URL_TTL seconds. If no source URL has been
+    found, this is remembered as well, but only for the TTL of the
+    response cache - the tag may get created later.
+    """
+    # time in seconds that a source URL that has been found is used
+    SOURCE_URL_TTL = 30 * 24 * 60 * 60
+
+    # prefix of the cache keys of source URLs
+    SOURCE_URL_KEY = "capycli:github-source-url:"
+
+    def __init__(self, cache: ResponseCache) -> None:
+        self.cache = cache
+
+    def request(self, url: str, fetch: Callable[[str], requests.Response]) -> requests.Response:
+        """Return the cached response for the URL or the response of `fetch(url)`"""
+        return self.cache.get(url, lambda url, **kwargs: fetch(url))
+
+    def get_source_url_key(self, repo: str, version: str, version_prefix: Any = None) -> str:
+        return self.SOURCE_URL_KEY + json.dumps([repo, version, version_prefix])
+
+    def get_source_url(self, repo: str, version: str, version_prefix: Any = None) -> Optional[str]:
+        """
+        Return the cached source URL for the version of the repository,
+        an empty string if no source URL has been found or None if
+        there is no valid cache entry.
+        """
+        entry = self.cache.load(ResponseCache.get_key(self.get_source_url_key(repo, version, version_prefix)))
+        if entry is None:
+            return None
+
+        try:
+            source_url = str(json.loads(entry.content)["source_url"])
+        except Exception as ex:
+            LOG.debug(f"  Ignoring invalid source URL cache entry for {repo} {version}: {ex!r}")
+            return None
+
+        ttl = self.SOURCE_URL_TTL if source_url else self.cache.ttl
+        if not self.cache.offline and (time.time() - entry.timestamp) >= ttl:
+            return None
+
+        return source_url
+
+    def set_source_url(self, repo: str, version: str, version_prefix: Any, source_url: str) -> None:
+        """Remember the source URL (or an empty string) for the version of the repository"""
+        key = self.get_source_url_key(repo, version, version_prefix)
+        content = json.dumps({"source_url": source_url}).encode("utf-8")
+        self.cache.write_entry(ResponseCache.get_key(key), CacheEntry(key, time.time(), content))
+
+
+def get_github_cache() -> Optional[GitHubCache]:
+    """Return the GitHub cache or None if no response cache has been configured"""
+    cache = http_support.get_response_cache()
+    if cache is None:
+        return None
+
+    return GitHubCache(cache)
@@ -10,45 +10,233 @@
 Support methods for accessing GitHub
 """
 
+import dataclasses
+import os
 import re
 import sys
+import threading
 import time
-from typing import Any
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple
 
 import requests
 from colorama import Fore, Style
 
-from capycli.common.print import print_red
+from capycli.common.print import print_red, print_yellow
 from capycli.main.result_codes import ResultCode
 
+# maximum number of parallel requests to GitHub
+MAX_PARALLEL_REQUESTS = 4
+
+# time to wait after GitHub reported that the rate limit has been exceeded
+# without telling when it will be reset
+RATE_LIMIT_WAIT = 60
+
+# never wait longer than this for the reset of the rate limit
+MAX_RATE_LIMIT_WAIT = 3600
+
+# number of retries of a request after the rate limit has been exceeded
+# or after a connection error
+MAX_RATE_LIMIT_RETRIES = 5
+
+# time to wait after the first connection error, doubled for every retry
+CONNECTION_RETRY_WAIT = 2
+
+# number of responses kept to send conditional requests
+MAX_ETAG_ENTRIES = 1000
+
+
+@dataclass
+class TokenState:
+    """Rate limit of a single GitHub token, the empty token means anonymous access"""
+    token: str
+    # remaining requests, -1 if unknown
+    remaining: int = -1
+    # time of the next reset of the rate limit
+    reset: float = 0.0
+
+    def is_exhausted(self, now: float) -> bool:
+        return self.remaining == 0 and self.reset > now
+
+
+@dataclass
+class GitHubCounters:
+    """Statistics about the requests sent to GitHub"""
+    requests: int = 0
+    not_modified: int = 0
+    rate_limited: int = 0
+    wait_seconds: float = 0.0
+
 
 class GitHubSupport:
     """Support methods for accessing GitHub"""
+    # the request budget is shared by all threads: at most
+    # MAX_PARALLEL_REQUESTS requests at the same time, the remaining
+    # requests of every token are tracked using the X-RateLimit-* headers
+    request_slots = threading.BoundedSemaphore(MAX_PARALLEL_REQUESTS)
+    state_lock = threading.Lock()
+    token_states: Dict[str, TokenState] = {}
+    etag_responses: "OrderedDict[Tuple[str, bool], requests.Response]" = OrderedDict()
+    counters = GitHubCounters()
+
     def __init__(self) -> None:
         self.github_project_name_regex = re.compile(r"^[a-zA-Z0-9-]+(/[a-zA-Z0-9-]+)*$")
 
+    @staticmethod
+    def get_counters() -> GitHubCounters:
+        """Return a copy of the request statistics"""
+        with GitHubSupport.state_lock:
+            return dataclasses.replace(GitHubSupport.counters)
+
+    @staticmethod
+    def reset() -> None:
+        """Forget all rate limits, stored responses and statistics"""
+        with GitHubSupport.state_lock:
+            GitHubSupport.token_states.clear()
+            GitHubSupport.etag_responses.clear()
+            GitHubSupport.counters = GitHubCounters()
+
+    @staticmethod
+    def get_token_pool(token: str) -> List[str]:
+        """
+        Return the given token and all tokens specified in the environment
+        variable CAPYCLI_GITHUB_TOKENS (comma separated). An empty string
+        means anonymous access.
+        """
+        tokens = [token] if token else []
+        for item in os.environ.get("CAPYCLI_GITHUB_TOKENS", "").split(","):
+            item = item.strip()
+            if item and item not in tokens:
+                tokens.append(item)
+
+        return tokens or [""]
+
+    @staticmethod
+    def select_token(token: str) -> TokenState:
+        """
+        Return the token with the most remaining requests, tokens whose rate
+        limit is not known yet come first. If the rate limit of all tokens
+        has been exceeded, wait until the first one gets reset.
+        """
+        with GitHubSupport.state_lock:
+            states = [GitHubSupport.token_states.setdefault(item, TokenState(item))
+                      for item in GitHubSupport.get_token_pool(token)]
+            now = time.time()
+            available = [state for state in states if not state.is_exhausted(now)]
+            if available:
+                return max(available, key=lambda state: state.remaining if state.remaining >= 0 else sys.maxsize)
+
+            selected = min(states, key=lambda state: state.reset)
+            delay = min(selected.reset - now, MAX_RATE_LIMIT_WAIT)
+            GitHubSupport.counters.wait_seconds += delay
+
+        print_yellow(f"      GitHub API rate limit exceeded - wait {delay:.0f}s until it gets reset ...")
+        time.sleep(delay)
+        with GitHubSupport.state_lock:
+            selected.remaining = -1
+        return selected
+
+    @staticmethod
+    def update_rate_limit(state: TokenState, response: requests.Response) -> None:
+        """Remember the rate limit reported by GitHub"""
+        remaining = response.headers.get("X-RateLimit-Remaining", "")
+        reset = response.headers.get("X-RateLimit-Reset", "")
+        with GitHubSupport.state_lock:
+            try:
+                if remaining:
+                    state.remaining = int(remaining)
+                if reset:
+                    state.reset = float(reset)
+            except ValueError:
+                pass
+
+    @staticmethod
+    def is_rate_limited(response: requests.Response) -> bool:
+        """Check whether GitHub rejected the request because of the rate limit"""
+        if response.status_code == 429 or 'rate limit exceeded' in response.reason:
+            return True
+        if response.status_code == 403 and response.headers.get("X-RateLimit-Remaining", "") == "0":
+            return True
+        return 'API rate limit exceeded' in response.json().get('message', '')
+
+    @staticmethod
+    def set_rate_limited(state: TokenState, response: requests.Response) -> None:
+        """Mark the token as exhausted until its rate limit gets reset"""
+        now = time.time()
+        retry_after = response.headers.get("Retry-After", "").strip()
+        with GitHubSupport.state_lock:
+            GitHubSupport.counters.rate_limited += 1
+            if retry_after.isdigit():
+                state.reset = now + int(retry_after)
+            elif state.remaining != 0 or state.reset <= now:
+                # secondary rate limit or no information about the reset
+                state.reset = now + RATE_LIMIT_WAIT
+            state.remaining = 0
+
+    @staticmethod
+    def send_request(url: str, username: str, state: TokenState,
+                     allow_redirects: bool) -> requests.Response:
+        """
+        Send a single request. If GitHub has sent an ETag for the URL before,
+        a conditional request is sent and the stored response is returned if
+        nothing has changed - such requests do not count for the rate limit.
+        """
+        headers = {}
+        if state.token:
+            headers["Authorization"] = "token " + state.token
+        if username:
+            headers["Username"] = username
+
+        key = (url, allow_redirects)
+        with GitHubSupport.state_lock:
+            stored = GitHubSupport.etag_responses.get(key)
+            if stored is not None:
+                GitHubSupport.etag_responses.move_to_end(key)
+                headers["If-None-Match"] = stored.headers["ETag"]
+
+        with GitHubSupport.request_slots:
+            response = requests.get(url, headers=headers,
+                                    allow_redirects=allow_redirects)
+
+        GitHubSupport.update_rate_limit(state, response)
+        with GitHubSupport.state_lock:
+            GitHubSupport.counters.requests += 1
+            if response.status_code == 304 and stored is not None:
+                GitHubSupport.counters.not_modified += 1
+                return stored
+
+            if response.status_code == 200 and response.headers.get("ETag"):
+                GitHubSupport.etag_responses[key] = response
+                GitHubSupport.etag_responses.move_to_end(key)
+                while len(GitHubSupport.etag_responses) > MAX_ETAG_ENTRIES:
+                    GitHubSupport.etag_responses.popitem(last=False)
+
+        return response
+
     @staticmethod
     def github_request(url: str, username: str = "", token: str = "",
                        return_response: bool = False,
                        allow_redirects: bool = True,  # default in requests
                        ) -> Any:
         try:
-            headers = {}
-            if token:
-                headers["Authorization"] = "token " + token
-            if username:
-                headers["Username"] = username
-            response = requests.get(url, headers=headers,
-                                    allow_redirects=allow_redirects)
-            if response.status_code == 429 \
-                    or 'rate limit exceeded' in response.reason \
-                    or 'API rate limit exceeded' in response.json().get('message', ''):
-                print(
-                    Fore.LIGHTYELLOW_EX +
-                    "      Github API rate limit exceeded - wait 60s and retry ... " +
-                    Style.RESET_ALL)
-                time.sleep(60)
-                return GitHubSupport.github_request(url, username, token, return_response=return_response)
+            for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+                state = GitHubSupport.select_token(token)
+                try:
+                    response = GitHubSupport.send_request(url, username, state, allow_redirects)
+                except requests.exceptions.ConnectionError as ex:
+                    if attempt == MAX_RATE_LIMIT_RETRIES:
+                        raise
+                    delay = CONNECTION_RETRY_WAIT * 2 ** attempt
+                    print_yellow(
+                        f"      Connection issues accessing {url} " + repr(ex) +
+                        f"\n      Retrying in {delay} seconds!")
+                    time.sleep(delay)
+                    continue
+                if attempt == MAX_RATE_LIMIT_RETRIES or not GitHubSupport.is_rate_limited(response):
+                    break
+                GitHubSupport.set_rate_limited(state, response)
+
             if response.json().get('message', '').startswith("Bad credentials"):
                 print_red("Invalid GitHub credential provided - aborting!")
                 sys.exit(ResultCode.RESULT_ERROR_ACCESSING_SERVICE)
@@ -65,15 +253,6 @@ class GitHubSupport:
         except requests.exceptions.JSONDecodeError:
             response._content = b'{}'
 
-        except requests.exceptions.ConnectionError as ex:
-            print(
-                Fore.LIGHTYELLOW_EX +
-                f"      Connection issues accessing {url} " + repr(ex) +
-                "\n      Retrying in 60 seconds!" +
-                Style.RESET_ALL)
-            time.sleep(60)
-            return GitHubSupport.github_request(url, username, token, return_response=return_response)
-
         except Exception as ex:
             print(
                 Fore.LIGHTYELLOW_EX +
@@ -87,9 +266,13 @@ class GitHubSupport:
     @staticmethod
     def get_repositories(name: str, language: str, username: str = "", token: str = "") -> Any:
         """Query for GitHub repositories"""
+        return GitHubSupport.github_request(GitHubSupport.get_search_url(name, language), username, token)
+
+    @staticmethod
+    def get_search_url(name: str, language: str) -> str:
+        """Return the URL to query for GitHub repositories"""
         query = name + " language:" + language.lower()
-        search_url = "https://api.github.com/search/repositories?q=" + query
-        return GitHubSupport.github_request(search_url, username, token)
+        return "https://api.github.com/search/repositories?q=" + query
 
     @staticmethod
     def get_repo_name(github_url: str) -> str:
@@ -0,0 +1,338 @@
+# -------------------------------------------------------------------------------
+# Copyright (c) 2026 Siemens
+# All Rights Reserved.
+# Author: thomas.graf@siemens.com
+#
+# SPDX-License-Identifier: MIT
+# -------------------------------------------------------------------------------
+
+"""
+Common HTTP layer for all requests to external services like package
+registries: keep-alive sessions per host, timeouts and retries with
+exponential backoff, an optional on-disk cache for responses and
+streamed, resumable downloads.
+"""
+
+import email.utils
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import MaxRetryError, ProtocolError
+
+import capycli
+from capycli.common.parallel_support import KeyedLocks
+from capycli.common.response_cache import ResponseCache
+
+LOG = capycli.get_logger(__name__)
+
+# timeout in seconds for connecting and reading, can be overridden
+# by the environment variable CAPYCLI_HTTP_TIMEOUT
+DEFAULT_TIMEOUT = 60.0
+
+# number of retries after the first attempt, can be overridden
+# by the environment variable CAPYCLI_HTTP_RETRIES
+DEFAULT_RETRIES = 3
+
+# delay before the first retry, doubled for every further retry
+BACKOFF_FACTOR = 1.0
+
+# never wait longer than this number of seconds before a retry
+MAX_BACKOFF = 120.0
+
+# status codes that indicate a temporary problem
+RETRY_STATUS_CODES = (429, 502, 503, 504)
+
+# number of connections kept alive per host
+POOL_SIZE = 16
+
+# size of the chunks when downloading files
+CHUNK_SIZE = 1024 * 1024
+
+# suffix of incomplete downloads
+PART_SUFFIX = ".part"
+
+# suffix of the file next to an incomplete download that stores
+# URL and validator (ETag or Last-Modified) of the download
+PART_INFO_SUFFIX = ".part.json"
+
+_sessions: Dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+_response_cache: Optional[ResponseCache] = None
+_response_cache_config: Tuple[Any, ...] = ()
+
+
+def _get_env_number(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        LOG.warning("Ignoring invalid value for " + name)
+        return default
+
+
+def get_timeout() -> float:
+    """Return the timeout for HTTP requests in seconds"""
+    return _get_env_number("CAPYCLI_HTTP_TIMEOUT", DEFAULT_TIMEOUT)
+
+
+def get_retries() -> int:
+    """Return the number of retries for failed HTTP requests"""
+    return max(0, int(_get_env_number("CAPYCLI_HTTP_RETRIES", DEFAULT_RETRIES)))
+
+
+def get_session(url: str) -> requests.Session:
+    """
+    Return the session for the host of the given URL. Sessions are created
+    on first use and keep their connections alive, so that subsequent
+    requests to the same host do not need a new TCP and TLS handshake.
+    """
+    parts = urlsplit(url)
+    key = (parts.scheme + "://" + parts.netloc).lower()
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_SIZE)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _sessions[key] = session
+
+    return session
+
+
+def close_sessions() -> None:
+    """Close all sessions and their connections"""
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+
+
+def get_retry_delay(response: Optional[requests.Response], attempt: int) -> float:
+    """
+    Return the number of seconds to wait before the next attempt.
+    A `Retry-After` header sent by the server is honored, otherwise
+    the delay grows exponentially with the number of attempts.
+    """
+    delay = BACKOFF_FACTOR * (2 ** attempt)
+    if response is not None:
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after:
+            if retry_after.strip().isdigit():
+                delay = float(retry_after.strip())
+            else:
+                try:
+                    retry_date = email.utils.parsedate_to_datetime(retry_after)
+                    delay = retry_date.timestamp() - time.time()
+                except (TypeError, ValueError):
+                    pass
+
+    return min(max(delay, 0.0), MAX_BACKOFF)
+
+
+def is_temporary_error(ex: Exception) -> bool:
+    """
+    Check whether a request failed because of a temporary problem: a timeout
+    or a dropped connection. Failures to connect at all, like an unknown host
+    or a refused connection, are not considered temporary.
+    """
+    if isinstance(ex, requests.Timeout):
+        return True
+
+    reason = ex.args[0] if ex.args else None
+    if isinstance(reason, MaxRetryError):
+        reason = reason.reason
+    return isinstance(reason, ProtocolError)
+
+
+def request(method: str, url: str, **kwargs: Any) -> requests.Response:
+    """
+    Send a HTTP request using the session of the host.
+    Timeouts, dropped connections and responses with a status code that
+    indicates a temporary problem are retried with exponential backoff.
+    The last response is returned even if it is not ok, the last
+    exception is raised if all attempts failed.
+    """
+    kwargs.setdefault("timeout", get_timeout())
+    retries = get_retries()
+    session = get_session(url)
+    attempt = 0
+    while True:
+        try:
+            response = session.request(method, url, **kwargs)
+        except (requests.ConnectionError, requests.Timeout) as ex:
+            if attempt >= retries or not is_temporary_error(ex):
+                raise
+            delay = get_retry_delay(None, attempt)
+            LOG.debug(f"  {method} {url} failed ({ex!r}), retry in {delay:.1f}s")
+        else:
+            if response.status_code not in RETRY_STATUS_CODES or attempt >= retries:
+                return response
+            delay = get_retry_delay(response, attempt)
+            LOG.debug(f"  {method} {url} returned {response.status_code}, retry in {delay:.1f}s")
+            response.close()
+
+        time.sleep(delay)
+        attempt += 1
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """
+    Return the response cache configured by the environment variables
+    CAPYCLI_HTTP_CACHE (cache folder), CAPYCLI_HTTP_CACHE_SIZE (maximum size
+    in MB), CAPYCLI_HTTP_CACHE_TTL (seconds before a cached response gets
+    revalidated) and CAPYCLI_HTTP_OFFLINE (only use cached responses) or
+    None if no cache folder has been specified.
+    """
+    global _response_cache, _response_cache_config
+
+    folder = os.environ.get("CAPYCLI_HTTP_CACHE", "")
+    if not folder:
+        return None
+
+    config = (
+        folder,
+        int(_get_env_number("CAPYCLI_HTTP_CACHE_SIZE", ResponseCache.DEFAULT_MAX_SIZE / (1024 * 1024))
+            * 1024 * 1024),
+        _get_env_number("CAPYCLI_HTTP_CACHE_TTL", ResponseCache.DEFAULT_TTL),
+        os.environ.get("CAPYCLI_HTTP_OFFLINE", "").lower() in ("1", "true", "yes"))
+    with _sessions_lock:
+        if _response_cache is None or config != _response_cache_config:
+            _response_cache = ResponseCache(*config)
+            _response_cache_config = config
+
+    return _response_cache
+
+
+def get_cached(url: str, **kwargs: Any) -> requests.Response:
+    """
+    Send a GET request for a document that rarely changes, like the meta
+    data of a specific version of a package. If a response cache has been
+    configured, see `get_response_cache()`, the response is taken from the
+    cache as long as it is valid, otherwise see `get()`.
+    """
+    cache = get_response_cache()
+    if cache is None:
+        return get(url, **kwargs)
+
+    return cache.get(url, get, **kwargs)
+
+
+def get(url: str, **kwargs: Any) -> requests.Response:
+    """Send a GET request, see `request()`"""
+    return request("GET", url, **kwargs)
+
+
+def head(url: str, **kwargs: Any) -> requests.Response:
+    """Send a HEAD request, see `request()`"""
+    kwargs.setdefault("allow_redirects", False)
+    return request("HEAD", url, **kwargs)
+
+
+def get_validator(response: requests.Response) -> str:
+    """Return the validator of a response that can be used for If-Range"""
+    return response.headers.get("ETag", "") or response.headers.get("Last-Modified", "")
+
+
+def read_part_info(info_file: str) -> Dict[str, str]:
+    """Return URL and validator of an incomplete download or an empty dict"""
+    try:
+        with open(info_file, encoding="utf-8") as fin:
+            info = json.load(fin)
+        if isinstance(info, dict):
+            return info
+    except FileNotFoundError:
+        pass
+    except Exception as ex:
+        LOG.debug(f"  Ignoring invalid download info {info_file}: {ex!r}")
+    return {}
+
+
+def resume_download(response: requests.Response, offset: int, validator: str) -> Optional[requests.Response]:
+    """
+    Request the data of `response` starting at `offset`. This is only possible
+    if the server supports range requests and the document has not changed
+    since the existing data has been downloaded, i.e. still matches the
+    validator of the first download. Returns the partial response or None.
+    """
+    if response.headers.get("Accept-Ranges", "").lower() != "bytes" or not validator:
+        return None
+
+    headers = {"Range": f"bytes={offset}-", "If-Range": validator}
+    try:
+        range_response = get(response.url, headers=headers, stream=True)
+    except requests.RequestException as ex:
+        LOG.debug(f"  Unable to resume download of {response.url}: {ex!r}")
+        return None
+
+    if (range_response.status_code != 206
+            or not range_response.headers.get("Content-Range", "").startswith(f"bytes {offset}-")):
+        range_response.close()
+        return None
+
+    return range_response
+
+
+# parallel downloads of the same file are serialized
+_file_locks = KeyedLocks()
+
+
+def get_file_lock(path: str) -> threading.RLock:
+    """Return the lock to hold while writing the given file"""
+    return _file_locks.get(os.path.abspath(path))
+
+
+def download_file(response: requests.Response, path: str) -> str:
+    """
+    Write the body of a streamed response (`stream=True`) to the given file
+    and return its SHA1 hash. The data is written in chunks to a temporary
+    file which is renamed when the download is complete, so memory
+    consumption does not depend on the file size. If an earlier download of
+    the same file has been interrupted, only the missing data is requested.
+    Parallel downloads to the same path wait for each other.
+    """
+    with get_file_lock(path):
+        part_file = path + PART_SUFFIX
+        info_file = path + PART_INFO_SUFFIX
+        sha1 = hashlib.sha1()
+        mode = "wb"
+        if os.path.isfile(part_file) and os.path.getsize(part_file) > 0:
+            # only resume the download of the same URL with the validator of the first download
+            range_response = None
+            info = read_part_info(info_file)
+            if info.get("url") == response.url:
+                range_response = resume_download(response, os.path.getsize(part_file), info.get("validator", ""))
+            if range_response is not None:
+                LOG.debug(f"  Resuming download of {path}")
+                response.close()
+                response = range_response
+                mode = "ab"
+                with open(part_file, "rb") as fin:
+                    for chunk in iter(lambda: fin.read(CHUNK_SIZE), b""):
+                        sha1.update(chunk)
+
+        if mode == "wb":
+            with open(info_file, "w", encoding="utf-8") as fout:
+                json.dump({"url": response.url, "validator": get_validator(response)}, fout)
+
+        try:
+            with open(part_file, mode) as fout:
+                for chunk in response.iter_content(CHUNK_SIZE):
+                    fout.write(chunk)
+                    sha1.update(chunk)
+        finally:
+            response.close()
+
+        os.replace(part_file, path)
+        try:
+            os.remove(info_file)
+        except OSError:
+            pass
+        return sha1.hexdigest()
@@ -7,31 +7,86 @@
 # -------------------------------------------------------------------------------
 
 import json
-from typing import Any
+from typing import Any, Iterable, Union
 
 from capycli.main.exceptions import CaPyCliException
 
+try:
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:  # pragma: no cover
+    HAVE_ORJSON = False
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse JSON data. orjson is used if it is installed, data that
+    orjson does not accept (like NaN) is parsed by the json module.
+    """
+    if HAVE_ORJSON:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+
+    return json.loads(data)
+
+
+def dumps_compact(data: Any) -> bytes:
+    """Return the data as compact JSON without any whitespace, encoded as UTF-8"""
+    if HAVE_ORJSON:
+        try:
+            return orjson.dumps(data)
+        except orjson.JSONEncodeError:
+            pass
+
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
 
 def load_json_file(filename: str) -> Any:
     """Load a JSON file"""
     try:
-        with open(filename, encoding="utf-8") as fin:
-            data = json.load(fin)
+        with open(filename, "rb") as fin:
+            data = loads(fin.read())
     except Exception as exp:
         raise CaPyCliException("Invalid JSON file: " + str(exp))
 
     return data
 
 
-def write_json_to_file(data: Any, filename: str) -> None:
-    """Write the data a JSON file"""
+def write_json_to_file(data: Any, filename: str, compact: bool = False) -> None:
+    """Write the data a JSON file, pretty printed or compact"""
     try:
+        if compact:
+            with open(filename, "wb") as fout:
+                fout.write(dumps_compact(data))
+            return
+
         with open(filename, "w", encoding="utf-8") as outfile:
             json.dump(data, outfile, indent=2, separators=(',', ': '))
     except Exception as exp:
         raise CaPyCliException("Error writing JSON file: " + str(exp))
 
 
+def write_json_items_to_file(items: Iterable[Any], filename: str) -> None:
+    """
+    Write the items as JSON list to a file, one item after the other. The file
+    is the same as written by write_json_to_file(list(items), filename), but
+    the items need not be kept in memory.
+    """
+    try:
+        with open(filename, "w", encoding="utf-8") as outfile:
+            separator = "[\n"
+            for item in items:
+                outfile.write(separator)
+                text = json.dumps(item, indent=2, separators=(',', ': '))
+                outfile.write("  " + text.replace("\n", "\n  "))
+                separator = ",\n"
+            outfile.write("[]" if separator == "[\n" else "\n]")
+    except Exception as exp:
+        raise CaPyCliException("Error writing JSON file: " + str(exp))
+
+
 def print_json(data: Any, sort_keys: bool = False) -> None:
     """Dump a JSON object to screen"""
     print(json.dumps(data, indent=2, sort_keys=sort_keys))
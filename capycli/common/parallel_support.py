@@ -0,0 +1,173 @@
+# -------------------------------------------------------------------------------
+# Copyright (c) 2026 Siemens
+# All Rights Reserved.
+# Author: thomas.graf@siemens.com
+#
+# SPDX-License-Identifier: MIT
+# -------------------------------------------------------------------------------
+
+"""
+Support methods to run (network bound) tasks in parallel
+"""
+
+import io
+import sys
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Hashable, Iterable, Iterator, List, Optional, TextIO, Tuple, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# by default everything is done sequentially
+DEFAULT_WORKERS = 1
+
+
+def get_worker_count(args: Any) -> int:
+    """Return the number of parallel workers specified on the command line"""
+    try:
+        workers = int(getattr(args, "workers", None) or DEFAULT_WORKERS)
+    except (TypeError, ValueError):
+        workers = DEFAULT_WORKERS
+
+    return max(1, workers)
+
+
+def imap_ordered(func: Callable[[T], R], items: Iterable[T], workers: int) -> Iterator[R]:
+    """
+    Apply `func` to all items using up to `workers` threads.
+    The results are returned in the order of the items. To limit memory
+    consumption, at most 2 * `workers` items are processed ahead of the
+    consumer of the results.
+    Exceptions raised by `func` are raised again when the result is consumed.
+    """
+    if workers <= 1:
+        for item in items:
+            yield func(item)
+        return
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending: Deque[Future[R]] = deque()
+        for item in items:
+            pending.append(executor.submit(func, item))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+
+        while pending:
+            yield pending.popleft().result()
+
+
+def map_ordered(func: Callable[[T], R], items: Iterable[T], workers: int) -> List[R]:
+    """
+    Apply `func` to all items using up to `workers` threads and
+    return the list of results in the order of the items.
+    """
+    return list(imap_ordered(func, items, workers))
+
+
+class _ThreadOutput(io.TextIOBase):
+    """
+    Replacement for sys.stdout that collects the output of worker
+    threads in a per thread buffer. Output of other threads is written
+    to the original stream.
+    """
+    def __init__(self, target: TextIO) -> None:
+        self.target = target
+        self.local = threading.local()
+
+    def write(self, text: str) -> int:
+        buffer: Optional[io.StringIO] = getattr(self.local, "buffer", None)
+        if buffer is None:
+            return self.target.write(text)
+        return buffer.write(text)
+
+    def flush(self) -> None:
+        if getattr(self.local, "buffer", None) is None:
+            self.target.flush()
+
+
+def imap_ordered_output(func: Callable[[T], R], items: Iterable[T], workers: int) -> Iterator[R]:
+    """
+    Like `imap_ordered`, but everything `func` prints is collected per
+    item and printed when the result is consumed. This way the output is
+    the same as when processing the items sequentially.
+    """
+    if workers <= 1:
+        yield from imap_ordered(func, items, workers)
+        return
+
+    original = sys.stdout
+    output = _ThreadOutput(original)
+
+    def run(item: T) -> Tuple[str, Any, Optional[BaseException]]:
+        output.local.buffer = io.StringIO()
+        try:
+            result = func(item)
+            return output.local.buffer.getvalue(), result, None
+        except BaseException as ex:
+            return output.local.buffer.getvalue(), None, ex
+        finally:
+            output.local.buffer = None
+
+    sys.stdout = output
+    try:
+        for text, result, ex in imap_ordered(run, items, workers):
+            original.write(text)
+            if ex is not None:
+                raise ex
+            yield result
+    finally:
+        sys.stdout = original
+
+
+class KeyedLocks:
+    """
+    One lock per key, for example to serialize all changes of a single
+    SW360 component while different components are processed in parallel.
+    """
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._locks: Dict[Hashable, threading.RLock] = {}
+
+    def get(self, key: Hashable) -> threading.RLock:
+        """Return the lock for `key`"""
+        with self._lock:
+            lock = self._locks.get(key)
+            if lock is None:
+                lock = threading.RLock()
+                self._locks[key] = lock
+            return lock
+
+
+class ResponseMemo:
+    """
+    Thread-safe memo for (server) responses: the value for a key is
+    computed only once, even if several threads request it at the
+    same time - they all wait for the first computation.
+    """
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._futures: Dict[Hashable, Future[Any]] = {}
+
+    def get(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """Return the value for `key`, call `func` to compute it if needed"""
+        with self._lock:
+            future = self._futures.get(key)
+            owner = future is None
+            if future is None:
+                future = Future()
+                self._futures[key] = future
+
+        if owner:
+            try:
+                future.set_result(func())
+            except Exception as ex:
+                future.set_exception(ex)
+
+        return future.result()
+
+    def clear(self) -> None:
+        """Remove all values"""
+        with self._lock:
+            self._futures.clear()
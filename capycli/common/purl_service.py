@@ -6,7 +6,10 @@
 # SPDX-License-Identifier: MIT
 # -------------------------------------------------------------------------------
 
-from typing import Any, Dict, List, Optional
+import json
+import os
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import packageurl
 from sw360 import SW360
@@ -17,9 +20,104 @@ from capycli.common.purl_utils import PurlUtils
 
 
 class PurlService:
-    def __init__(self, client: SW360, cache: Optional[Dict] = None) -> None:  # type: ignore
+    CACHE_FILENAME = "PurlCache.json"
+
+    # version of the purl cache file format
+    CACHE_VERSION = 1
+
+    # maximum age of the purl cache file in seconds
+    CACHE_TTL = 24 * 60 * 60
+
+    def __init__(self, client: SW360, cache: Optional[Dict] = None,  # type: ignore
+                 cachefile: str = "", refresh: bool = False) -> None:
         self.client: SW360 = client
         self.purl_cache: PurlStore = PurlStore(cache)
+        self.cachefile = cachefile
+        self.refresh = refresh
+
+        # all package-url external ids as tuples (purl, href)
+        self.purl_entries: Optional[List[Tuple[str, str]]] = None
+        self.processed_types: Set[str] = set()
+        self.all_types_processed = False
+
+    @staticmethod
+    def get_purl_type(purl_string: str) -> str:
+        """Quick guess of the purl type without parsing the whole purl"""
+        if purl_string[:4].lower() != "pkg:":
+            return ""
+
+        return purl_string[4:].lstrip("/").split("/", 1)[0].lower()
+
+    def read_purl_cachefile(self) -> Optional[List[Tuple[str, str]]]:
+        """Read the package-url ids from the cache file, if it is
+        still valid and has been created for the current SW360 instance"""
+        try:
+            with open(self.cachefile, encoding="utf-8") as fin:
+                data = json.load(fin)
+        except FileNotFoundError:
+            return None
+        except Exception as ex:
+            print_yellow("  Ignoring invalid purl cache file: " + repr(ex))
+            return None
+
+        if (not isinstance(data, dict)
+                or data.get("version") != self.CACHE_VERSION
+                or data.get("url") != self.client.url
+                or time.time() - data.get("timestamp", 0) > self.CACHE_TTL):
+            return None
+
+        return [(entry[0], entry[1]) for entry in data.get("purls", [])]
+
+    def write_purl_cachefile(self, purl_entries: List[Tuple[str, str]]) -> None:
+        """Write the package-url ids to the cache file"""
+        data = {
+            "version": self.CACHE_VERSION,
+            "url": self.client.url,
+            "timestamp": time.time(),
+            "purls": purl_entries
+        }
+        try:
+            tmpfile = self.cachefile + ".tmp"
+            with open(tmpfile, "w", encoding="utf-8") as fout:
+                json.dump(data, fout)
+            os.replace(tmpfile, self.cachefile)
+        except Exception as ex:
+            print_yellow("  Error writing purl cache file: " + repr(ex))
+
+    def get_purl_entries(self) -> List[Tuple[str, str]]:
+        """
+        Return all package-url external ids of components and releases as
+        tuples (purl, href). They are read from the cache file if possible,
+        otherwise from SW360.
+        """
+        if self.purl_entries is not None:
+            return self.purl_entries
+
+        if self.cachefile and not self.refresh:
+            self.purl_entries = self.read_purl_cachefile()
+            if self.purl_entries is not None:
+                print_text("Read", len(self.purl_entries), "package-url ids from", self.cachefile)
+                return self.purl_entries
+
+        all_ids = self.client.get_components_by_external_id("package-url")
+        if all_ids and len(all_ids) == 0:
+            all_ids = self.client.get_releases_by_external_id("package-url")
+        else:
+            all_rids = self.client.get_releases_by_external_id("package-url")
+            if all_rids:
+                all_ids = all_ids + all_rids
+        print_text(" Found", len(all_ids), "total purls")
+
+        self.purl_entries = []
+        for entry in all_ids:
+            href = entry["_links"]["self"]["href"]
+            for purl_string in PurlUtils.parse_purls_from_external_id(entry["externalIds"]["package-url"]):
+                self.purl_entries.append((purl_string, href))
+
+        if self.cachefile:
+            self.write_purl_cachefile(self.purl_entries)
+
+        return self.purl_entries
 
     def build_purl_cache(self, purl_types: Any = tuple(), no_warnings: bool = True) -> None:
         """
@@ -34,52 +132,65 @@ class PurlService:
         To save a bit of time and especially reduce number of warnings, you can
         specify `purl_types` to only include certain purls into cache
         (e.g. ("deb", "npm"))
+
+        If a cache file has been specified, the package-url ids are read from
+        this file as long as it is not older than `CACHE_TTL`.
         """
+        if self.all_types_processed:
+            return
+
         if self.purl_cache:
             missing = False
             for pt in purl_types:
-                if pt not in self.purl_cache:
+                if pt not in self.purl_cache and pt not in self.processed_types:
                     missing = True
             if not missing:
                 return
 
-        print_text("Retrieving package-url ids, filter:", purl_types)
-        all_ids = self.client.get_components_by_external_id("package-url")
-        if all_ids and len(all_ids) == 0:
-            all_ids = self.client.get_releases_by_external_id("package-url")
+        # only add purls of types that have not been added before
+        if purl_types:
+            new_types = {pt for pt in purl_types if pt not in self.processed_types}
         else:
-            all_rids = self.client.get_releases_by_external_id("package-url")
-            if all_rids:
-                all_ids = all_ids + all_rids
-        print_text(" Found", len(all_ids), "total purls")
+            new_types = set()
 
-        for entry in all_ids:
-            for purl_string in PurlUtils.parse_purls_from_external_id(entry["externalIds"]["package-url"]):
-                try:
-                    purl = packageurl.PackageURL.from_string(purl_string)
-                    if purl_types and purl.type not in purl_types:
-                        continue
-                    if not no_warnings:
-                        already_in_cache = self.purl_cache.get_by_version(purl)
-                        _, already_in_cache = PurlStore.filter_by_qualifiers(
-                            already_in_cache, purl)
-                        for e in already_in_cache:
-                            if e["purl"] == purl:
-                                print_yellow("-> Multiple entries for purl:", purl)
-                                print_yellow(
-                                    self.client.url +
-                                    "group/guest/components/-/component/release/detailRelease/" +
-                                    self.client.get_id_from_href(e["href"]))
-                                print_yellow(
-                                    self.client.url +
-                                    "group/guest/components/-/component/release/detailRelease/" +
-                                    self.client.get_id_from_href(entry["_links"]["self"]["href"]))
-
-                    self.purl_cache.add(purl, entry["_links"]["self"]["href"])
-                except ValueError:
-                    if not no_warnings:
-                        print_yellow("-> Ignoring invalid purl entry in", entry["_links"]["self"]["href"])
-                        print_yellow(purl_string)
+        print_text("Retrieving package-url ids, filter:", purl_types)
+        for purl_string, href in self.get_purl_entries():
+            purl_type = self.get_purl_type(purl_string)
+            if new_types and purl_type and purl_type not in new_types:
+                continue
+            if not new_types and purl_type in self.processed_types:
+                continue
+
+            try:
+                purl = packageurl.PackageURL.from_string(purl_string)
+                if new_types and purl.type not in new_types:
+                    continue
+                if not no_warnings:
+                    already_in_cache = self.purl_cache.get_by_version(purl)
+                    _, already_in_cache = PurlStore.filter_by_qualifiers(
+                        already_in_cache, purl)
+                    for e in already_in_cache:
+                        if e["purl"] == purl:
+                            print_yellow("-> Multiple entries for purl:", purl)
+                            print_yellow(
+                                self.client.url +
+                                "group/guest/components/-/component/release/detailRelease/" +
+                                self.client.get_id_from_href(e["href"]))
+                            print_yellow(
+                                self.client.url +
+                                "group/guest/components/-/component/release/detailRelease/" +
+                                self.client.get_id_from_href(href))
+
+                self.purl_cache.add(purl, href)
+            except ValueError:
+                if not no_warnings:
+                    print_yellow("-> Ignoring invalid purl entry in", href)
+                    print_yellow(purl_string)
+
+        if new_types:
+            self.processed_types.update(new_types)
+        else:
+            self.all_types_processed = True
 
     def search_releases_by_purl(self, purl: packageurl.PackageURL, qualifier_match: bool = False) -> Dict[str, Any]:
         """Get SW360 releases by Package URL using the purl cache
@@ -0,0 +1,97 @@
+# -------------------------------------------------------------------------------
+# Copyright (c) 2026 Siemens
+# All Rights Reserved.
+# Author: thomas.graf@siemens.com
+#
+# SPDX-License-Identifier: MIT
+# -------------------------------------------------------------------------------
+
+from typing import Any, Dict, Iterable, List, Set
+
+from cyclonedx.model.component import Component
+
+from capycli.common.capycli_bom_support import CycloneDxSupport
+
+
+class ReleaseIndex:
+    """
+    Lookup tables for the list of cached SW360 releases.
+
+    All keys are lowercased, the values are positions in the release list,
+    so that candidates can be returned in the original cache order.
+    """
+    def __init__(self, releases: List[Dict[str, Any]]) -> None:
+        self.releases = releases
+        self.count = len(releases)
+        self.by_id: Dict[str, List[int]] = {}
+        self.by_external_id: Dict[str, List[int]] = {}
+        self.by_source_hash: Dict[str, List[int]] = {}
+        self.by_binary_hash: Dict[str, List[int]] = {}
+        self.by_source_file: Dict[str, List[int]] = {}
+        self.by_name: Dict[str, List[int]] = {}
+        self.by_component_id: Dict[str, List[int]] = {}
+
+        for pos, release in enumerate(releases):
+            if ("Id" in release) and ("Sw360Id" not in release):
+                release["Sw360Id"] = release["Id"]
+
+            self._add(self.by_id, release.get("Sw360Id"), pos, lower=False)
+            self._add(self.by_component_id, release.get("ComponentId"), pos, lower=False)
+            self._add(self.by_source_hash, release.get("SourceFileHash"), pos)
+            self._add(self.by_binary_hash, release.get("BinaryFileHash"), pos)
+            self._add(self.by_source_file, release.get("SourceFile"), pos)
+            if release.get("Name"):
+                self._add(self.by_name, release["Name"], pos)
+
+            extid_list = release.get("ExternalIds", release.get("externalIds")) or {}
+            for value in extid_list.values():
+                self._add(self.by_external_id, value, pos)
+
+    @staticmethod
+    def _add(table: Dict[str, List[int]], key: Any, pos: int, lower: bool = True) -> None:
+        if not key or not isinstance(key, str):
+            return
+        if lower:
+            key = key.lower()
+        positions = table.setdefault(key, [])
+        if not positions or positions[-1] != pos:
+            positions.append(pos)
+
+    def is_valid_for(self, releases: List[Dict[str, Any]]) -> bool:
+        """Returns True if the index has been built for exactly this release list"""
+        return (self.releases is releases) and (self.count == len(releases))
+
+    def find_candidates(
+            self, component: Component,
+            release_ids: Iterable[str],
+            component_ids: Iterable[str]) -> List[Dict[str, Any]]:
+        """
+        Returns all releases that may match the given SBOM component by
+        identifier, file hash, name or source file name - in cache order.
+        """
+        positions: Set[int] = set()
+
+        for release_id in release_ids:
+            positions.update(self.by_id.get(release_id, []))
+        for component_id in component_ids:
+            positions.update(self.by_component_id.get(component_id, []))
+
+        if component.purl:
+            positions.update(self.by_external_id.get(component.purl.to_string().lower(), []))
+
+        cmp_hash = CycloneDxSupport.get_source_file_hash(component)
+        if cmp_hash:
+            positions.update(self.by_source_hash.get(cmp_hash.lower(), []))
+
+        cmp_hash = CycloneDxSupport.get_binary_file_hash(component)
+        if cmp_hash:
+            positions.update(self.by_binary_hash.get(cmp_hash.lower(), []))
+
+        cmp_src_file = CycloneDxSupport.get_ext_ref_source_file(component)
+        if cmp_src_file:
+            positions.update(self.by_source_file.get(cmp_src_file.lower(), []))
+
+        if component.name:
+            positions.update(self.by_name.get(component.name.lower(), []))
+
+        return [self.releases[pos] for pos in sorted(positions)]
@@ -0,0 +1,57 @@
+# -------------------------------------------------------------------------------
+# Copyright (c) 2026 Siemens
+# All Rights Reserved.
+# Author: thomas.graf@siemens.com
+#
+# SPDX-License-Identifier: MIT
+# -------------------------------------------------------------------------------
+
+"""
+Read the details of the releases linked to a project.
+"""
+
+from typing import Any, Dict, Iterable, Optional
+
+from sw360 import SW360
+
+from capycli.common.parallel_support import DEFAULT_WORKERS, ResponseMemo, imap_ordered
+
+
+class ReleaseService:
+    """
+    Reads release details from SW360. The details of every release are
+    read only once, the releases linked to a project can be read with
+    up to `workers` parallel requests.
+    """
+    def __init__(self, client: SW360, workers: int = DEFAULT_WORKERS) -> None:
+        self.client = client
+        self.workers = workers
+        self.memo = ResponseMemo()
+
+    @staticmethod
+    def get_href(release: Dict[str, Any]) -> str:
+        """Return the link to the release details"""
+        return release["_links"]["self"]["href"]
+
+    def get_release(self, href: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the details of the release with the given link.
+        Errors are raised again for every call.
+        """
+        return self.memo.get(href, lambda: self.client.get_release_by_url(href))
+
+    def read_releases(self, releases: Iterable[Dict[str, Any]]) -> None:
+        """
+        Read the details of all given releases, i.e. the entries of
+        project["_embedded"]["sw360:releases"], in parallel. Errors are
+        not reported here, but when calling get_release() for the release.
+        """
+        def read(href: str) -> None:
+            try:
+                self.get_release(href)
+            except Exception:
+                pass
+
+        hrefs = [self.get_href(release) for release in releases]
+        for _ in imap_ordered(read, hrefs, self.workers):
+            pass
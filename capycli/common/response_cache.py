@@ -0,0 +1,242 @@
+# -------------------------------------------------------------------------------
+# Copyright (c) 2026 Siemens
+# All Rights Reserved.
+# Author: thomas.graf@siemens.com
+#
+# SPDX-License-Identifier: MIT
+# -------------------------------------------------------------------------------
+
+"""
+On-disk cache for HTTP responses of package registries.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+import requests
+
+import capycli
+
+LOG = capycli.get_logger(__name__)
+
+
+@dataclass
+class CacheEntry:
+    """A cached response"""
+    url: str
+    timestamp: float
+    content: bytes
+    headers: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def etag(self) -> str:
+        return self.headers.get("ETag", "")
+
+    @property
+    def last_modified(self) -> str:
+        return self.headers.get("Last-Modified", "")
+
+    def to_response(self) -> requests.Response:
+        """Create a response object from the cached data"""
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.url = self.url
+        response._content = self.content
+        response.headers.update(self.headers)
+        return response
+
+
+class ResponseCache:
+    """
+    Cache for successful responses to GET requests, keyed by the hash of
+    the URL. Every entry consists of a data file with the response body and
+    a meta file with the URL, the time when the response has been
+    received and the relevant response headers.
+
+    The cache size is limited, the least recently used entries are removed
+    first. In offline mode only cached responses are available.
+    """
+    # headers that are stored together with the response body
+    STORED_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Link")
+
+    # default maximum size of the cache in bytes
+    DEFAULT_MAX_SIZE = 500 * 1024 * 1024
+
+    # default time in seconds that entries are used without revalidation
+    DEFAULT_TTL = 24 * 60 * 60
+
+    def __init__(self, folder: str, max_size: int = DEFAULT_MAX_SIZE,
+                 ttl: float = DEFAULT_TTL, offline: bool = False) -> None:
+        self.folder = folder
+        self.max_size = max_size
+        self.ttl = ttl
+        self.offline = offline
+        self.lock = threading.Lock()
+        self.total_size: Optional[int] = None
+
+    @staticmethod
+    def get_key(url: str, headers: Optional[Mapping[str, str]] = None) -> str:
+        """The key of a request: the hash of the URL and the requested content type"""
+        accept = ""
+        if headers:
+            accept = headers.get("Accept", "")
+        return hashlib.sha256((url + "\n" + accept).encode("utf-8")).hexdigest()
+
+    def get_paths(self, key: str) -> Tuple[str, str]:
+        """Return the names of the meta file and the data file of an entry"""
+        base = os.path.join(self.folder, key[:2], key)
+        return base + ".json", base + ".data"
+
+    def load(self, key: str) -> Optional[CacheEntry]:
+        """Return the cached entry for the given key or None"""
+        meta_file, data_file = self.get_paths(key)
+        try:
+            with open(meta_file, encoding="utf-8") as fin:
+                meta = json.load(fin)
+            with open(data_file, "rb") as fbin:
+                content = fbin.read()
+            # remember the last access for the LRU eviction
+            os.utime(data_file)
+        except FileNotFoundError:
+            return None
+        except Exception as ex:
+            LOG.debug(f"  Ignoring invalid response cache entry {key}: {ex!r}")
+            return None
+
+        return CacheEntry(meta["url"], meta["timestamp"], content, meta.get("headers", {}))
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        """Check whether the entry can be used without revalidation"""
+        return self.offline or (time.time() - entry.timestamp) < self.ttl
+
+    def store(self, key: str, url: str, response: requests.Response) -> None:
+        """Store a successful response"""
+        headers = {h: response.headers[h] for h in self.STORED_HEADERS if h in response.headers}
+        self.write_entry(key, CacheEntry(url, time.time(), response.content, headers))
+
+    def refresh(self, key: str, entry: CacheEntry, response: requests.Response) -> CacheEntry:
+        """Mark an entry as valid again after the server confirmed it is unchanged"""
+        for h in self.STORED_HEADERS:
+            if h in response.headers:
+                entry.headers[h] = response.headers[h]
+        entry.timestamp = time.time()
+        self.write_entry(key, entry)
+        return entry
+
+    def write_entry(self, key: str, entry: CacheEntry) -> None:
+        meta_file, data_file = self.get_paths(key)
+        meta = {"url": entry.url, "timestamp": entry.timestamp, "headers": entry.headers}
+        try:
+            os.makedirs(os.path.dirname(meta_file), exist_ok=True)
+            old_size = self.get_entry_size(key)
+            tmp_suffix = ".tmp" + str(threading.get_ident())
+            with open(data_file + tmp_suffix, "wb") as fbout:
+                fbout.write(entry.content)
+            os.replace(data_file + tmp_suffix, data_file)
+            with open(meta_file + tmp_suffix, "w", encoding="utf-8") as fout:
+                json.dump(meta, fout)
+            os.replace(meta_file + tmp_suffix, meta_file)
+        except Exception as ex:
+            LOG.debug(f"  Unable to write response cache entry {key}: {ex!r}")
+            return
+
+        with self.lock:
+            if self.total_size is None:
+                self.total_size = self.get_cache_size()
+            else:
+                self.total_size += self.get_entry_size(key) - old_size
+            if self.total_size > self.max_size:
+                self.evict()
+
+    def get_entry_size(self, key: str) -> int:
+        size = 0
+        for filename in self.get_paths(key):
+            try:
+                size += os.path.getsize(filename)
+            except OSError:
+                pass
+        return size
+
+    def get_all_entries(self) -> List[Tuple[float, int, str]]:
+        """Return last access time, size and key of all entries"""
+        result: List[Tuple[float, int, str]] = []
+        if not os.path.isdir(self.folder):
+            return result
+
+        for subfolder in os.scandir(self.folder):
+            if not subfolder.is_dir():
+                continue
+            for item in os.scandir(subfolder.path):
+                if not item.name.endswith(".data"):
+                    continue
+                key = item.name[:-len(".data")]
+                try:
+                    result.append((item.stat().st_mtime, self.get_entry_size(key), key))
+                except OSError:
+                    pass
+
+        return result
+
+    def get_cache_size(self) -> int:
+        return sum(size for _, size, _ in self.get_all_entries())
+
+    def evict(self) -> None:
+        """Remove the least recently used entries until the cache uses
+        not more than 90% of the maximum size"""
+        entries = sorted(self.get_all_entries())
+        total_size = sum(size for _, size, _ in entries)
+        limit = self.max_size * 0.9
+        for _, size, key in entries:
+            if total_size <= limit:
+                break
+            for filename in self.get_paths(key):
+                try:
+                    os.remove(filename)
+                except OSError:
+                    pass
+            total_size -= size
+
+        self.total_size = total_size
+
+    def get(self, url: str, fetch: Callable[..., requests.Response], **kwargs: Any) -> requests.Response:
+        """
+        Return the response for the given URL: a cached response if it is
+        still fresh or if the server confirms that it is unchanged,
+        otherwise the response of `fetch(url, **kwargs)`.
+        In offline mode a missing entry results in a 504 response.
+        """
+        headers = dict(kwargs.pop("headers", None) or {})
+        key = self.get_key(url, headers)
+        entry = self.load(key)
+        if entry and self.is_fresh(entry):
+            return entry.to_response()
+
+        if self.offline:
+            LOG.debug(f"  Offline mode, no cached response for {url}")
+            response = requests.Response()
+            response.status_code = 504
+            response.reason = "Not in cache (offline mode)"
+            response.url = url
+            response._content = b""
+            return response
+
+        if entry:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+
+        response = fetch(url, headers=headers, **kwargs)
+        if entry and response.status_code == 304:
+            return self.refresh(key, entry, response).to_response()
+
+        if response.status_code == 200:
+            self.store(key, url, response)
+
+        return response
@@ -33,6 +33,7 @@ class ScriptBase:
         self.project_id: str = ""
         self.project: Optional[dict[str, Any]] = None
         self.sw360_url: str = os.environ.get("SW360ServerUrl", "")
+        self.workers: int = 1
 
     def login(self, token: str = "", url: str = "", oauth2: bool = False) -> bool:
         """Login to SW360"""
@@ -12,7 +12,6 @@ import os
 import sys
 from typing import Any, Dict, Optional
 
-import requests
 from cyclonedx.model import ExternalReference, ExternalReferenceType, HashAlgorithm, HashType, Property, XsUri
 from cyclonedx.model.bom import Bom
 from cyclonedx.model.component import Component
@@ -21,6 +20,7 @@ from packageurl import PackageURL
 import capycli.common.dependencies_base
 import capycli.common.json_support
 from capycli import get_logger
+from capycli.common import http_support
 from capycli.common.capycli_bom_support import CaPyCliBom, CycloneDxSupport, SbomCreator, SbomWriter
 from capycli.common.print import print_red, print_text, print_yellow
 from capycli.main.result_codes import ResultCode
@@ -191,7 +191,7 @@ class GetJavascriptDependencies(capycli.common.dependencies_base.DependenciesBas
         hdr["Accept"] = "application/json"
 
         try:
-            response = requests.get(url, headers=hdr)
+            response = http_support.get_cached(url, headers=hdr)
             if response.ok:
                 res = response.json()
 
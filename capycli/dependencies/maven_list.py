@@ -13,7 +13,6 @@ import sys
 import xml.etree.ElementTree as ET
 from typing import Any, List, Optional, Tuple
 
-import requests
 from cyclonedx.model import ExternalReference, ExternalReferenceType, Property, XsUri
 from cyclonedx.model.bom import Bom
 from cyclonedx.model.component import Component
@@ -21,6 +20,7 @@ from packageurl import PackageURL
 
 import capycli.common.dependencies_base
 import capycli.common.json_support
+from capycli.common import http_support
 from capycli.common.capycli_bom_support import CaPyCliBom, CycloneDxSupport, SbomCreator, SbomWriter
 from capycli.common.print import print_red, print_text, print_yellow
 from capycli.main.result_codes import ResultCode
@@ -117,7 +117,7 @@ class GetJavaMavenTreeDependencies(capycli.common.dependencies_base.Dependencies
         url = re.sub(r"\.jar$", ".pom", binary_file_url)
 
         try:
-            response = requests.get(
+            response = http_support.get_cached(
                 url, headers={"Accept": "text/xml"}
             )
             if response.ok:
@@ -14,7 +14,6 @@ import sys
 from typing import Any, Dict, List, Optional
 from xml.dom import minidom
 
-import requests
 from cyclonedx.contrib.license.factories import LicenseFactory
 from cyclonedx.model import ExternalReference, ExternalReferenceType, Property, XsUri
 from cyclonedx.model.bom import Bom
@@ -24,6 +23,7 @@ from packageurl import PackageURL
 import capycli.common.json_support
 import capycli.common.script_base
 from capycli import get_logger
+from capycli.common import http_support
 from capycli.common.capycli_bom_support import CycloneDxSupport, SbomCreator, SbomWriter
 from capycli.common.print import print_red, print_text, print_yellow
 from capycli.main.result_codes import ResultCode
@@ -479,7 +479,7 @@ class GetNuGetDependencies(capycli.common.script_base.ScriptBase):
 
         url = self.nuget_api_base_url + name.lower() + "/" + version + "/" + name.lower() + ".nuspec"
         try:
-            response = requests.get(url)
+            response = http_support.get_cached(url)
             if not response.ok:
                 print_yellow(
                     "  WARNING: no meta data available for package " +
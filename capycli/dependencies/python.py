@@ -9,15 +9,15 @@
 import logging
 import os
 import sys
+import threading
 import tomllib
 from dataclasses import dataclass
 from enum import Enum
 from io import TextIOWrapper
 from re import compile
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import chardet
-import requests
 import requirements
 from cyclonedx.contrib.hash.factories import HashTypeFactory
 from cyclonedx.contrib.license.factories import LicenseFactory
@@ -33,8 +33,10 @@ import capycli.common.json_support
 import capycli.common.script_base
 from capycli import get_logger
 from capycli.bom.findsources import FindSources
+from capycli.common import http_support
 from capycli.common.capycli_bom_support import CaPyCliBom, CycloneDxSupport, SbomCreator, SbomWriter
 from capycli.common.github_support import GitHubSupport
+from capycli.common.parallel_support import get_worker_count, imap_ordered
 from capycli.common.print import print_red, print_text, print_yellow
 from capycli.main.result_codes import ResultCode
 
@@ -76,6 +78,10 @@ class GetPythonDependencies(capycli.common.script_base.ScriptBase):
     def __init__(self) -> None:
         self.verbose = False
         self.proj_file_override = ""
+        self.workers = 1
+
+        # problems retrieving meta data of the package processed by the current thread
+        self.meta_data_problems = threading.local()
         self.spinner_shape = {
             "interval": 80,
             "frames": [
@@ -174,9 +180,9 @@ class GetPythonDependencies(capycli.common.script_base.ScriptBase):
             LOG.debug("  Retrieving meta data for " + name + ", " + version)
 
         try:
-            response = requests.get(ship_api_url)
+            response = http_support.get_cached(ship_api_url)
             if not response.ok:
-                print_yellow(
+                self.report_meta_data_problem(
                     "  WARNING: no meta data available for package " +
                     name + ", " + version)
                 return None
@@ -184,12 +190,26 @@ class GetPythonDependencies(capycli.common.script_base.ScriptBase):
             json = response.json()
             return json
         except Exception as ex:
-            print_red(
+            self.report_meta_data_problem(
                 "  ERROR: unable to retrieve meta data for package " +
-                name + ", " + version + ": " + str(ex))
+                name + ", " + version + ": " + str(ex), is_error=True)
 
         return None
 
+    def report_meta_data_problem(self, message: str, is_error: bool = False) -> None:
+        """
+        Report a problem retrieving meta data. While meta data for multiple
+        packages is retrieved, the problems are collected and printed as
+        summary at the end.
+        """
+        problems = getattr(self.meta_data_problems, "items", None)
+        if problems is not None:
+            problems.append((is_error, message))
+        elif is_error:
+            print_red(message)
+        else:
+            print_yellow(message)
+
     def generate_purl(self, name: str, version: str) -> str:
         """
         Generate the package URL for the PyPi component identified by
@@ -432,6 +452,44 @@ class GetPythonDependencies(capycli.common.script_base.ScriptBase):
             # There is also no copyright information available from GitHub
             cxcomp.copyright = "N/A"
 
+    def add_meta_data_to_bomitems(self, components: List[Component], package_source: str = "",
+                                  spinner: Optional[Halo] = None) -> None:
+        """
+        Try to lookup meta data for all given items. Up to `self.workers`
+        packages are processed in parallel, problems are printed as summary
+        after all packages have been processed.
+
+        :param components: the components to enrich
+        :type components: list of components
+        """
+        all_problems: List[List[Tuple[bool, str]]] = []
+        for cxcomp, problems in imap_ordered(
+                lambda c: self.enrich_bomitem(c, package_source), components, self.workers):
+            if spinner:
+                spinner.text = f"Processed package {cxcomp.name}, {cxcomp.version}"
+            if problems:
+                all_problems.append(problems)
+
+        if all_problems:
+            print_yellow(f"  Meta data problems for {len(all_problems)} of {len(components)} packages:")
+            for problems in all_problems:
+                for is_error, message in problems:
+                    self.report_meta_data_problem(message, is_error)
+
+    def enrich_bomitem(self, cxcomp: Component,
+                       package_source: str = "") -> Tuple[Component, List[Tuple[bool, str]]]:
+        """
+        Lookup meta data for the given item.
+
+        :return: the item and the problems found
+        """
+        self.meta_data_problems.items = []
+        try:
+            self.add_meta_data_to_bomitem(cxcomp, package_source)
+            return cxcomp, self.meta_data_problems.items
+        finally:
+            self.meta_data_problems.items = None
+
     def convert_package_list(self, package_list: List[Dict[str, Any]], search_meta_data: bool,
                              package_source: str = "") -> Bom:
         """
@@ -444,6 +502,7 @@ class GetPythonDependencies(capycli.common.script_base.ScriptBase):
         """
         creator = SbomCreator()
         sbom = creator.create([], addlicense=True, addprofile=True, addtools=True)
+        components: List[Component] = []
         for package in package_list:
             name = GetPythonDependencies.normalize_packagename(package.get("name", "").strip())
             version = package.get("version", "").strip()
@@ -459,10 +518,12 @@ class GetPythonDependencies(capycli.common.script_base.ScriptBase):
                 name=CycloneDxSupport.CDX_PROP_LANGUAGE,
                 value="Python")
             cxcomp.properties.add(prop)
+            components.append(cxcomp)
 
-            if search_meta_data:
-                self.add_meta_data_to_bomitem(cxcomp, package_source)
+        if search_meta_data:
+            self.add_meta_data_to_bomitems(components, package_source)
 
+        for cxcomp in components:
             sbom.components.add(cxcomp)
 
         return sbom
@@ -691,6 +752,20 @@ class GetPythonDependencies(capycli.common.script_base.ScriptBase):
 
         return entry_list
 
+    def retrieve_package_meta_data(self, components: List[Component], package_source: str = "") -> None:
+        """Lookup meta data for all components of a lock file"""
+        print_text("\nRetrieving package meta data")
+        spinner = None
+        if self.verbose:
+            spinner = Halo(text="Retrieving package meta data", spinner=self.spinner_shape)
+            spinner.start()
+
+        self.add_meta_data_to_bomitems(components, package_source, spinner)
+
+        if spinner:
+            spinner.succeed('Package meta data processing completed.')
+            spinner.stop()
+
     def sbom_from_poetry_lock_file(self, filename: str, search_meta_data: bool, package_source: str = "") -> Bom:
         folder = os.path.dirname(filename)
 
@@ -704,15 +779,8 @@ class GetPythonDependencies(capycli.common.script_base.ScriptBase):
         entry_list_all = self.get_all_poetry_lock_file_entries(filename)
         entry_list = self.get_lock_file_entries_for_sbom(pyproject_file, entry_list_all)
 
-        if search_meta_data:
-            print_text("\nRetrieving package meta data")
-            if self.verbose:
-                spinner = Halo(text="Retrieving package meta data", spinner=self.spinner_shape)
-                spinner.start()
-
+        components: List[Component] = []
         for package in entry_list:
-            if search_meta_data and self.verbose:
-                spinner.text = f"Processing package {package.name}, {package.version}"
             purl = PackageURL(type="pypi", name=package.name, version=package.version)
             cxcomp = Component(
                 name=package.name,
@@ -726,9 +794,8 @@ class GetPythonDependencies(capycli.common.script_base.ScriptBase):
                 value="Python")
             cxcomp.properties.add(prop)
 
-            if search_meta_data:
-                self.add_meta_data_to_bomitem(cxcomp, package_source)
-            else:
+            components.append(cxcomp)
+            if not search_meta_data:
                 LOG.debug("  Processing package_files")
                 for file_metadata in package.files:
                     LOG.debug(f"    Processing file_metadata: {file_metadata}")
@@ -746,11 +813,11 @@ class GetPythonDependencies(capycli.common.script_base.ScriptBase):
                         LOG.debug("      Ignored error: " + repr(ex))
                         pass
 
-            sbom.components.add(cxcomp)
+        if search_meta_data:
+            self.retrieve_package_meta_data(components, package_source)
 
-        if search_meta_data and self.verbose:
-            spinner.succeed('Package meta data processing completed.')
-            spinner.stop()
+        for cxcomp in components:
+            sbom.components.add(cxcomp)
 
         return sbom
 
@@ -767,15 +834,8 @@ class GetPythonDependencies(capycli.common.script_base.ScriptBase):
         entry_list_all = self.get_all_uv_lock_file_entries(filename)
         entry_list = self.get_lock_file_entries_for_sbom(pyproject_file, entry_list_all)
 
-        if search_meta_data:
-            print_text("\nRetrieving package meta data")
-            if self.verbose:
-                spinner = Halo(text="Retrieving package meta data", spinner=self.spinner_shape)
-                spinner.start()
-
+        components: List[Component] = []
         for package in entry_list:
-            if search_meta_data and self.verbose:
-                spinner.text = f"Processing package {package.name}, {package.version}"
             purl = PackageURL(type="pypi", name=package.name, version=package.version)
             cxcomp = Component(
                 name=package.name,
@@ -789,9 +849,8 @@ class GetPythonDependencies(capycli.common.script_base.ScriptBase):
                 value="Python")
             cxcomp.properties.add(prop)
 
-            if search_meta_data:
-                self.add_meta_data_to_bomitem(cxcomp, package_source)
-            else:
+            components.append(cxcomp)
+            if not search_meta_data:
                 LOG.debug("  Processing package_files")
                 for file_metadata in package.files:
                     LOG.debug(f"    Processing file_metadata: {file_metadata}")
@@ -809,11 +868,11 @@ class GetPythonDependencies(capycli.common.script_base.ScriptBase):
                         LOG.debug("      Ignored error: " + repr(ex))
                         pass
 
-            sbom.components.add(cxcomp)
+        if search_meta_data:
+            self.retrieve_package_meta_data(components, package_source)
 
-        if search_meta_data and self.verbose:
-            spinner.succeed('Package meta data processing completed.')
-            spinner.stop()
+        for cxcomp in components:
+            sbom.components.add(cxcomp)
 
         return sbom
 
@@ -989,6 +1048,7 @@ class GetPythonDependencies(capycli.common.script_base.ScriptBase):
             print_text("                            output file (BOM)")
             print_text("    -v, --verbose         verbose output")
             print_text("    --search-meta-data    search for package meta data")
+            print_text("    -w WORKERS            number of packages to search meta data for in parallel")
             return
 
         if not args.inputfile:
@@ -1004,6 +1064,7 @@ class GetPythonDependencies(capycli.common.script_base.ScriptBase):
             sys.exit(ResultCode.RESULT_COMMAND_ERROR)
 
         self.verbose = args.verbose
+        self.workers = get_worker_count(args)
 
         datatype = self.determine_file_type(args.inputfile)
         if datatype == InputFileType.POETRY_LOCK:
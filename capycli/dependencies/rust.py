@@ -13,7 +13,6 @@ import tomllib
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
-import requests
 from cyclonedx.contrib.license.factories import LicenseFactory
 from cyclonedx.model import ExternalReference, ExternalReferenceType, Property, XsUri
 from cyclonedx.model.bom import Bom
@@ -24,6 +23,7 @@ from packageurl import PackageURL
 import capycli.common.script_base
 from capycli import get_logger
 from capycli.bom.findsources import FindSources
+from capycli.common import http_support
 from capycli.common.capycli_bom_support import CycloneDxSupport, SbomCreator, SbomWriter
 from capycli.common.print import print_red, print_text, print_yellow
 from capycli.dependencies.python import GetPythonDependencies
@@ -84,7 +84,7 @@ class GetRustDependencies(capycli.common.script_base.ScriptBase):
             LOG.debug("  Retrieving meta data for " + name + ", " + version)
 
         try:
-            response = requests.get(url)
+            response = http_support.get_cached(url)
             if not response.ok:
                 print_yellow(
                     "  WARNING: no meta data available for package " +
@@ -46,7 +46,7 @@ class CommandlineSupport():
         DownloadSources   download source files from the URL specified in the SBOM
         Granularity       check a bill of material for potential component granularity issues
         Diff              compare two bills of material
-        Merge             merge two bills of material
+        Merge             merge two or more bills of material
         Findsources       determine the source code for SBOM items
         Validate          validate an SBOM
         BomPackage        create a single archive that contains the SBOM and all source and binary files
@@ -197,7 +197,7 @@ class CommandlineSupport():
             "-cf",
             "--cachefile",
             dest="cachefile",
-            help="cache file name to use",
+            help="cache file name to use (.db or .sqlite for a SQLite cache)",
         )
 
         self.parser.add_argument(
@@ -208,6 +208,14 @@ class CommandlineSupport():
             action="store_true",
         )
 
+        self.parser.add_argument(
+            "-rcd",
+            "--refresh_cache_delta",
+            dest="refresh_cache_delta",
+            help="refresh component cache, read only new or changed releases",
+            action="store_true",
+        )
+
         self.parser.add_argument(
             "-sc",
             "--similar",
@@ -444,6 +452,15 @@ class CommandlineSupport():
             help="copy the project with the given id and the update it",
         )
 
+        # used by all commands that support parallel requests
+        self.parser.add_argument(
+            "-w",
+            "--workers",
+            dest="workers",
+            type=int,
+            help="number of parallel requests (default: 1)",
+        )
+
         # used by all commands that need to access SW360
         self.parser.add_argument(
             "-client_id",
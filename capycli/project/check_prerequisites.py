@@ -18,7 +18,9 @@ from sw360 import SW360Keycloak
 import capycli.common.script_base
 from capycli import get_logger
 from capycli.common.capycli_bom_support import CaPyCliBom, CycloneDxSupport
+from capycli.common.parallel_support import get_worker_count
 from capycli.common.print import print_green, print_red, print_text, print_yellow
+from capycli.common.release_service import ReleaseService
 from capycli.main.result_codes import ResultCode
 
 LOG = get_logger(__name__)
@@ -160,9 +162,11 @@ class CheckPrerequisites(capycli.common.script_base.ScriptBase):
         if "sw360:releases" in project["_embedded"]:
             print_text("\n  Components: ")
             releases = project["_embedded"]["sw360:releases"]
+            release_service = ReleaseService(self.client, self.workers)
+            release_service.read_releases(releases)
             for key in releases:
                 href = key["_links"]["self"]["href"]
-                release = self.client.get_release_by_url(href)
+                release = release_service.get_release(href)
                 if not release:
                     print_red("Error accessing release " + href)
                     count_errors += 1
@@ -313,6 +317,7 @@ class CheckPrerequisites(capycli.common.script_base.ScriptBase):
             print("    --forceerror                  force an error exit code in case of prerequisite errors")
             print("    -client_id CLIENT_ID          the SW360 client_id to be used for token generation")
             print("    -client_secret CLIENT_SECRET  the SW360 client_secret to be used for token generation")
+            print("    -w WORKERS, --workers WORKERS number of parallel requests to SW360 (default: 1)")
             return
 
         if not args.sw360_token and args.client_id and args.client_secret:
@@ -333,6 +338,8 @@ class CheckPrerequisites(capycli.common.script_base.ScriptBase):
             print_red("ERROR: login failed!")
             sys.exit(ResultCode.RESULT_AUTH_ERROR)
 
+        self.workers = get_worker_count(args)
+
         sbom = None
         if args.inputfile:
             if not os.path.isfile(args.inputfile):
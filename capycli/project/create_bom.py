@@ -19,8 +19,10 @@ from sw360 import SW360Error, SW360Keycloak
 import capycli.common.script_base
 from capycli import get_logger
 from capycli.common.capycli_bom_support import CaPyCliBom, CycloneDxSupport, SbomCreator
+from capycli.common.parallel_support import get_worker_count
 from capycli.common.print import print_red, print_text, print_yellow
 from capycli.common.purl_utils import PurlUtils
+from capycli.common.release_service import ReleaseService
 from capycli.main.result_codes import ResultCode
 
 LOG = get_logger(__name__)
@@ -52,12 +54,14 @@ class CreateBom(capycli.common.script_base.ScriptBase):
 
         releases: List[Dict[str, Any]] = project["_embedded"].get("sw360:releases", [])
         releases.sort(key=lambda s: s["name"].lower())
+        release_service = ReleaseService(self.client, self.workers)
+        release_service.read_releases(releases)
         for release in releases:
             print_text("   ", release["name"], release["version"])
             href = release["_links"]["self"]["href"]
 
             try:
-                release_details = self.client.get_release_by_url(href)
+                release_details = release_service.get_release(href)
                 if not release_details:
                     print_red("    ERROR: unable to access release:" + href)
                     sys.exit(ResultCode.RESULT_ERROR_ACCESSING_SW360)
@@ -171,6 +175,7 @@ class CreateBom(capycli.common.script_base.ScriptBase):
   -o OUTPUTFILE                  output file to write to
   -client_id CLIENT_ID           the SW360 client_id to be used for token generation
   -client_secret CLIENT_SECRET   the SW360 client_secret to be used for token generation
+  -w WORKERS, --workers WORKERS  number of parallel requests to SW360 (default: 1)
         """)
 
         print()
@@ -212,6 +217,8 @@ class CreateBom(capycli.common.script_base.ScriptBase):
             print_red("ERROR: login failed!")
             sys.exit(ResultCode.RESULT_AUTH_ERROR)
 
+        self.workers = get_worker_count(args)
+
         name: str = args.name
         version: str = ""
         if args.version:
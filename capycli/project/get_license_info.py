@@ -9,14 +9,18 @@
 import json
 import logging
 import os
+import shutil
 import sys
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 from sw360 import SW360Error, SW360Keycloak
 
 import capycli.common.script_base
+from capycli.common.cli_cache import CliCache
 from capycli.common.json_support import load_json_file
+from capycli.common.parallel_support import get_worker_count, imap_ordered_output
 from capycli.common.print import print_red, print_text, print_yellow
+from capycli.common.release_service import ReleaseService
 from capycli.common.script_support import ScriptSupport
 from capycli.main.result_codes import ResultCode
 
@@ -26,6 +30,8 @@ LOG = capycli.get_logger(__name__)
 class GetLicenseInfo(capycli.common.script_base.ScriptBase):
     def __init__(self) -> None:
         self.has_error = False
+        self.workers: int = 1
+        self.cli_cache = CliCache()
 
     """
     Get license info on all project components.
@@ -57,8 +63,10 @@ class GetLicenseInfo(capycli.common.script_base.ScriptBase):
             release_id = self.client.get_id_from_href(release["_links"]["self"]["href"])
             attachment_id = self.client.get_id_from_href(att_href)
 
+            # CLI files of different releases often have the same name and
+            # may be downloaded in parallel, so the attachment id is added
             fileinfo = {}
-            filename = os.path.join(folder, attachment.get("filename", ""))
+            filename = os.path.join(folder, attachment_id + "_" + attachment.get("filename", ""))
             fileinfo["filename"] = filename
             fileinfo["createdBy"] = attachment.get("createdBy", "")
             fileinfo["createdOn"] = attachment.get("createdOn", "")
@@ -70,7 +78,14 @@ class GetLicenseInfo(capycli.common.script_base.ScriptBase):
             if no_overwrite and os.path.isfile(filename):
                 continue
 
+            cached_file = self.cli_cache.find_file(attachment.get("sha1", ""))
+            if cached_file:
+                shutil.copyfile(cached_file, filename)
+                continue
+
             self.client.download_release_attachment(filename, release_id, attachment_id)
+            if os.path.isfile(filename):
+                self.cli_cache.add_file(filename)
 
         return files
 
@@ -129,13 +144,15 @@ class GetLicenseInfo(capycli.common.script_base.ScriptBase):
             if not os.path.exists(target_folder):
                 os.mkdir(target_folder)
 
-            for key in releases:
+            release_service = ReleaseService(self.client, self.workers)
+
+            def read_release(key: Dict[str, Any]) -> Optional[Tuple[str, List[Dict[str, Any]]]]:
                 href = key["_links"]["self"]["href"]
-                release = self.client.get_release_by_url(href)
+                release = release_service.get_release(href)
                 if not release:
                     print_red("  ERROR: unable to access release")
                     self.has_error = True
-                    continue
+                    return None
 
                 component_name = release["name"]
                 if "version" in release:
@@ -144,10 +161,17 @@ class GetLicenseInfo(capycli.common.script_base.ScriptBase):
                     )
 
                 print_text("    " + component_name)
+                return component_name, self.get_cli_files_for_release(release, target_folder, no_overwrite)
 
+            # the CLI files of several releases are downloaded in parallel,
+            # the results are processed in the order of the releases
+            for result in imap_ordered_output(read_release, releases, self.workers):
+                if not result:
+                    continue
+
+                component_name, cli_files = result
                 count = 0
                 warning_shown = False
-                cli_files = self.get_cli_files_for_release(release, target_folder, no_overwrite)
                 for cli_file in cli_files:
                     comp = {}
                     comp["ComponentName"] = component_name
@@ -199,6 +223,7 @@ class GetLicenseInfo(capycli.common.script_base.ScriptBase):
   --forceerror                   force an error exit code in case of missing information
   -client_id CLIENT_ID           the SW360 client_id to be used for token generation
   -client_secret CLIENT_SECRET   the SW360 client_secret to be used for token generation
+  -w WORKERS, --workers WORKERS  number of parallel requests to SW360 (default: 1)
         """)
 
         print()
@@ -259,6 +284,8 @@ class GetLicenseInfo(capycli.common.script_base.ScriptBase):
             print_red("ERROR: login failed!")
             sys.exit(ResultCode.RESULT_AUTH_ERROR)
 
+        self.workers = get_worker_count(args)
+
         if (args.name and args.version):
             # find_project() is part of script_base.py
             self.project_id = self.find_project(args.name, args.version)
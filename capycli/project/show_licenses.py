@@ -7,18 +7,22 @@
 # -------------------------------------------------------------------------------
 
 import logging
+import multiprocessing
 import os
 import shutil
 import sys
 import traceback
-from typing import Any, Dict, List
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 
-from cli_support import CliFile
 from colorama import Fore, Style
 from sw360 import SW360Keycloak
 
 import capycli.common.script_base
+from capycli.common.cli_cache import CliCache, read_cli_data
+from capycli.common.parallel_support import get_worker_count, imap_ordered_output
 from capycli.common.print import print_red, print_text, print_yellow
+from capycli.common.release_service import ReleaseService
 from capycli.main.result_codes import ResultCode
 
 LOG = capycli.get_logger(__name__)
@@ -31,6 +35,8 @@ class ShowLicenses(capycli.common.script_base.ScriptBase):
     def __init__(self) -> None:
         self.nodelete: bool = False
         self.global_license_list: List[str] = []
+        self.workers: int = 1
+        self.cli_cache = CliCache()
 
     @classmethod
     def ensure_dir(cls, folder_path: str) -> None:
@@ -66,21 +72,23 @@ class ShowLicenses(capycli.common.script_base.ScriptBase):
 
         print(Style.RESET_ALL)
 
-    def process_release(self, release: Dict[str, Any], tempfolder: str) -> None:
-        """Processes a single release"""
+    def download_cli_file(self, release: Dict[str, Any], tempfolder: str) -> Tuple[str, str]:
+        """Download the first CLI file of a release and return its name and,
+        if CLI files are cached, its SHA1 hash"""
         if not self.client:
             print_red("  No client!")
             sys.exit(ResultCode.RESULT_ERROR_ACCESSING_SW360)
 
         if "_embedded" not in release:
             print_red("    No license information available!")
-            return
+            return "", ""
 
         if "sw360:attachments" not in release["_embedded"]:
             print_red("    No license information available!")
-            return
+            return "", ""
 
         cli_filename = ""
+        sha1 = ""
         attachment_infos = release["_embedded"]["sw360:attachments"]
         for key in attachment_infos:
             att_href = key["_links"]["self"]["href"]
@@ -90,37 +98,58 @@ class ShowLicenses(capycli.common.script_base.ScriptBase):
             if attachment.get("attachmentType", "") != "COMPONENT_LICENSE_INFO_XML":
                 continue
 
-            filename = key["filename"]
-            filename = os.path.join(tempfolder, filename)
+            cached_file = self.cli_cache.find_file(attachment.get("sha1", ""))
+            if cached_file:
+                cli_filename = cached_file
+                sha1 = attachment["sha1"]
+                break
+
+            # CLI files of different releases often have the same name and
+            # may be downloaded in parallel, so the attachment id is added
             release_id = self.client.get_id_from_href(release["_links"]["self"]["href"])
             attachment_id = self.client.get_id_from_href(att_href)
+            filename = os.path.join(tempfolder, attachment_id + "_" + key["filename"])
             self.client.download_release_attachment(filename, release_id, attachment_id)
             if os.path.isfile(filename):
                 cli_filename = filename
+                sha1 = self.cli_cache.add_file(filename)
                 break
             else:
                 print_red("    Error downloading CLI file!")
 
         if not cli_filename:
             print_yellow("    No CLI file found!")
-            return
 
-        clifile = CliFile()
-
-        try:
-            clifile.read_from_file(cli_filename)
-        except OSError as ex:
-            print_red("    Error reading CLI file: " + cli_filename)
-            print_red("    Error '{0}' occurred. Arguments {1}.".format(ex.errno, ex.args))
+        return cli_filename, sha1
+
+    def show_cli_licenses(self, cli_filename: str, sha1: str = "",
+                          parsed: Optional["Future[Dict[str, Any]]"] = None) -> None:
+        """Show the licenses of a CLI file and add them to the global license list.
+        `parsed` is the result of read_cli_data() running in another process."""
+        data = self.cli_cache.get_data(sha1)
+        if data is None:
+            try:
+                data = parsed.result() if parsed else read_cli_data(cli_filename)
+                self.cli_cache.set_data(sha1, data)
+            except OSError as ex:
+                print_red("    Error reading CLI file: " + cli_filename)
+                print_red("    Error '{0}' occurred. Arguments {1}.".format(ex.errno, ex.args))
+                data = {"licenses": []}
 
         license_list = []
-        for lic in clifile.licenses:
-            license_list.append(lic.name + " (" + lic.spdx_identifier + ")")
-            if lic.name not in self.global_license_list:
-                self.global_license_list.append(lic.name)
+        for lic in data["licenses"]:
+            license_list.append(lic["name"] + " (" + lic["spdx_identifier"] + ")")
+            if lic["name"] not in self.global_license_list:
+                self.global_license_list.append(lic["name"])
 
         self.print_license_list(license_list)
 
+    def process_release(self, release: Dict[str, Any], tempfolder: str) -> None:
+        """Processes a single release"""
+        cli_filename, sha1 = self.download_cli_file(release, tempfolder)
+        if cli_filename:
+            self.show_cli_licenses(cli_filename, sha1)
+
     def show_licenses(self, id: str) -> None:
         if not self.client:
             print_red("  No client!")
@@ -153,17 +182,45 @@ class ShowLicenses(capycli.common.script_base.ScriptBase):
             print_text("\nComponents: ")
             releases = project["_embedded"]["sw360:releases"]
             print_text("  Scanning", len(releases), "releases.")
-            for key in sorted(releases, key=lambda item: item["name"]):
+            release_service = ReleaseService(self.client, self.workers)
+
+            # with several workers, the CLI files are downloaded in parallel and
+            # parsed in separate processes, the results are shown in release order
+            parser: Optional[ProcessPoolExecutor] = None
+            if self.workers > 1:
+                parser = ProcessPoolExecutor(
+                    max_workers=min(self.workers, os.cpu_count() or 1),
+                    mp_context=multiprocessing.get_context("spawn"))
+
+            def download(key: Dict[str, Any]) -> Tuple[str, str, Optional["Future[Dict[str, Any]]"]]:
                 href = key["_links"]["self"]["href"]
                 print_text("\n  " + key["name"] + ", " + key["version"])
-                release = self.client.get_release_by_url(href)
+                release = release_service.get_release(href)
                 if not release:
                     print_red("Error processing release")
-                else:
+                    return "", "", None
+
+                try:
+                    cli_filename, sha1 = self.download_cli_file(release, tempfolder)
+                    if cli_filename and parser and self.cli_cache.get_data(sha1) is None:
+                        return cli_filename, sha1, parser.submit(read_cli_data, cli_filename)
+                    return cli_filename, sha1, None
+                except Exception as ex:
+                    print_red("Error processing release: \n" + repr(ex))
+                    return "", "", None
+
+            try:
+                for cli_filename, sha1, parsed in imap_ordered_output(
+                        download, sorted(releases, key=lambda item: item["name"]), self.workers):
+                    if not cli_filename:
+                        continue
                     try:
-                        self.process_release(release, tempfolder)
+                        self.show_cli_licenses(cli_filename, sha1, parsed)
                     except Exception as ex:
                         print_red("Error processing release: \n" + repr(ex))
+            finally:
+                if parser:
+                    parser.shutdown()
 
             print_text("\nLicense summary:")
             self.print_license_list(self.global_license_list)
@@ -185,6 +242,7 @@ class ShowLicenses(capycli.common.script_base.ScriptBase):
   -version                      version of the project, component or release
   -client_id CLIENT_ID          the SW360 client_id to be used for token generation
   -client_secret CLIENT_SECRET  the SW360 client_secret to be used for token generation
+  -w WORKERS, --workers WORKERS number of parallel requests to SW360 (default: 1)
         """)
 
         print()
@@ -226,6 +284,8 @@ class ShowLicenses(capycli.common.script_base.ScriptBase):
             print_red("ERROR: login failed!")
             sys.exit(ResultCode.RESULT_AUTH_ERROR)
 
+        self.workers = get_worker_count(args)
+
         name: str = args.name
         version: str = ""
         if args.version:
@@ -15,7 +15,9 @@ from sw360 import SW360Error, SW360Keycloak
 
 import capycli.common.json_support
 import capycli.common.script_base
+from capycli.common.parallel_support import get_worker_count
 from capycli.common.print import print_red, print_text, print_yellow
+from capycli.common.release_service import ReleaseService
 from capycli.main.result_codes import ResultCode
 
 LOG = capycli.get_logger(__name__)
@@ -115,6 +117,8 @@ class ShowProject(capycli.common.script_base.ScriptBase):
         if "sw360:releases" in self.project["_embedded"]:
             releases = self.project["_embedded"]["sw360:releases"]
             releases.sort(key=lambda s: s["name"].lower())
+            release_service = ReleaseService(self.client, self.workers)
+            release_service.read_releases(releases)
             for release in releases:
                 href = release["_links"]["self"]["href"]
                 state = self.get_clearing_state(self.project, href)
@@ -132,7 +136,7 @@ class ShowProject(capycli.common.script_base.ScriptBase):
                     + self.client.get_id_from_href(href))
 
                 try:
-                    release_details = self.client.get_release_by_url(href)
+                    release_details = release_service.get_release(href)
                     if not release_details:
                         print_red("  ERROR: unable to access project:")
                         sys.exit(ResultCode.RESULT_ERROR_ACCESSING_SW360)
@@ -198,6 +202,7 @@ class ShowProject(capycli.common.script_base.ScriptBase):
             print("    -o OUTPUTFILE                 output file to write project details to")
             print("    -client_id CLIENT_ID          the SW360 client_id to be used for token generation")
             print("    -client_secret CLIENT_SECRET  the SW360 client_secret to be used for token generation")
+            print("    -w WORKERS, --workers WORKERS number of parallel requests to SW360 (default: 1)")
             return
 
         if not args.sw360_token and args.client_id and args.client_secret:
@@ -218,6 +223,8 @@ class ShowProject(capycli.common.script_base.ScriptBase):
             print_red("ERROR: login failed!")
             sys.exit(ResultCode.RESULT_AUTH_ERROR)
 
+        self.workers = get_worker_count(args)
+
         name: str = args.name
         version: str = ""
         pid: str = ""
@@ -0,0 +1,108 @@
+# -------------------------------------------------------------------------------
+# Copyright (c) 2026 Siemens
+# All Rights Reserved.
+# Author: thomas.graf@siemens.com
+#
+# SPDX-License-Identifier: MIT
+# -------------------------------------------------------------------------------
+
+import hashlib
+import os
+import shutil
+import tempfile
+import time
+
+from capycli.common.artifact_store import ArtifactStore, get_artifact_store
+from tests.test_base import TestBase
+
+
+class TestArtifactStore(TestBase):
+    def setUp(self) -> None:
+        self.folder = tempfile.mkdtemp()
+        self.store_folder = os.path.join(self.folder, "store")
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.folder, ignore_errors=True)
+        os.environ.pop("CAPYCLI_ARTIFACT_STORE", None)
+        os.environ.pop("CAPYCLI_ARTIFACT_STORE_SIZE", None)
+
+    def create_file(self, name: str, data: bytes) -> str:
+        path = os.path.join(self.folder, name)
+        with open(path, "wb") as fout:
+            fout.write(data)
+        return path
+
+    def test_add_and_find(self) -> None:
+        sut = ArtifactStore(self.store_folder)
+        path = self.create_file("certifi-2022.12.7.tar.gz", b"some data")
+        sha1 = hashlib.sha1(b"some data").hexdigest()
+        url = "https://files.pythonhosted.org/certifi-2022.12.7.tar.gz"
+
+        stored = sut.add_file(path, url)
+        self.assertEqual(stored, os.path.join(sut.get_object_folder(sha1), "certifi-2022.12.7.tar.gz"))
+        self.assertEqual(sut.find_by_sha1(sha1), stored)
+        self.assertEqual(sut.find_by_sha1(sha1.upper()), stored)
+        self.assertEqual(sut.find_by_url(url), (stored, sha1))
+        self.assertIsNone(sut.find_by_url("https://other.org/x.zip"))
+        self.assertIsNone(sut.find_by_sha1("None"))
+
+        # same content from another URL is stored only once
+        self.assertEqual(sut.add_file(path, "https://mirror.org/certifi.tar.gz", sha1), stored)
+        self.assertEqual(sut.find_by_url("https://mirror.org/certifi.tar.gz"), (stored, sha1))
+
+        os.remove(path)
+        target_folder = os.path.join(self.folder, "target")
+        os.makedirs(target_folder)
+        copy = sut.copy_file(stored, target_folder)  # type: ignore
+        with open(copy, "rb") as fin:
+            self.assertEqual(fin.read(), b"some data")
+
+    def test_changed_file(self) -> None:
+        sut = ArtifactStore(self.store_folder)
+        path = self.create_file("certifi-2022.12.7.tar.gz", b"some data")
+        sha1 = hashlib.sha1(b"some data").hexdigest()
+        url = "https://files.pythonhosted.org/certifi-2022.12.7.tar.gz"
+        stored = sut.add_file(path, url)
+        self.assertIsNotNone(stored)
+
+        # a new modification time alone does not invalidate the file
+        os.utime(stored, (1000, 1000))  # type: ignore
+        self.assertEqual(sut.find_by_sha1(sha1), stored)
+
+        # changed in place, for example via a hard link of the downloaded file
+        with open(stored, "wb") as fout:  # type: ignore
+            fout.write(b"other data")
+        self.assertIsNone(sut.find_by_sha1(sha1))
+        self.assertIsNone(sut.find_by_url(url))
+        self.assertFalse(os.path.exists(sut.get_object_folder(sha1)))
+
+    def test_eviction(self) -> None:
+        sut = ArtifactStore(self.store_folder, max_size=3500)
+        shas = []
+        for i in range(3):
+            data = bytes([i]) * 1000
+            shas.append(hashlib.sha1(data).hexdigest())
+            sut.add_file(self.create_file(f"f{i}.zip", data))
+            past = time.time() - 100 + i
+            os.utime(sut.get_object_folder(shas[i]), (past, past))
+
+        # use the oldest one again
+        self.assertIsNotNone(sut.find_by_sha1(shas[0]))
+        sut.add_file(self.create_file("f3.zip", b"x" * 1000))
+
+        self.assertIsNotNone(sut.find_by_sha1(shas[0]))
+        self.assertIsNone(sut.find_by_sha1(shas[1]))
+        self.assertIsNotNone(sut.find_by_sha1(shas[2]))
+        self.assertLessEqual(sut.total_size, 3500)  # type: ignore
+
+    def test_get_artifact_store(self) -> None:
+        self.assertIsNone(get_artifact_store())
+
+        os.environ["CAPYCLI_ARTIFACT_STORE"] = self.store_folder
+        os.environ["CAPYCLI_ARTIFACT_STORE_SIZE"] = "2"
+        sut = get_artifact_store()
+        self.assertIsNotNone(sut)
+        if sut:  # only for mypy
+            self.assertEqual(sut.folder, self.store_folder)
+            self.assertEqual(sut.max_size, 2 * 1024 * 1024)
+        self.assertIs(get_artifact_store(), sut)
@@ -46,6 +46,7 @@ class AppArguments():
         self.package_source: str = ""
         self.raw_input: str = ""
         self.refresh_cache: bool = False
+        self.refresh_cache_delta: bool = False
         self.result_required: bool = False
         self.search_meta_data: bool = False
         self.similar: bool = False
@@ -73,6 +74,7 @@ class AppArguments():
         self.local_checklist_list: str = ""
         self.client_id: str = ""
         self.client_secret: str = ""
+        self.workers: int = 1
 
 
 class TestBasePytest:
@@ -7,6 +7,7 @@
 # -------------------------------------------------------------------------------
 
 """unit tests for bom/create_components.py in createreleases mode"""
+import hashlib
 from typing import Any, Dict, Tuple
 
 import pytest
@@ -19,6 +20,7 @@ from packageurl import PackageURL
 import capycli.bom.create_components
 from capycli.common.capycli_bom_support import CaPyCliBom, CycloneDxSupport
 from capycli.common.map_result import MapResult
+from capycli.main.result_codes import ResultCode
 from tests.test_base import SW360_BASE_URL
 
 
@@ -104,6 +106,31 @@ class TestBomCreate:
         assert responses.calls[-1].request.method == responses.PATCH
         assert responses.calls[-1].request.url == SW360_BASE_URL + 'releases/06a6e5'
 
+    @responses.activate
+    def test_create_items_parallel(self) -> None:
+        """Items are processed in parallel, output and errors are reported in SBOM order"""
+        items = Bom()
+        for name, id in (("a", "r1"), ("b", "r2"), ("c", "r3")):
+            if id == "r2":
+                responses.add(responses.GET, SW360_BASE_URL + 'releases/' + id, status=500)
+            else:
+                responses.add(responses.GET, SW360_BASE_URL + 'releases/' + id, json={
+                    "name": name, "version": "1.0",
+                    "_links": {"self": {"href": SW360_BASE_URL + "releases/" + id}}})
+            cx_comp = Component(name=name, version="1.0")
+            CycloneDxSupport.update_or_set_property(cx_comp, CycloneDxSupport.CDX_PROP_SW360ID, id)
+            items.components.add(cx_comp)
+
+        self.app.workers = 3
+        with pytest.raises(SystemExit) as ex:
+            self.app.create_items(items)
+        assert ex.value.code == ResultCode.RESULT_ERROR_CREATING_ITEM
+
+        out = self.capsys.readouterr().out  # type: ignore
+        assert out.index("a, 1.0 already exists") < out.index("b, 1.0 already exists") \
+            < out.index("Error creating item") < out.index("c, 1.0 already exists")
+        assert out.endswith("An error occurred during component/release creation!\n  b, 1.0\n")
+
     @responses.activate
     def test_create_comp_release_no_component(self) -> None:
         """Component doesn't exist. As we test onlyCreateReleases case here,
@@ -640,6 +667,34 @@ class TestBomCreate:
         assert "Error" not in captured.out
         assert captured.err == ""
 
+    @responses.activate
+    def test_upload_file_download_artifact_store(self, tmp_path: Any, monkeypatch: Any) -> None:
+        """Downloaded files are taken from the artifact store"""
+        monkeypatch.setenv("CAPYCLI_ARTIFACT_STORE", str(tmp_path))
+        responses.add(
+            responses.GET, 'https://rubygems.org/gems/activemodel-5.2.1.gem',
+            body="content")
+        responses.add(
+            responses.POST, SW360_BASE_URL + 'releases/06a6e7/attachments',
+            match=[upload_matcher("activemodel-5.2.1.gem")])
+
+        self.app.download = True
+        item = Component(
+            name="activemodel",
+            version="5.2.1"
+        )
+        CycloneDxSupport.update_or_set_ext_ref(
+            item, ExternalReferenceType.SOURCE_DISTRIBUTION,
+            "new_url", "https://rubygems.org/gems/activemodel-5.2.1.gem")
+        self.app.upload_file(item, {}, "06a6e7", "SOURCE", "")
+        self.app.upload_file(item, {}, "06a6e7", "SOURCE", "")
+
+        # one download, two uploads
+        assert len(responses.calls) == 3
+        captured = self.capsys.readouterr()  # type: ignore
+        assert "Using file activemodel-5.2.1.gem from artifact store" in captured.out
+        assert "Error" not in captured.out
+
     @responses.activate
     def test_upload_file_local(self) -> None:
         """Upload local file
@@ -1140,6 +1195,123 @@ class TestBomCreate:
         assert "different source attachment" not in captured.out
         assert len(responses.calls) == 2
 
+    @responses.activate
+    def test_update_release_attachment_check_status_embedded(self) -> None:
+        """The check status of the attachment list is used without reading the attachment"""
+        release_data = {
+            '_embedded': {'sw360:attachments': [{
+                '_links': {'self': {'href': SW360_BASE_URL + 'attachments/0124'}},
+                'filename': 'invalid.zip',
+                'checkStatus': 'REJECTED',
+                'attachmentType': 'SOURCE'}]},
+            "_links": {"self": {"href": SW360_BASE_URL + "releases/06a6e7"}}}
+
+        responses.add(
+            responses.POST, SW360_BASE_URL + 'releases/06a6e7/attachments',
+            match=[upload_matcher("Readme.md")])
+
+        item = Component(name="")
+        CycloneDxSupport.update_or_set_ext_ref(
+            item, ExternalReferenceType.DISTRIBUTION,
+            CaPyCliBom.SOURCE_FILE_COMMENT, "Readme.md")
+        self.app.update_release(item, release_data)
+        assert len(responses.calls) == 1
+        assert responses.calls[0].request.method == responses.POST
+
+    @responses.activate
+    def test_upload_file_download_same_content_attached(self) -> None:
+        """A downloaded file is only skipped if the same content is attached with the same type"""
+        responses.add(
+            responses.GET, 'https://rubygems.org/gems/activemodel-5.2.1.gem',
+            body="content")
+        responses.add(
+            responses.POST, SW360_BASE_URL + 'releases/06a6e7/attachments',
+            match=[upload_matcher("activemodel-5.2.1.gem")])
+        attachment = {
+            '_links': {'self': {'href': SW360_BASE_URL + 'attachments/0125'}},
+            'filename': 'activemodel-5.2.1-sources.gem',
+            'sha1': hashlib.sha1(b"content").hexdigest(),
+            'checkStatus': 'NOTCHECKED',
+            'attachmentType': 'BINARY'}
+        release_data = {
+            '_embedded': {'sw360:attachments': [attachment]},
+            "_links": {"self": {"href": SW360_BASE_URL + "releases/06a6e7"}}}
+
+        self.app.download = True
+        item = Component(
+            name="activemodel",
+            version="5.2.1"
+        )
+        CycloneDxSupport.update_or_set_ext_ref(
+            item, ExternalReferenceType.SOURCE_DISTRIBUTION,
+            "new_url", "https://rubygems.org/gems/activemodel-5.2.1.gem")
+
+        # a binary attachment with the same content does not prevent the source upload
+        self.app.upload_file(item, release_data, "06a6e7", "SOURCE", "")
+        assert len(responses.calls) == 2
+        assert responses.calls[1].request.method == responses.POST
+        captured = self.capsys.readouterr()  # type: ignore
+        assert "is already attached" not in captured.out
+        assert "Error" not in captured.out
+
+        # a source attachment with the same content does
+        attachment["filename"] = "activemodel-5.2.1-sources.git"
+        attachment["attachmentType"] = "SOURCE"
+        self.app.upload_file(item, release_data, "06a6e7", "SOURCE", "")
+        assert len(responses.calls) == 3
+        captured = self.capsys.readouterr()  # type: ignore
+        assert "is already attached to release as activemodel-5.2.1-sources.git (SOURCE)" in captured.out
+        assert "Error" not in captured.out
+
+    @responses.activate
+    def test_upload_file_same_content_other_name(self) -> None:
+        """A file is not uploaded if its content is attached with another name"""
+        sha1 = hashlib.sha1(b"content").hexdigest()
+        release_data = {
+            '_embedded': {'sw360:attachments': [{
+                '_links': {'self': {'href': SW360_BASE_URL + 'attachments/0125'}},
+                'filename': 'activemodel-5.2.1.zip',
+                'sha1': sha1,
+                'checkStatus': 'ACCEPTED',
+                'attachmentType': 'SOURCE'}, {
+                '_links': {'self': {'href': SW360_BASE_URL + 'attachments/0126'}},
+                'filename': 'activemodel.git',
+                'sha1': "0" * 40,
+                'checkStatus': 'NOTCHECKED',
+                'attachmentType': 'SOURCE'}]},
+            "_links": {"self": {"href": SW360_BASE_URL + "releases/06a6e7"}}}
+
+        self.app.download = True
+        item = Component(name="activemodel", version="5.2.1")
+        CycloneDxSupport.update_or_set_ext_ref(
+            item, ExternalReferenceType.SOURCE_DISTRIBUTION,
+            "new_url", "https://rubygems.org/gems/activemodel-5.2.1.gem")
+        extref = ExternalReference(
+            type=ExternalReferenceType.DISTRIBUTION,
+            comment=CaPyCliBom.SOURCE_FILE_COMMENT,
+            url=XsUri("activemodel-5.2.1.gem"))
+        extref.hashes.add(HashType(alg=HashAlgorithm.SHA_1, content=sha1))
+        item.external_references.add(extref)
+        self.app.upload_file(item, release_data, "06a6e7", "SOURCE", "")
+
+        # neither download nor upload
+        assert len(responses.calls) == 0
+        captured = self.capsys.readouterr()  # type: ignore
+        assert "is already attached to release as activemodel-5.2.1.zip (SOURCE)" in captured.out
+        assert "different source attachment" not in captured.out
+
+        # a rejected attachment with the same content is ignored
+        release_data['_embedded']['sw360:attachments'][0]['checkStatus'] = 'REJECTED'  # type: ignore
+        responses.add(
+            responses.GET, 'https://rubygems.org/gems/activemodel-5.2.1.gem',
+            body="content")
+        responses.add(
+            responses.POST, SW360_BASE_URL + 'releases/06a6e7/attachments',
+            match=[upload_matcher("activemodel-5.2.1.gem")])
+        self.app.upload_file(item, release_data, "06a6e7", "SOURCE", "")
+        assert len(responses.calls) == 2
+        assert responses.calls[1].request.method == responses.POST
+
     @responses.activate
     def test_update_release_attachment_rename(self) -> None:
         """Upload to existing release with content-disposition rename
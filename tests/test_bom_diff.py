@@ -8,10 +8,13 @@
 
 import os
 
+from cyclonedx.model.component import Component
+
 import capycli.bom.diff_bom
 import capycli.common.json_support
 import capycli.common.script_base
-from capycli.common.capycli_bom_support import CaPyCliBom
+from capycli.bom.diff_bom import DiffType
+from capycli.common.capycli_bom_support import CaPyCliBom, SbomCreator
 from capycli.common.json_support import load_json_file
 from capycli.main.result_codes import ResultCode
 from tests.test_base import AppArguments, TestBase
@@ -261,6 +264,24 @@ class TestBomDiff(TestBase):
 
         self.delete_file(self.OUTPUTFILE)
 
+    def test_app_bom_different_verbose(self) -> None:
+        db = capycli.bom.diff_bom.DiffBom()
+
+        args = AppArguments()
+        args.command = ["bom", "diff"]
+        args.command.append(os.path.join(os.path.dirname(__file__), "fixtures", self.INPUTFILE4))
+        args.command.append(os.path.join(os.path.dirname(__file__), "fixtures", self.INPUTFILE5))
+        args.verbose = True
+        args.all = True
+
+        out = self.capture_stdout(db.run, args)
+        # every result is shown once
+        self.assertEqual(1, out.count("Release exists in both SBOMs: Autofac, 6.2.0"))
+        self.assertEqual(1, out.count("Release has been removed:     Tethys.Framework, 4.5.0"))
+        self.assertEqual(1, out.count("Major update:                 AbrarJahin.DiffMatchPatch, 0.1.0 -> 9.1.0"))
+        self.assertEqual(1, out.count("New release:                  Dummy, 9.9.9"))
+        self.assertEqual(1, out.count("Minor update:                 certifi, 2022.12.7 -> 2022.12.99"))
+
     def test_app_bom_different_with_fileoutput2(self) -> None:
         db = capycli.bom.diff_bom.DiffBom()
 
@@ -312,6 +333,55 @@ class TestBomDiff(TestBase):
         self.delete_file(args.outputfile)
         self.delete_file(args.write_mapresult)
 
+    def test_diff_components_updates(self) -> None:
+        db = capycli.bom.diff_bom.DiffBom()
+        bom_old = SbomCreator.create([
+            Component(name="certifi", version="2022.12.7"),
+            Component(name="Dummy", version="1.0"),
+            Component(name="six", version="1.16.0")])
+        bom_new = SbomCreator.create([
+            Component(name="Certifi", version="2023.7.22"),
+            Component(name="certifi", version="2024.2.2"),
+            Component(name="six", version="1.16.0")])
+
+        result = db.compare_boms_with_updates(bom_old, bom_new)
+        self.assertEqual(4, len(result))
+        self.assertEqual(DiffType.OBSOLETE, result[0]["Result"])
+        self.assertEqual("Dummy", result[0]["Name"])
+        self.assertEqual(DiffType.IDENTICAL, result[1]["Result"])
+        self.assertEqual("six", result[1]["Name"])
+
+        # both new versions are updates of the old version
+        self.assertEqual(DiffType.MAJOR_UPDATE, result[2]["Result"])
+        self.assertEqual("2023.7.22", result[2]["Version"])
+        self.assertEqual("2022.12.7", result[2]["VersionOld"])
+        self.assertEqual(DiffType.MAJOR_UPDATE, result[3]["Result"])
+        self.assertEqual("2024.2.2", result[3]["Version"])
+
+        # the same result as determining the updates afterwards
+        result2 = [
+            {"Name": "certifi", "Version": "2022.12.7", "Result": DiffType.OBSOLETE},
+            {"Name": "Dummy", "Version": "1.0", "Result": DiffType.OBSOLETE},
+            {"Name": "six", "Version": "1.16.0", "Result": DiffType.IDENTICAL},
+            {"Name": "Certifi", "Version": "2023.7.22", "Result": DiffType.NEW},
+            {"Name": "certifi", "Version": "2024.2.2", "Result": DiffType.NEW}]
+        self.assertEqual(result, db.check_for_updates(result2))
+
+    def test_write_result_streamed(self) -> None:
+        db = capycli.bom.diff_bom.DiffBom()
+        result = [
+            {"Name": "six", "Version": "1.16.0", "Result": "IDENTICAL"},
+            {"Name": "certifi", "Version": "2024.2.2", "Result": "MINOR_UPDATE", "VersionOld": "2024.1.1"}]
+        for items in ([], result):
+            db.write_result_to_json(self.OUTPUTFILE, iter(items))
+            with open(self.OUTPUTFILE, encoding="utf-8") as fin:
+                streamed = fin.read()
+            capycli.common.json_support.write_json_to_file(items, self.OUTPUTFILE)
+            with open(self.OUTPUTFILE, encoding="utf-8") as fin:
+                self.assertEqual(fin.read(), streamed)
+
+        self.delete_file(self.OUTPUTFILE)
+
 
 if __name__ == '__main__':
     APP = TestBomDiff()
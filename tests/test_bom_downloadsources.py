@@ -1,5 +1,5 @@
 # -------------------------------------------------------------------------------
-# Copyright (c) 2023-2025 Siemens
+# Copyright (c) 2023-2026 Siemens
 # All Rights Reserved.
 # Author: thomas.graf@siemens.com
 #
@@ -288,6 +288,56 @@ class TestBomDownloadsources(TestBase):
 
         self.assertTrue(False, "Error: we must never arrive here")
 
+    @responses.activate
+    def test_download_sources_parallel_and_resume(self) -> None:
+        sbom = Bom()
+        for i in range(6):
+            component = Component(name=f"comp{i}", version="1.0")
+            url = f"https://example{i % 2}.com/comp{i}-1.0.zip"
+            CycloneDxSupport.update_or_set_ext_ref(
+                component, ExternalReferenceType.SOURCE_DISTRIBUTION, "", url)
+            sbom.components.add(component)
+            responses.add(responses.GET, url=url, body=f"data of comp{i}".encode(), status=200)
+
+        sut = BomDownloadSources()
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            out = self.capture_stdout(sut.download_sources, sbom, tmpdirname, 3)
+            self.assertIn("6 files downloaded, 0 files already available, 0 downloads failed", out)
+            # output is in SBOM order
+            positions = [out.index(f"Downloading file comp{i}-1.0.zip") for i in range(6)]
+            self.assertEqual(positions, sorted(positions))
+            for i, component in enumerate(sbom.components):
+                ext_ref = CycloneDxSupport.get_ext_ref(
+                    component, ExternalReferenceType.DISTRIBUTION, CaPyCliBom.SOURCE_FILE_COMMENT)
+                self.assertIsNotNone(ext_ref)
+                if ext_ref:  # only for mypy
+                    self.assertTrue(ext_ref.url._uri.endswith(f"comp{i}-1.0.zip"))
+
+            # second run: files are already there
+            out = self.capture_stdout(sut.download_sources, sbom, tmpdirname, 3)
+            self.assertIn("0 files downloaded, 6 files already available, 0 downloads failed", out)
+            self.assertEqual(len(responses.calls), 6)
+
+    @responses.activate
+    def test_download_source_file_artifact_store(self) -> None:
+        url = "https://example.com/archive/v2.3.4.zip"
+        responses.add(responses.GET, url=url, body=b"PK\x03\x04", status=200)
+
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            os.environ["CAPYCLI_ARTIFACT_STORE"] = os.path.join(tmpdirname, "store")
+            try:
+                for folder in ("first", "second"):
+                    os.makedirs(os.path.join(tmpdirname, folder))
+                    result = BomDownloadSources.download_source_file(url, os.path.join(tmpdirname, folder))
+                    self.assertIsNotNone(result)
+                    if result:  # only for mypy
+                        self.assertEqual(result[0], os.path.join(tmpdirname, folder, "v2.3.4.zip"))
+                        self.assertTrue(os.path.isfile(result[0]))
+            finally:
+                os.environ.pop("CAPYCLI_ARTIFACT_STORE")
+
+        self.assertEqual(len(responses.calls), 1)
+
     def test_is_good_source_file(self) -> None:
         sut = BomDownloadSources()
         self.assertTrue(sut.is_good_source_file("good_file.tar.gz"))
@@ -474,6 +474,75 @@ class TestBomFilter(TestBase):
         self.assertIsNotNone(result, "Should find component by name even without Version")
         self.assertEqual(result.name, "colorama")
 
+    def test_remove_first_match_wins(self) -> None:
+        sut = capycli.bom.filter_bom.FilterBom()
+        sut.verbose = True
+
+        inputfile = os.path.join(os.path.dirname(__file__), "fixtures", self.INPUTFILE1)
+        filterfile = os.path.join(os.path.dirname(__file__), "fixtures", self.FILTERFILE)
+        self.delete_file(filterfile)
+
+        filter: Dict[str, Any] = {"Components": [
+            {"component": {"Name": "t*"}, "Mode": "remove"},
+            {"component": {"Name": "tomli"}, "Mode": "remove"},
+            {"component": {"RepositoryId": "pkg:pypi/wheel@*"}, "Mode": "remove"},
+            {"component": {"Name": "wheel"}, "Mode": "remove"}
+        ]}
+        capycli.common.json_support.write_json_to_file(filter, filterfile)
+
+        bom = CaPyCliBom.read_sbom(inputfile)
+        out = self.capture_stdout(sut.filter_bom, bom, filterfile)
+        self.assertEqual(["colorama", "python"], [c.name for c in bom.components])
+        self.assertTrue("Removing wheel, 0.38.4" in out)
+
+        # only the first matching remove entry has been processed
+        self.assertTrue("No matching entry found for tomli, (all)" in out)
+        self.assertTrue("No matching entry found for wheel, (all)" in out)
+        self.assertFalse("No matching entry found for t*" in out)
+        self.assertFalse("No matching entry found for pkg:pypi/wheel@*" in out)
+
+        self.delete_file(filterfile)
+
+    def test_compiled_filter_cache(self) -> None:
+        sut = capycli.bom.filter_bom.FilterBom()
+
+        inputfile = os.path.join(os.path.dirname(__file__), "fixtures", self.INPUTFILE1)
+        filterfile = os.path.join(os.path.dirname(__file__), "fixtures", self.FILTERFILE)
+        filterfile_include = os.path.join(os.path.dirname(__file__), "fixtures", self.FILTERFILE_INCLUDE)
+        cachefile = filterfile + ".compiled.json"
+        self.delete_file(cachefile)
+
+        capycli.common.json_support.write_json_to_file(
+            {"Components": [{"component": {"Name": "wheel"}, "Mode": "remove"}]}, filterfile_include)
+        capycli.common.json_support.write_json_to_file(
+            {"Include": [self.FILTERFILE_INCLUDE], "Components": []}, filterfile)
+
+        os.environ["CAPYCLI_FILTER_CACHE"] = "1"
+        try:
+            out = self.capture_stdout(sut.filter_bom, CaPyCliBom.read_sbom(inputfile), filterfile)
+            self.assertTrue("Loading filter include" in out)
+            self.assertTrue(os.path.isfile(cachefile))
+
+            bom = CaPyCliBom.read_sbom(inputfile)
+            out = self.capture_stdout(sut.filter_bom, bom, filterfile)
+            self.assertTrue("Using compiled filter" in out)
+            self.assertFalse("Loading filter include" in out)
+            self.assertEqual(3, len(bom.components))
+
+            # a changed include file is loaded again
+            capycli.common.json_support.write_json_to_file(
+                {"Components": [{"component": {"Name": "wheel*"}, "Mode": "remove"},
+                                {"component": {"Name": "tomli"}, "Mode": "remove"}]}, filterfile_include)
+            bom = CaPyCliBom.read_sbom(inputfile)
+            out = self.capture_stdout(sut.filter_bom, bom, filterfile)
+            self.assertTrue("Loading filter include" in out)
+            self.assertEqual(2, len(bom.components))
+        finally:
+            os.environ.pop("CAPYCLI_FILTER_CACHE", None)
+            self.delete_file(cachefile)
+            self.delete_file(filterfile)
+            self.delete_file(filterfile_include)
+
 
 if __name__ == "__main__":
     lib = TestBomFilter()
@@ -43,6 +43,9 @@ class CapycliTestBomMap(unittest.TestCase):
         responses.add(responses.GET, SW360_BASE_URL, json={"status": "ok"})
         self.app.login("sometoken", "https://my.server.com")
 
+    def tearDown(self) -> None:
+        TestBase.delete_file(PurlService.CACHE_FILENAME)
+
     # ---------------------- map_bom_item purl cases ----------------------
 
     @responses.activate
@@ -751,6 +754,55 @@ class CapycliTestBomMap(unittest.TestCase):
         assert res.result == MapResult.FULL_MATCH_BY_HASH
         assert len(res.releases) == 2
 
+    @responses.activate
+    def test_map_bom_to_releases_nocache_parallel(self) -> None:
+        """Parallel online mapping: same result order as the SBOM, shared SW360 responses"""
+        responses.add(responses.GET, SW360_BASE_URL + "components/searchByExternalIds?package-url=",
+                      json={"_embedded": {"sw360:components": []}})
+        responses.add(responses.GET, SW360_BASE_URL + "releases/searchByExternalIds?package-url=",
+                      json={"_embedded": {"sw360:releases": []}})
+        responses.add(responses.GET, SW360_BASE_URL + "components?name=mail",
+                      json={"_embedded": {"sw360:components": [
+                          {"name": "mail", "_links": {"self": {"href": SW360_BASE_URL + "components/b001"}}}]}})
+        responses.add(responses.GET, SW360_BASE_URL + "components/b001",
+                      json={"_embedded": {"sw360:releases": [
+                          {"version": "1.4", "_links": {"self": {"href": SW360_BASE_URL + "releases/1111"}}},
+                          {"version": "1.5", "_links": {"self": {"href": SW360_BASE_URL + "releases/1112"}}}]}})
+        for rel_id, version in [("1111", "1.4"), ("1112", "1.5")]:
+            responses.add(responses.GET, SW360_BASE_URL + "releases/" + rel_id,
+                          json={"name": "mail", "version": version, "_links": {
+                              "self": {"href": SW360_BASE_URL + "releases/" + rel_id},
+                              "sw360:component": {"href": SW360_BASE_URL + "components/b001"}}})
+
+        sbom = Bom()
+        sbom.components.add(Component(name="mail", version="1.4"))
+        sbom.components.add(Component(name="mail", version="1.5"))
+        sbom.components.add(Component(name="mail", version="1.6"))
+
+        self.app.workers = 4
+        results = []
+        out = TestBase.capture_stdout(
+            lambda: results.append(self.app.map_bom_to_releases(sbom, False, False, nocache=True)))
+        res = results[0]
+
+        # the output is in the order of the SBOM components
+        self.assertTrue(out.index("  mail, 1.4") < out.index("  mail, 1.5") < out.index("  mail, 1.6"))
+
+        self.assertEqual(3, len(res))
+        self.assertEqual(["1.4", "1.5", "1.6"], [r.input_component.version for r in res if r.input_component])
+        self.assertEqual(MapResult.FULL_MATCH_BY_NAME_AND_VERSION, res[0].result)
+        self.assertEqual("1111", res[0].releases[0]["Sw360Id"])
+        self.assertEqual(MapResult.FULL_MATCH_BY_NAME_AND_VERSION, res[1].result)
+        self.assertEqual("1112", res[1].releases[0]["Sw360Id"])
+        self.assertEqual(MapResult.NO_MATCH, res[2].result)
+
+        # each resource has been requested only once
+        urls = [call.request.url for call in responses.calls]
+        self.assertEqual(1, urls.count(SW360_BASE_URL + "components?name=mail"))
+        self.assertEqual(1, urls.count(SW360_BASE_URL + "components/b001"))
+        self.assertEqual(1, urls.count(SW360_BASE_URL + "releases/1112"))
+        self.assertIsNone(self.app.response_memo)
+
     @responses.activate
     def test_map_bom_item_nocache_invalid_version(self) -> None:
         bomitem = Component(
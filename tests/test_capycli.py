@@ -6,13 +6,16 @@
 # SPDX-License-Identifier: MIT
 # -------------------------------------------------------------------------------
 
+import math
 import os
 
 from cyclonedx.model.bom_ref import BomRef
 from cyclonedx.model.component import Component
 from sortedcontainers import SortedSet
 
+from capycli.common import json_support
 from capycli.common.capycli_bom_support import CaPyCliBom, SbomCreator, SbomWriter
+from capycli.main.exceptions import CaPyCliException
 from tests.test_base import TestBase
 
 
@@ -121,6 +124,64 @@ class TestCaPyCli(TestBase):
 
         TestCaPyCli.delete_file(filename_out)
 
+    def test_write_compact(self) -> None:
+        filename = os.path.join(os.path.dirname(__file__), "fixtures", TestCaPyCli.INPUTFILE1)
+        sbom = CaPyCliBom.read_sbom(filename)
+        filename_out = os.path.join(
+            os.path.dirname(__file__), "fixtures", TestCaPyCli.OUTPUTFILE)
+
+        os.environ["CAPYCLI_SBOM_COMPACT"] = "1"
+        try:
+            CaPyCliBom.write_sbom(sbom, filename_out)
+        finally:
+            os.environ.pop("CAPYCLI_SBOM_COMPACT", None)
+
+        with open(filename_out, encoding="utf-8") as fin:
+            self.assertEqual(1, len(fin.read().splitlines()))
+        sbom2 = CaPyCliBom.read_sbom(filename_out)
+        self.assert_components(sbom2.components)
+
+        TestCaPyCli.delete_file(filename_out)
+
+    def test_read_sbom_components(self) -> None:
+        filename_out = os.path.join(
+            os.path.dirname(__file__), "fixtures", TestCaPyCli.OUTPUTFILE)
+        json_support.write_json_to_file({
+            "bomFormat": "CycloneDX",
+            "specVersion": "1.6",
+            "components": [
+                {"type": "library", "name": "wheel", "version": "0.34.2", "bom-ref": "wheel"},
+                {"type": "library", "name": "tomli", "bom-ref": "tomli"},
+                {"type": "library", "group": "org.example", "name": "tomli", "version": "1.0", "bom-ref": "g"},
+                {"type": "library", "name": "colorama", "version": "0.4.3", "bom-ref": "colorama-2"},
+                {"type": "library", "name": "colorama", "version": "0.4.3", "bom-ref": "colorama-1"},
+                {"type": "application", "name": "wheel", "version": "0.34.2", "bom-ref": "app"},
+                {"type": "library", "name": "wheel", "version": "0.34.2", "bom-ref": "wheel"}
+            ]
+        }, filename_out, compact=True)
+
+        # same order as the components of the CycloneDX object model
+        sbom = CaPyCliBom.read_sbom(filename_out)
+        components = CaPyCliBom.read_sbom_components(filename_out)
+        self.assertEqual(
+            [(c.group, c.name, c.version, c.bom_ref.value) for c in sbom.components],
+            [(c.get("group"), c["name"], c.get("version"), c["bom-ref"]) for c in components])
+
+        json_support.write_json_to_file(["no", "sbom"], filename_out)
+        with self.assertRaises(CaPyCliException):
+            CaPyCliBom.read_sbom_components(filename_out)
+
+        TestCaPyCli.delete_file(filename_out)
+
+    def test_json_loads(self) -> None:
+        self.assertEqual({"a": [1, "\u00e4"]}, json_support.loads(b'{"a": [1, "\\u00e4"]}'))
+        self.assertTrue(math.isnan(json_support.loads("NaN")))
+        with self.assertRaises(ValueError):
+            json_support.loads("{")
+
+        self.assertEqual('{"a":[1,"\u00e4"]}'.encode("utf-8"), json_support.dumps_compact({"a": [1, "\u00e4"]}))
+        self.assertEqual(b'{"1":2}', json_support.dumps_compact({1: 2}))
+
 
 if __name__ == "__main__":
     lib = TestCaPyCli()
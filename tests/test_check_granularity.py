@@ -10,6 +10,7 @@ import os
 from unittest.mock import mock_open, patch
 
 import responses
+from cyclonedx.model.component import Component
 
 from capycli.bom.check_granularity import CheckGranularity
 from capycli.common.capycli_bom_support import CaPyCliBom, CycloneDxSupport
@@ -187,6 +188,49 @@ component_name;replacement_name;comment;source_url
         self.assertEqual(check_granularity.granularity_list[1].component, '@angular/animations/browser/testing')
         self.assertEqual(check_granularity.granularity_list[1].source_url, 'https://github.com/angular/angular')
 
+    def test_find_match(self) -> None:
+        check_granularity = CheckGranularity()
+        check_granularity.granularity_list = CheckGranularity.parse_granularity_list(
+            "component_name;replacement_name;comment;source_url\n"
+            "# comment\n"
+            "Babel-Core;babel\n"
+            "babel-core;other\n"
+            "invalid\n")
+
+        self.assertEqual(2, len(check_granularity.granularity_list))
+        match = check_granularity.find_match("BABEL-core")
+        if not match:
+            self.fail("Match not found")
+        self.assertEqual("babel", match.replacement)
+        self.assertIsNone(check_granularity.find_match("babel"))
+
+    def test_read_default_granularity_list_once(self) -> None:
+        check_granularity = CheckGranularity()
+        check_granularity.read_granularity_list()
+        self.assertIsNotNone(check_granularity.find_match("@angular/animations/browser"))
+
+        with patch.object(CheckGranularity, "parse_granularity_list") as mock_parse:
+            check_granularity2 = CheckGranularity()
+            check_granularity2.read_granularity_list()
+            mock_parse.assert_not_called()
+        self.assertEqual(len(check_granularity.granularity_list), len(check_granularity2.granularity_list))
+
+    def test_merge_duplicates(self) -> None:
+        check_granularity = CheckGranularity()
+        clist = [
+            Component(name="babel", version="7.0.0"),
+            Component(name="angular", version="16.0.0"),
+            Component(name="babel", version="7.0.0"),
+            Component(name="babel", version="7.1.0")]
+
+        out = self.capture_stdout(check_granularity.merge_duplicates, clist)
+        self.assertTrue("1 items can be reduced by granularity check" in out)
+
+        result = check_granularity.merge_duplicates(clist)
+        self.assertEqual(3, len(result))
+        self.assertIs(clist[0], result[0])
+        self.assertEqual("7.1.0", result[2].version)
+
 
 if __name__ == '__main__':
     APP = TestCheckGranularity()
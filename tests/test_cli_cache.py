@@ -0,0 +1,73 @@
+# -------------------------------------------------------------------------------
+# Copyright (c) 2026 Siemens
+# All Rights Reserved.
+# Author: thomas.graf@siemens.com
+#
+# SPDX-License-Identifier: MIT
+# -------------------------------------------------------------------------------
+
+import os
+import shutil
+import tempfile
+
+from capycli.common.artifact_store import ArtifactStore
+from capycli.common.cli_cache import CliCache, read_cli_data
+from capycli.common.file_support import get_file_sha1
+from tests.test_base import TestBase
+
+
+class TestCliCache(TestBase):
+    CLI_FILE = os.path.join(os.path.dirname(__file__), "fixtures", "CLIXML_clipython-1.3.0.xml")
+
+    def setUp(self) -> None:
+        self.folder = tempfile.mkdtemp()
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.folder, ignore_errors=True)
+        os.environ.pop("CAPYCLI_ARTIFACT_STORE", None)
+
+    def test_read_cli_data(self) -> None:
+        data = read_cli_data(self.CLI_FILE)
+        self.assertIn({"name": "MIT", "spdx_identifier": "MIT"}, data["licenses"])
+        self.assertTrue(len(data["copyrights"]) > 0)
+
+    def test_no_store(self) -> None:
+        os.environ.pop("CAPYCLI_ARTIFACT_STORE", None)
+        sut = CliCache()
+        self.assertIsNone(sut.store)
+        self.assertEqual("", sut.add_file(self.CLI_FILE))
+        self.assertIsNone(sut.find_file(get_file_sha1(self.CLI_FILE)))
+        sut.set_data(get_file_sha1(self.CLI_FILE), {"licenses": []})
+        self.assertIsNone(sut.get_data(get_file_sha1(self.CLI_FILE)))
+
+    def test_add_file_and_data(self) -> None:
+        sut = CliCache(ArtifactStore(self.folder))
+        sha1 = sut.add_file(self.CLI_FILE)
+        self.assertEqual(get_file_sha1(self.CLI_FILE), sha1)
+
+        stored = sut.find_file(sha1.upper())
+        self.assertIsNotNone(stored)
+        if stored:
+            self.assertEqual("CLIXML_clipython-1.3.0.xml", os.path.basename(stored))
+
+        self.assertIsNone(sut.get_data(sha1))
+        data = read_cli_data(self.CLI_FILE)
+        sut.set_data(sha1, data)
+        self.assertEqual(data, sut.get_data(sha1))
+
+        # the parsed data is not taken for the file itself
+        self.assertEqual(stored, sut.find_file(sha1))
+
+    def test_invalid_data(self) -> None:
+        store = ArtifactStore(self.folder)
+        sut = CliCache(store)
+        sha1 = sut.add_file(self.CLI_FILE)
+        with open(os.path.join(store.get_object_folder(sha1), ".cli.json"), "w") as fout:
+            fout.write("{invalid")
+
+        self.assertIsNone(sut.get_data(sha1))
+
+    def test_set_data_unknown_file(self) -> None:
+        sut = CliCache(ArtifactStore(self.folder))
+        sut.set_data("0" * 40, {"licenses": []})
+        self.assertIsNone(sut.get_data("0" * 40))
@@ -0,0 +1,85 @@
+# -------------------------------------------------------------------------------
+# Copyright (c) 2026 Siemens
+# All Rights Reserved.
+# Author: thomas.graf@siemens.com
+#
+# SPDX-License-Identifier: MIT
+# -------------------------------------------------------------------------------
+
+from cyclonedx.model.component import Component
+from packageurl import PackageURL
+
+from capycli.bom.compiled_filter import BomItemIndex, CompiledFilter, PrefixTrie
+from tests.test_base import TestBase
+
+
+class TestCompiledFilter(TestBase):
+    def test_prefix_trie(self) -> None:
+        sut = PrefixTrie()
+        self.assertIsNone(sut.find("abc"))
+
+        sut.add("ab", 3)
+        sut.add("abc", 1)
+        sut.add("ab", 5)
+        self.assertEqual(1, sut.find("abcd"))
+        self.assertEqual(3, sut.find("abx"))
+        self.assertIsNone(sut.find("a"))
+
+        sut.add("", 2)
+        self.assertEqual(2, sut.find("a"))
+        self.assertEqual(1, sut.find("abc"))
+
+    def test_match(self) -> None:
+        entries = [
+            {"component": {"Name": "colorama"}, "Mode": "add"},
+            {"component": {"Name": "python-*"}, "Mode": "remove"},
+            {"component": {"name": "colorama"}, "Mode": "remove"},
+            {"component": {"RepositoryId": "pkg:pypi/tomli*"}, "Mode": "remove"},
+            {"component": {"Name": "python-dateutil"}, "Mode": "remove"},
+            {"component": {"Name": "", "RepositoryId": "pkg:npm/lodash@4.17.21"}, "Mode": "remove"},
+            {"component": {"Name": "tomli", "RepositoryId": "pkg:pypi/six*"}, "Mode": "remove"},
+            {"Mode": "remove"}
+        ]
+        sut = CompiledFilter.compile(entries)
+
+        self.assertEqual(1, sut.match(Component(name="python-dateutil", version="2.8.2")))
+        self.assertEqual(2, sut.match(Component(name="colorama", version="0.4.6")))
+        self.assertEqual(3, sut.match(Component(
+            name="tomli", version="2.0.1", purl=PackageURL.from_string("pkg:pypi/tomli@2.0.1"))))
+        self.assertEqual(5, sut.match(Component(
+            name="lodash", version="4.17.21", purl=PackageURL.from_string("pkg:npm/lodash@4.17.21"))))
+        self.assertIsNone(sut.match(Component(
+            name="six", version="1.16.0", purl=PackageURL.from_string("pkg:pypi/six@1.16.0"))))
+
+        # the compiled filter can be restored
+        sut = CompiledFilter(sut.to_dict())
+        self.assertEqual(1, sut.match(Component(name="python-dateutil", version="2.8.2")))
+        self.assertEqual(6, sut.match(Component(name="tomli", version="2.0.1")))
+
+    def test_match_star(self) -> None:
+        entries = [
+            {"component": {"Name": "*"}, "Mode": "remove"},
+            {"component": {"RepositoryId": "*"}, "Mode": "remove"},
+        ]
+        sut = CompiledFilter.compile(entries)
+
+        self.assertEqual({}, sut.name_prefixes)
+        self.assertEqual({}, sut.purl_prefixes)
+        self.assertIsNone(sut.match(Component(
+            name="tomli", version="2.0.1", purl=PackageURL.from_string("pkg:pypi/tomli@2.0.1"))))
+        self.assertEqual(0, sut.match(Component(name="*", version="1.0")))
+
+    def test_bom_item_index(self) -> None:
+        c1 = Component(name="colorama", version="0.4.5")
+        c2 = Component(name="colorama", version="0.4.6")
+        sut = BomItemIndex([c1, c2])
+
+        self.assertIs(c1, sut.find({"Name": "colorama"}))
+        self.assertIs(c2, sut.find({"Name": "colorama", "Version": "0.4.6"}))
+        self.assertIsNone(sut.find({"Name": "colorama", "Version": "0.4.7"}))
+        self.assertIsNone(sut.find({"Version": "0.4.6"}))
+
+        c1.name = "tomli"
+        sut.update(c1)
+        self.assertIs(c2, sut.find({"Name": "colorama"}))
+        self.assertIs(c1, sut.find({"Name": "tomli", "Version": "0.4.5"}))
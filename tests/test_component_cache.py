@@ -6,6 +6,8 @@
 # SPDX-License-Identifier: MIT
 # -------------------------------------------------------------------------------
 
+import os
+
 import responses
 
 from capycli.common.component_cache import ComponentCacheManagement
@@ -232,6 +234,196 @@ class TestComponentCache(TestBase):
         self.assertIsNotNone(result[0]["ExternalIds"])
         self.assertEqual("pkg:pypi/colorama@0.4.3", result[0]["ExternalIds"]["package-url"])
 
+    @responses.activate
+    def test_refresh_component_cache_delta(self) -> None:
+        sut = ComponentCacheManagement()
+        sut.old_releases = [
+            {"Id": "1111", "Name": "colorama", "Version": "0.4.3", "ComponentId": "c1"},
+            {"Id": "2222", "Name": "tomli", "Version": "2.0.0", "ComponentId": "c2"},
+            {"Id": "9999", "Name": "deleted", "Version": "1.0", "ComponentId": "c9"},
+        ]
+
+        # for login
+        responses.add(
+            responses.GET,
+            url=self.MYURL + "resource/api/",
+            body="{'status': 'ok'}",
+            status=200,
+            content_type="application/json",
+            adding_headers={"Authorization": "Token " + self.MYTOKEN},
+        )
+
+        # list of all releases, without details
+        responses.add(
+            responses.GET,
+            url=self.MYURL + "resource/api/releases",
+            json={"_embedded": {"sw360:releases": [
+                {"name": "colorama", "version": "0.4.3",
+                 "_links": {"self": {"href": self.MYURL + "resource/api/releases/1111"}}},
+                {"name": "tomli", "version": "2.0.1",
+                 "_links": {"self": {"href": self.MYURL + "resource/api/releases/2222"}}},
+                {"name": "wheel", "version": "0.38.4",
+                 "_links": {"self": {"href": self.MYURL + "resource/api/releases/3333"}}},
+            ]}},
+            status=200,
+            content_type="application/json",
+        )
+
+        for rel_id, name, version in [("2222", "tomli", "2.0.1"), ("3333", "wheel", "0.38.4")]:
+            responses.add(
+                responses.GET,
+                url=self.MYURL + "resource/api/releases/" + rel_id,
+                json={"name": name, "version": version, "_links": {
+                    "self": {"href": self.MYURL + "resource/api/releases/" + rel_id},
+                    "sw360:component": {"href": self.MYURL + "resource/api/components/c" + rel_id}}},
+                status=200,
+                content_type="application/json",
+            )
+
+        try:
+            result = sut.refresh_component_cache(
+                self.CACHE_FILE,
+                fast=True,
+                token=self.MYTOKEN,
+                oauth2=False,
+                url=self.MYURL,
+            )
+        finally:
+            self.delete_file(self.CACHE_FILE)
+
+        self.assertEqual(3, len(result))
+        self.assertEqual("1111", result[0]["Id"])
+        self.assertEqual("c1", result[0]["ComponentId"])
+        self.assertEqual("2222", result[1]["Id"])
+        self.assertEqual("2.0.1", result[1]["Version"])
+        self.assertEqual("c2222", result[1]["ComponentId"])
+        self.assertEqual("3333", result[2]["Id"])
+        self.assertEqual("wheel", result[2]["Name"])
+
+    @responses.activate
+    def test_refresh_component_cache_parallel(self) -> None:
+        sut = ComponentCacheManagement()
+        sut.PAGE_SIZE = 2
+
+        # for login
+        responses.add(
+            responses.GET,
+            url=self.MYURL + "resource/api/",
+            body="{'status': 'ok'}",
+            status=200,
+            content_type="application/json",
+            adding_headers={"Authorization": "Token " + self.MYTOKEN},
+        )
+
+        names = ["a", "b", "c", "d", "e"]
+        for page in range(3):
+            page_releases = []
+            for index in range(page * 2, min(page * 2 + 2, len(names))):
+                page_releases.append({
+                    "name": names[index], "version": "1.0",
+                    "_links": {
+                        "self": {"href": self.MYURL + "resource/api/releases/r" + str(index)},
+                        "sw360:component": {"href": self.MYURL + "resource/api/components/c" + str(index)}}})
+            responses.add(
+                responses.GET,
+                url=self.MYURL + "resource/api/releases",
+                match=[responses.matchers.query_param_matcher(
+                    {"allDetails": "true", "page": str(page), "page_entries": "2",
+                     "sort": "name,asc"}, strict_match=False)],
+                json={"_embedded": {"sw360:releases": page_releases},
+                      "page": {"size": 2, "totalElements": 5, "totalPages": 3, "number": page}},
+                status=200,
+                content_type="application/json",
+            )
+
+        try:
+            result = sut.refresh_component_cache(
+                self.CACHE_FILE,
+                fast=True,
+                token=self.MYTOKEN,
+                oauth2=False,
+                url=self.MYURL,
+                workers=3
+            )
+        finally:
+            self.delete_file(self.CACHE_FILE)
+
+        self.assertEqual(names, [r["Name"] for r in result])
+        self.assertEqual("r4", result[4]["Id"])
+        self.assertEqual("c4", result[4]["ComponentId"])
+
+    @responses.activate
+    def test_refresh_component_cache_full_with_old_data(self) -> None:
+        """Without fast, all release details are read even if there is cache data"""
+        sut = ComponentCacheManagement()
+        sut.old_releases = [{"Id": "1111", "Name": "colorama", "Version": "0.4.3", "ComponentId": "c1"}]
+
+        responses.add(
+            responses.GET,
+            url=self.MYURL + "resource/api/",
+            body="{'status': 'ok'}",
+            status=200,
+            content_type="application/json",
+        )
+        responses.add(
+            responses.GET,
+            url=self.MYURL + "resource/api/releases?allDetails=true",
+            json={"_embedded": {"sw360:releases": [
+                {"name": "colorama", "version": "0.4.3", "_links": {
+                    "self": {"href": self.MYURL + "resource/api/releases/1111"},
+                    "sw360:component": {"href": self.MYURL + "resource/api/components/c2"}}},
+            ]}},
+            status=200,
+            content_type="application/json",
+        )
+
+        try:
+            result = sut.refresh_component_cache(
+                self.CACHE_FILE,
+                fast=False,
+                token=self.MYTOKEN,
+                oauth2=False,
+                url=self.MYURL,
+            )
+        finally:
+            self.delete_file(self.CACHE_FILE)
+
+        self.assertEqual(1, len(result))
+        self.assertEqual("c2", result[0]["ComponentId"])
+
+    def test_sqlite_component_cache(self) -> None:
+        json_cache = "dummy_cache2.json"
+        db_cache = "dummy_cache2.db"
+        releases = [
+            {"Id": "1234", "Name": "colorama", "Version": "0.4.3", "ComponentId": "a035",
+             "ExternalIds": {"package-url": "pkg:pypi/colorama@0.4.3"}, "CreatedBy": None,
+             "SourceFile": "colorama-0.4.3.zip", "SourceFileHash": "abcd", "DownloadUrl": "https://x.org"},
+            {"Id": "5678", "Name": "tomli", "Version": "2.0.1", "ComponentId": "a036", "ExternalIds": {}}
+        ]
+        try:
+            ComponentCacheManagement.write_component_cache(json_cache, releases)
+
+            # conversion on first access
+            result = ComponentCacheManagement.read_component_cache(db_cache)
+            self.assertTrue(os.path.isfile(db_cache))
+            self.assertEqual(releases, result)
+
+            # only the fields needed for mapping
+            result = ComponentCacheManagement.read_component_cache(
+                db_cache, ComponentCacheManagement.MATCH_FIELDS)
+            self.assertEqual(2, len(result))
+            self.assertEqual("colorama", result[0]["Name"])
+            self.assertEqual("pkg:pypi/colorama@0.4.3", result[0]["ExternalIds"]["package-url"])
+            self.assertEqual("abcd", result[0]["SourceFileHash"])
+            self.assertNotIn("DownloadUrl", result[0])
+            self.assertNotIn("SourceFile", result[1])
+
+            sut = ComponentCacheManagement()
+            self.assertEqual(2, sut.read_existing_component_cache(db_cache))
+        finally:
+            self.delete_file(json_cache)
+            self.delete_file(db_cache)
+
 
 if __name__ == "__main__":
     APP = TestComponentCache()
@@ -0,0 +1,115 @@
+# -------------------------------------------------------------------------------
+# Copyright (c) 2026 Siemens
+# All Rights Reserved.
+# Author: thomas.graf@siemens.com
+#
+# SPDX-License-Identifier: MIT
+# -------------------------------------------------------------------------------
+
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from typing import Optional, Tuple
+
+from capycli.common.download_support import DownloadScheduler, DownloadTask
+from capycli.common.parallel_support import map_ordered
+from capycli.common.print import print_text
+from tests.test_base import TestBase
+
+
+class TestDownloadSupport(TestBase):
+    @staticmethod
+    def write_file(task: DownloadTask, folder: str) -> Optional[Tuple[str, str]]:
+        if "fail" in task.url:
+            return None
+        data = task.url.encode()
+        path = os.path.join(folder, os.path.basename(task.url))
+        with open(path, "wb") as fout:
+            fout.write(data)
+        task.messages.append((print_text, "    Downloaded " + task.url))
+        return path, hashlib.sha1(data).hexdigest()
+
+    def test_checkpoint(self) -> None:
+        with tempfile.TemporaryDirectory() as folder:
+            calls = []
+
+            def download(task: DownloadTask) -> Optional[Tuple[str, str]]:
+                calls.append(task.url)
+                return self.write_file(task, folder)
+
+            urls = ["https://a.org/one.zip", "https://a.org/fail.zip", "https://b.org/two.zip"]
+            sut = DownloadScheduler(folder)
+            tasks = [sut.execute(DownloadTask(url), download) for url in urls]
+            self.assertEqual([t.ok for t in tasks], [True, False, True])
+            self.assertEqual(sut.downloaded, 2)
+            self.assertEqual(sut.failed, ["https://a.org/fail.zip"])
+            self.assertEqual(tasks[0].messages[0][1], "    Downloaded https://a.org/one.zip")
+
+            # change one file => must get downloaded again
+            with open(os.path.join(folder, "two.zip"), "w") as fout:
+                fout.write("modified")
+
+            calls.clear()
+            sut = DownloadScheduler(folder)
+            tasks = [sut.execute(DownloadTask(url), download) for url in urls]
+            self.assertEqual(calls, ["https://a.org/fail.zip", "https://b.org/two.zip"])
+            self.assertTrue(tasks[0].skipped)
+            self.assertEqual(tasks[0].path, os.path.join(folder, "one.zip"))
+            self.assertEqual(tasks[0].sha1, hashlib.sha1(b"https://a.org/one.zip").hexdigest())
+            self.assertEqual(sut.skipped, 1)
+
+            out = self.capture_stdout(sut.print_summary)
+            self.assertIn("1 files downloaded, 1 files already available, 1 downloads failed", out)
+            self.assertIn("Failed: https://a.org/fail.zip", out)
+
+    def test_no_checkpoint(self) -> None:
+        with tempfile.TemporaryDirectory() as folder:
+            sut = DownloadScheduler(folder, use_checkpoint=False)
+            sut.execute(DownloadTask("https://a.org/one.zip"), lambda t: self.write_file(t, folder))
+            self.assertFalse(os.path.exists(os.path.join(folder, DownloadScheduler.CHECKPOINT_FILE)))
+
+    def test_host_limit(self) -> None:
+        active = {"a.org": 0, "b.org": 0}
+        maximum = {"a.org": 0, "b.org": 0}
+        lock = threading.Lock()
+
+        def download(task: DownloadTask) -> Optional[Tuple[str, str]]:
+            host = task.url.split("/")[2]
+            with lock:
+                active[host] += 1
+                maximum[host] = max(maximum[host], active[host])
+            time.sleep(0.02)
+            with lock:
+                active[host] -= 1
+            return None
+
+        with tempfile.TemporaryDirectory() as folder:
+            sut = DownloadScheduler(folder, max_per_host=2)
+            urls = [f"https://a.org/{i}.zip" for i in range(8)] + ["https://b.org/x.zip"]
+            map_ordered(lambda url: sut.execute(DownloadTask(url), download), urls, 6)
+
+        self.assertLessEqual(maximum["a.org"], 2)
+        self.assertEqual(maximum["b.org"], 1)
+        self.assertEqual(len(sut.failed), 9)
+
+    def test_same_url_downloaded_once(self) -> None:
+        calls = []
+
+        def download(task: DownloadTask) -> Optional[Tuple[str, str]]:
+            calls.append(task.url)
+            time.sleep(0.05)
+            return self.write_file(task, folder)
+
+        with tempfile.TemporaryDirectory() as folder:
+            sut = DownloadScheduler(folder)
+            urls = ["https://a.org/one.zip"] * 4 + ["https://a.org/fail.zip"] * 2
+            tasks = map_ordered(lambda url: sut.execute(DownloadTask(url), download), urls, 6)
+
+            self.assertEqual(sorted(calls), ["https://a.org/fail.zip", "https://a.org/one.zip"])
+            self.assertEqual([t.path for t in tasks[:4]], [os.path.join(folder, "one.zip")] * 4)
+            self.assertEqual(sut.downloaded, 1)
+            self.assertEqual(sut.skipped, 3)
+            self.assertEqual(sut.failed, ["https://a.org/fail.zip"])
+            self.assertFalse(tasks[5].ok)
@@ -351,6 +351,28 @@ class TestFindSources(TestBase):
 
         self.delete_file(args.outputfile)
 
+    @patch('capycli.bom.findsources.FindSources.find_source_url_by_language', return_value="")
+    @patch('capycli.bom.findsources.FindSources.is_sourcefile_accessible', return_value=True)
+    @patch('capycli.common.github_support.GitHubSupport.github_request')
+    def test_find_sources_parallel(self, mock_github_request: Any, mock_accessible: Any,
+                                   mock_by_language: Any) -> None:
+        mock_github_request.side_effect = self.mock_github_request_side_effect
+        inputfile = os.path.join(os.path.dirname(__file__), "fixtures", self.INPUTFILE)
+
+        results = []
+        for workers in (1, 4):
+            sut = FindSources()
+            sut.use_sw360 = False
+            sut.workers = workers
+            sbom = CaPyCliBom.read_sbom(inputfile)
+            out = self.capture_stdout(sut.find_sources, sbom)
+            urls = [str(CycloneDxSupport.get_ext_ref_source_url(c)) for c in sbom.components]
+            results.append((out, urls))
+
+        # same result and same output as processing one SBOM item after the other
+        self.assertEqual(results[0], results[1])
+        self.assertIn("https://github.com/avoidwork/tiny-lru/archive/refs/tags/11.0.1.zip", results[1][1])
+
     def test_normalize_version(self) -> None:
         sut = FindSources()
         param_list = [('We don\'t know', '0.0.0'), ('pre_pr_153572', '0.0.0'), ('1_27_1_1', '1.27.1.1'),
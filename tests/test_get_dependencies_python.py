@@ -317,6 +317,33 @@ class TestGetDependenciesPython(TestBase):
         self.delete_file(self.OUTPUTFILE1)
         self.delete_file(self.OUTPUTFILE2)
 
+    @responses.activate
+    def test_get_metadata_parallel(self) -> None:
+        sut = GetPythonDependencies()
+        sut.workers = 3
+
+        package_list = []
+        for name in ["zeta", "alpha", "mid", "beta"]:
+            package_list.append({"name": name, "version": "1.0"})
+            url = "https://pypi.org/pypi/" + name + "/1.0/json"
+            if name in ("zeta", "beta"):
+                responses.add(responses.GET, url, status=404)
+            else:
+                responses.add(responses.GET, url, json={
+                    "info": {"author": name + " author", "license": "MIT", "summary": "The " + name + " package"}})
+
+        out = self.capture_stdout(sut.convert_package_list, package_list, True)
+        self.assertIn("Meta data problems for 2 of 4 packages", out)
+        self.assertLess(
+            out.index("no meta data available for package zeta, 1.0"),
+            out.index("no meta data available for package beta, 1.0"))
+
+        sbom = sut.convert_package_list(package_list, True)
+        authors = {c.name: c.author for c in sbom.components}
+        self.assertEqual("alpha author", authors["alpha"])
+        self.assertEqual("mid author", authors["mid"])
+        self.assertIsNone(authors["zeta"])
+
     @responses.activate
     def test_get_metadata_invalid_answer(self) -> None:
         # create a test requirements file
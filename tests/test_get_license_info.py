@@ -8,6 +8,8 @@
 
 import os
 import shutil
+import tempfile
+from unittest.mock import MagicMock
 
 import pytest
 import responses
@@ -760,6 +762,39 @@ class TestGetLicenseInfo(TestBase):
         if os.path.isdir(".//cli_files"):
             shutil.rmtree(".//cli_files")
 
+    def test_get_cli_files_from_artifact_store(self) -> None:
+        folder = tempfile.mkdtemp()
+        os.environ["CAPYCLI_ARTIFACT_STORE"] = os.path.join(folder, "store")
+        try:
+            stored_file = os.path.join(folder, "CLIXML_clipython-1.3.0.xml")
+            with open(stored_file, "w", encoding="utf-8") as fout:
+                fout.write(self.get_cli_file_mit())
+
+            sut = GetLicenseInfo()
+            sha1 = sut.cli_cache.add_file(stored_file)
+            sut.client = MagicMock()
+            sut.client.get_id_from_href.side_effect = lambda href: href.split("/")[-1]
+            sut.client.get_attachment_by_url.return_value = {
+                "filename": "CLIXML_clipython-1.3.0.xml",
+                "sha1": sha1,
+                "attachmentType": "COMPONENT_LICENSE_INFO_XML"
+            }
+
+            target = os.path.join(folder, "cli_files")
+            os.makedirs(target)
+            files = sut.get_cli_files_for_release(self.get_release_cli_for_test(), target, False)
+
+            self.assertEqual(2, len(files))
+            sut.client.download_release_attachment.assert_not_called()
+            # the attachment id makes the file names unique
+            self.assertEqual(os.path.join(target, "r002a001_CLIXML_clipython-1.3.0.xml"), files[0]["filename"])
+            self.assertEqual(os.path.join(target, "r002a002_CLIXML_clipython-1.3.0.xml"), files[1]["filename"])
+            with open(files[0]["filename"], encoding="utf-8") as fin:
+                self.assertEqual(self.get_cli_file_mit(), fin.read())
+        finally:
+            os.environ.pop("CAPYCLI_ARTIFACT_STORE", None)
+            shutil.rmtree(folder, ignore_errors=True)
+
 
 if __name__ == '__main__':
     APP = TestGetLicenseInfo()
@@ -0,0 +1,116 @@
+# -------------------------------------------------------------------------------
+# Copyright (c) 2026 Siemens
+# All Rights Reserved.
+# Author: thomas.graf@siemens.com
+#
+# SPDX-License-Identifier: MIT
+# -------------------------------------------------------------------------------
+
+import os
+import shutil
+import tempfile
+import time
+from unittest.mock import patch
+
+import responses
+
+from capycli.bom.findsources import FindSources
+from capycli.common.github_cache import GitHubCache, get_github_cache
+from capycli.common.github_support import GitHubSupport
+from capycli.common.response_cache import ResponseCache
+from tests.test_base import TestBase
+
+
+class TestGitHubCache(TestBase):
+    REPO_URL = "https://api.github.com/repos/hukkin/tomli"
+    TAGS_URL = REPO_URL + "/tags"
+
+    def setUp(self) -> None:
+        self.folder = tempfile.mkdtemp()
+        GitHubSupport.reset()
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.folder, ignore_errors=True)
+        os.environ.pop("CAPYCLI_HTTP_CACHE", None)
+        os.environ.pop("CAPYCLI_HTTP_OFFLINE", None)
+        GitHubSupport.reset()
+
+    def add_github_responses(self) -> None:
+        responses.get(self.REPO_URL, json={
+            "full_name": "hukkin/tomli",
+            "tags_url": self.TAGS_URL,
+            "git_refs_url": self.REPO_URL + "/git/refs{/sha}"
+        })
+        responses.get(self.TAGS_URL + "?per_page=100", json=[
+            {"name": "2.0.1", "zipball_url": self.REPO_URL + "/zipball/refs/tags/2.0.1"},
+            {"name": "2.0.0", "zipball_url": self.REPO_URL + "/zipball/refs/tags/2.0.0"}
+        ])
+
+    def test_no_cache(self) -> None:
+        self.assertIsNone(get_github_cache())
+        os.environ["CAPYCLI_HTTP_CACHE"] = self.folder
+        self.assertIsNotNone(get_github_cache())
+
+    def test_source_url(self) -> None:
+        sut = GitHubCache(ResponseCache(self.folder, ttl=60))
+        self.assertIsNone(sut.get_source_url("hukkin/tomli", "2.0.1"))
+
+        sut.set_source_url("hukkin/tomli", "2.0.1", None, "https://github.com/hukkin/tomli/archive/2.0.1.zip")
+        sut.set_source_url("hukkin/tomli", "9.9.9", None, "")
+        self.assertEqual("https://github.com/hukkin/tomli/archive/2.0.1.zip",
+                         sut.get_source_url("hukkin/tomli", "2.0.1"))
+        self.assertEqual("", sut.get_source_url("hukkin/tomli", "9.9.9"))
+        self.assertIsNone(sut.get_source_url("hukkin/tomli", "2.0.1", "v"))
+
+        # results that have not been found expire with the TTL of the cache
+        with patch("time.time", return_value=time.time() + 120):
+            self.assertIsNone(sut.get_source_url("hukkin/tomli", "9.9.9"))
+            self.assertIsNotNone(sut.get_source_url("hukkin/tomli", "2.0.1"))
+
+        with patch("time.time", return_value=time.time() + GitHubCache.SOURCE_URL_TTL + 1):
+            self.assertIsNone(sut.get_source_url("hukkin/tomli", "2.0.1"))
+
+    @responses.activate
+    def test_find_sources_uses_cache(self) -> None:
+        os.environ["CAPYCLI_HTTP_CACHE"] = self.folder
+        self.add_github_responses()
+
+        sut = FindSources()
+        self.assertEqual("https://github.com/hukkin/tomli/archive/refs/tags/2.0.1.zip",
+                         sut.get_matching_source_url("2.0.1", "hukkin/tomli"))
+        self.assertEqual("", sut.get_matching_source_url("3.0.0", "hukkin/tomli"))
+        calls = len(responses.calls)
+
+        # a new run does not need to ask GitHub again
+        sut = FindSources()
+        self.assertEqual("https://github.com/hukkin/tomli/archive/refs/tags/2.0.1.zip",
+                         sut.get_matching_source_url("2.0.1", "hukkin/tomli"))
+        self.assertEqual("", sut.get_matching_source_url("3.0.0", "hukkin/tomli"))
+        self.assertEqual(calls, len(responses.calls))
+
+        # the tags of a new version are found in the cached tag page
+        self.assertEqual("https://github.com/hukkin/tomli/archive/refs/tags/2.0.0.zip",
+                         sut.get_matching_source_url("2.0.0", "hukkin/tomli"))
+        self.assertEqual(calls, len(responses.calls))
+
+    @responses.activate
+    def test_failed_tag_search_is_not_cached(self) -> None:
+        os.environ["CAPYCLI_HTTP_CACHE"] = self.folder
+        responses.get(self.REPO_URL, json={
+            "full_name": "hukkin/tomli",
+            "tags_url": self.TAGS_URL,
+            "git_refs_url": self.REPO_URL + "/git/refs{/sha}"
+        })
+        responses.get(self.TAGS_URL + "?per_page=100", status=502, json={"message": "Server Error"})
+
+        sut = FindSources()
+        self.assertEqual("", sut.get_matching_source_url("2.0.1", "hukkin/tomli"))
+        self.assertIsNone(sut.github_cache.get_source_url("hukkin/tomli", "2.0.1"))  # type: ignore
+
+        # the next run asks GitHub again
+        responses.replace(responses.GET, self.TAGS_URL + "?per_page=100", json=[
+            {"name": "2.0.1", "zipball_url": self.REPO_URL + "/zipball/refs/tags/2.0.1"}
+        ])
+        sut = FindSources()
+        self.assertEqual("https://github.com/hukkin/tomli/archive/refs/tags/2.0.1.zip",
+                         sut.get_matching_source_url("2.0.1", "hukkin/tomli"))
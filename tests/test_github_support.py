@@ -6,7 +6,20 @@
 # SPDX-License-Identifier: MIT
 # -------------------------------------------------------------------------------
 
-from capycli.common.github_support import GitHubSupport
+import os
+import time
+from unittest.mock import patch
+
+import requests
+import responses
+from responses import matchers
+
+from capycli.common.github_support import (
+    CONNECTION_RETRY_WAIT,
+    MAX_RATE_LIMIT_RETRIES,
+    RATE_LIMIT_WAIT,
+    GitHubSupport,
+)
 from tests.test_base import TestBase
 
 
@@ -15,6 +28,13 @@ class GitHubSupportHtml(TestBase):
     INPUTFILE1 = "sbom.siemens.capycli.json"
     OUTPUTFILE = "test.html"
 
+    def setUp(self) -> None:
+        GitHubSupport.reset()
+
+    def tearDown(self) -> None:
+        GitHubSupport.reset()
+        os.environ.pop("CAPYCLI_GITHUB_TOKENS", None)
+
     def test_get_repositories(self) -> None:
         actual = GitHubSupport.get_repositories("capycli", "python")
         self.assertIsNotNone(actual, "GitHub request failed")
@@ -77,6 +97,106 @@ class GitHubSupportHtml(TestBase):
         if license_name != "Apache License 2.0":
             self.fail("No license name found")
 
+    @responses.activate
+    def test_rate_limit_wait(self) -> None:
+        url = "https://api.github.com/repos/sw360/capycli"
+        responses.get(url, status=429, json={})
+        responses.get(url, status=200, json={"name": "capycli"})
+
+        with patch("time.sleep") as sleep:
+            actual = GitHubSupport.github_request(url)
+
+        self.assertEqual({"name": "capycli"}, actual)
+        sleep.assert_called_once()
+        self.assertAlmostEqual(RATE_LIMIT_WAIT, sleep.call_args.args[0], delta=1)
+        self.assertEqual(1, GitHubSupport.get_counters().rate_limited)
+
+    @responses.activate
+    def test_rate_limit_wait_until_reset(self) -> None:
+        url = "https://api.github.com/repos/sw360/capycli/tags"
+        reset = time.time() + 10
+        responses.get(url, status=403, json={"message": "API rate limit exceeded for 1.2.3.4."},
+                      headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(int(reset))})
+        responses.get(url, status=200, json=[], headers={"X-RateLimit-Remaining": "59"})
+
+        with patch("time.sleep") as sleep:
+            actual = GitHubSupport.github_request(url)
+
+        self.assertEqual([], actual)
+        sleep.assert_called_once()
+        self.assertTrue(8 <= sleep.call_args.args[0] <= 10)
+
+    @responses.activate
+    def test_rate_limit_retries(self) -> None:
+        url = "https://api.github.com/repos/sw360/capycli/tags"
+        responses.get(url, status=429, json={})
+
+        with patch("time.sleep") as sleep:
+            response = GitHubSupport.github_request(url, return_response=True)
+
+        self.assertEqual(429, response.status_code)
+        self.assertEqual(MAX_RATE_LIMIT_RETRIES + 1, len(responses.calls))
+        self.assertEqual(MAX_RATE_LIMIT_RETRIES, sleep.call_count)
+
+    @responses.activate
+    def test_connection_error_retries(self) -> None:
+        url = "https://api.github.com/repos/sw360/capycli"
+        responses.get(url, body=requests.exceptions.ConnectionError("refused"))
+        responses.get(url, status=302, headers={"Location": url + "/moved"})
+
+        with patch("time.sleep") as sleep:
+            response = GitHubSupport.github_request(url, return_response=True, allow_redirects=False)
+
+        # retried with backoff, without following the redirect
+        self.assertEqual(302, response.status_code)
+        self.assertEqual(2, len(responses.calls))
+        sleep.assert_called_once_with(CONNECTION_RETRY_WAIT)
+
+        # the number of retries is limited
+        responses.replace(responses.GET, url, body=requests.exceptions.ConnectionError("refused"))
+        with patch("time.sleep") as sleep:
+            actual = GitHubSupport.github_request(url)
+
+        self.assertIn("exception", actual)
+        self.assertEqual(MAX_RATE_LIMIT_RETRIES, sleep.call_count)
+        self.assertEqual(CONNECTION_RETRY_WAIT * 2 ** (MAX_RATE_LIMIT_RETRIES - 1), sleep.call_args.args[0])
+
+    @responses.activate
+    def test_token_pool(self) -> None:
+        os.environ["CAPYCLI_GITHUB_TOKENS"] = "token2, token1,"
+        self.assertEqual(["token1", "token2"], GitHubSupport.get_token_pool("token1"))
+        self.assertEqual(["token2", "token1"], GitHubSupport.get_token_pool(""))
+
+        url = "https://api.github.com/repos/sw360/capycli"
+        reset = str(int(time.time() + 3600))
+        responses.get(url, json={}, headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": reset},
+                      match=[matchers.header_matcher({"Authorization": "token token1"})])
+        responses.get(url, json={}, headers={"X-RateLimit-Remaining": "4000", "X-RateLimit-Reset": reset},
+                      match=[matchers.header_matcher({"Authorization": "token token2"})])
+
+        # every token gets used, then the one with the most remaining requests
+        tokens = []
+        for _ in range(3):
+            GitHubSupport.github_request(url, token="token1")
+            tokens.append(responses.calls[-1].request.headers["Authorization"])
+        self.assertEqual(["token token1", "token token2", "token token2"], tokens)
+
+    @responses.activate
+    def test_conditional_request(self) -> None:
+        url = "https://api.github.com/repos/sw360/capycli"
+        responses.get(url, status=304, match=[
+            lambda request: (request.headers.get("If-None-Match") == '"abc"', "")])
+        responses.get(url, json={"name": "capycli"}, headers={"ETag": '"abc"'})
+
+        self.assertEqual({"name": "capycli"}, GitHubSupport.github_request(url))
+        self.assertEqual({"name": "capycli"}, GitHubSupport.github_request(url))
+
+        counters = GitHubSupport.get_counters()
+        self.assertEqual(2, counters.requests)
+        self.assertEqual(1, counters.not_modified)
+        self.assertNotIn("If-None-Match", responses.calls[0].request.headers)
+        self.assertEqual('"abc"', responses.calls[1].request.headers["If-None-Match"])
+
 
 if __name__ == "__main__":
     APP = GitHubSupportHtml()
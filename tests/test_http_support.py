@@ -0,0 +1,236 @@
+# -------------------------------------------------------------------------------
+# Copyright (c) 2026 Siemens
+# All Rights Reserved.
+# Author: thomas.graf@siemens.com
+#
+# SPDX-License-Identifier: MIT
+# -------------------------------------------------------------------------------
+
+import hashlib
+import json
+import os
+import tempfile
+from unittest.mock import patch
+
+import requests
+import responses
+from urllib3.exceptions import MaxRetryError, NewConnectionError, ProtocolError
+
+from capycli.common import http_support
+from tests.test_base import TestBase
+
+
+class TestHttpSupport(TestBase):
+    def tearDown(self) -> None:
+        http_support.close_sessions()
+        os.environ.pop("CAPYCLI_HTTP_RETRIES", None)
+        os.environ.pop("CAPYCLI_HTTP_TIMEOUT", None)
+
+    def test_get_session_per_host(self) -> None:
+        s1 = http_support.get_session("https://pypi.org/pypi/a/1.0/json")
+        s2 = http_support.get_session("https://PyPI.org/pypi/b/2.0/json")
+        s3 = http_support.get_session("https://registry.npmjs.org/a")
+        self.assertIs(s1, s2)
+        self.assertIsNot(s1, s3)
+
+    def test_get_retry_delay(self) -> None:
+        self.assertEqual(http_support.get_retry_delay(None, 0), 1.0)
+        self.assertEqual(http_support.get_retry_delay(None, 2), 4.0)
+        self.assertEqual(http_support.get_retry_delay(None, 20), http_support.MAX_BACKOFF)
+
+        response = requests.Response()
+        response.headers["Retry-After"] = "7"
+        self.assertEqual(http_support.get_retry_delay(response, 0), 7.0)
+
+        response.headers["Retry-After"] = "Wed, 21 Oct 2015 07:28:00 GMT"
+        self.assertEqual(http_support.get_retry_delay(response, 0), 0.0)
+
+        response.headers["Retry-After"] = "invalid"
+        self.assertEqual(http_support.get_retry_delay(response, 1), 2.0)
+
+    @responses.activate
+    def test_get_retries_temporary_errors(self) -> None:
+        url = "https://pypi.org/pypi/chardet/3.0.4/json"
+        responses.add(responses.GET, url, status=429, headers={"Retry-After": "3"})
+        responses.add(responses.GET, url, status=503)
+        responses.add(responses.GET, url, json={"info": {}}, status=200)
+
+        with patch("time.sleep") as sleep:
+            response = http_support.get(url)
+
+        self.assertTrue(response.ok)
+        self.assertEqual(len(responses.calls), 3)
+        self.assertEqual([c.args[0] for c in sleep.call_args_list], [3.0, 2.0])
+
+    @responses.activate
+    def test_get_gives_up(self) -> None:
+        os.environ["CAPYCLI_HTTP_RETRIES"] = "1"
+        url = "https://crates.io/api/v1/crates/x/1.0"
+        responses.add(responses.GET, url, status=503)
+
+        with patch("time.sleep"):
+            response = http_support.get(url)
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(len(responses.calls), 2)
+
+    @responses.activate
+    def test_get_no_retry_on_client_error(self) -> None:
+        url = "https://registry.npmjs.org/unknown"
+        responses.add(responses.GET, url, status=404)
+
+        with patch("time.sleep") as sleep:
+            response = http_support.get(url)
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(len(responses.calls), 1)
+        sleep.assert_not_called()
+
+    @responses.activate
+    def test_connection_error(self) -> None:
+        os.environ["CAPYCLI_HTTP_RETRIES"] = "2"
+        url = "https://api.nuget.org/v3-flatcontainer/x/1.0/x.nuspec"
+        responses.add(responses.GET, url, body=requests.ConnectionError(
+            ProtocolError("Connection aborted.", ConnectionResetError())))
+
+        with patch("time.sleep") as sleep:
+            with self.assertRaises(requests.ConnectionError):
+                http_support.get(url)
+
+        self.assertEqual(sleep.call_count, 2)
+        self.assertEqual(len(responses.calls), 3)
+
+    @responses.activate
+    def test_no_retry_if_connection_impossible(self) -> None:
+        url = "https://unknown.example.com/x"
+        responses.add(responses.GET, url, body=requests.ConnectionError("unittest"))
+
+        with patch("time.sleep") as sleep:
+            with self.assertRaises(requests.ConnectionError):
+                http_support.get(url)
+
+        sleep.assert_not_called()
+        self.assertEqual(len(responses.calls), 1)
+
+    def test_is_temporary_error(self) -> None:
+        self.assertTrue(http_support.is_temporary_error(requests.ReadTimeout()))
+        self.assertTrue(http_support.is_temporary_error(requests.ConnectionError(
+            MaxRetryError(None, "/", ProtocolError("Connection aborted.")))))  # type: ignore
+        self.assertFalse(http_support.is_temporary_error(requests.ConnectionError(
+            MaxRetryError(None, "/", NewConnectionError(None, "refused")))))  # type: ignore
+
+    @responses.activate
+    def test_timeout_and_head(self) -> None:
+        os.environ["CAPYCLI_HTTP_TIMEOUT"] = "5"
+        url = "https://github.com/x/y/archive/v1.0.zip"
+        responses.add(responses.HEAD, url, status=200)
+
+        response = http_support.head(url, allow_redirects=True)
+        self.assertTrue(response.ok)
+        self.assertEqual(responses.calls[0].request.req_kwargs["timeout"], 5.0)  # type: ignore
+
+    @responses.activate
+    def test_download_file(self) -> None:
+        url = "https://github.com/x/y/archive/v1.0.tar.gz"
+        data = b"0123456789" * 1000
+        responses.add(responses.GET, url, body=data)
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "y-1.0.tar.gz")
+            sha1 = http_support.download_file(http_support.get(url, stream=True), path)
+            self.assertEqual(sha1, hashlib.sha1(data).hexdigest())
+            with open(path, "rb") as fin:
+                self.assertEqual(fin.read(), data)
+            self.assertFalse(os.path.exists(path + http_support.PART_SUFFIX))
+
+    def test_file_lock(self) -> None:
+        lock = http_support.get_file_lock(os.path.join("folder", "file.zip"))
+        self.assertIs(lock, http_support.get_file_lock(os.path.join("folder", "sub", "..", "file.zip")))
+        self.assertIsNot(lock, http_support.get_file_lock(os.path.join("folder", "other.zip")))
+
+    @responses.activate
+    def test_download_file_resume(self) -> None:
+        url = "https://github.com/x/y/archive/v1.0.tar.gz"
+        data = b"0123456789" * 1000
+        responses.add(
+            responses.GET, url, body=data[4000:], status=206,
+            headers={"Content-Range": f"bytes 4000-{len(data) - 1}/{len(data)}"},
+            match=[lambda request: (
+                request.headers.get("Range") == "bytes=4000-" and request.headers.get("If-Range") == '"v1"', "")])
+        responses.add(responses.GET, url, body=data, headers={"Accept-Ranges": "bytes", "ETag": '"v1"'})
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "y-1.0.tar.gz")
+            with open(path + http_support.PART_SUFFIX, "wb") as fout:
+                fout.write(data[:4000])
+            self.write_part_info(path, url, '"v1"')
+
+            sha1 = http_support.download_file(http_support.get(url, stream=True), path)
+            self.assertEqual(sha1, hashlib.sha1(data).hexdigest())
+            with open(path, "rb") as fin:
+                self.assertEqual(fin.read(), data)
+            self.assertEqual(len(responses.calls), 2)
+            self.assertFalse(os.path.exists(path + http_support.PART_INFO_SUFFIX))
+
+    @staticmethod
+    def write_part_info(path: str, url: str, validator: str) -> None:
+        with open(path + http_support.PART_INFO_SUFFIX, "w", encoding="utf-8") as fout:
+            json.dump({"url": url, "validator": validator}, fout)
+
+    @responses.activate
+    def test_download_file_resume_changed(self) -> None:
+        url = "https://github.com/x/y/archive/v1.0.tar.gz"
+        data = b"0123456789" * 1000
+        # the partial file has been downloaded with validator v0, the document has changed since
+        responses.add(
+            responses.GET, url, body=data[4000:], status=206,
+            headers={"Content-Range": f"bytes 4000-{len(data) - 1}/{len(data)}"},
+            match=[lambda request: (request.headers.get("If-Range") == '"v1"', "")])
+        responses.add(
+            responses.GET, url, body=data,
+            match=[lambda request: (request.headers.get("If-Range") == '"v0"', "")])
+        responses.add(responses.GET, url, body=data, headers={"Accept-Ranges": "bytes", "ETag": '"v1"'})
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "y-1.0.tar.gz")
+            with open(path + http_support.PART_SUFFIX, "wb") as fout:
+                fout.write(b"old" * 1000)
+            self.write_part_info(path, url, '"v0"')
+
+            sha1 = http_support.download_file(http_support.get(url, stream=True), path)
+            self.assertEqual(sha1, hashlib.sha1(data).hexdigest())
+            with open(path, "rb") as fin:
+                self.assertEqual(fin.read(), data)
+
+    @responses.activate
+    def test_download_file_other_url(self) -> None:
+        # a partial file of another URL is never resumed
+        url = "https://github.com/x/y/archive/v1.0.tar.gz"
+        data = b"0123456789" * 1000
+        responses.add(responses.GET, url, body=data, headers={"Accept-Ranges": "bytes", "ETag": '"v1"'})
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "y-1.0.tar.gz")
+            with open(path + http_support.PART_SUFFIX, "wb") as fout:
+                fout.write(data[:4000])
+            self.write_part_info(path, "https://example.com/y-1.0.tar.gz", '"v1"')
+
+            sha1 = http_support.download_file(http_support.get(url, stream=True), path)
+            self.assertEqual(sha1, hashlib.sha1(data).hexdigest())
+            self.assertEqual(len(responses.calls), 1)
+
+    @responses.activate
+    def test_download_file_restart(self) -> None:
+        # no validator => the partial file cannot be trusted
+        url = "https://github.com/x/y/archive/v1.0.tar.gz"
+        data = b"0123456789" * 1000
+        responses.add(responses.GET, url, body=data, headers={"Accept-Ranges": "bytes"})
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "y-1.0.tar.gz")
+            with open(path + http_support.PART_SUFFIX, "wb") as fout:
+                fout.write(b"garbage")
+
+            sha1 = http_support.download_file(http_support.get(url, stream=True), path)
+            self.assertEqual(sha1, hashlib.sha1(data).hexdigest())
+            self.assertEqual(len(responses.calls), 1)
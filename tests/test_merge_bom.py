@@ -8,8 +8,10 @@
 
 import os
 
+from cyclonedx.model.component import Component
+
 from capycli.bom.merge_bom import MergeBom
-from capycli.common.capycli_bom_support import CaPyCliBom, CycloneDxSupport
+from capycli.common.capycli_bom_support import CaPyCliBom, CycloneDxSupport, SbomCreator
 from capycli.main.result_codes import ResultCode
 from tests.test_base import AppArguments, TestBase
 
@@ -209,6 +211,76 @@ class TestMergeBom(TestBase):
 
         self.delete_file(outputfile)
 
+    def test_merge_all_boms_dependencies(self) -> None:
+        sut = MergeBom()
+
+        app = Component(name="app", version="1.0", bom_ref="app")
+        lib = Component(name="lib", version="2.0", bom_ref="lib-a")
+        bom1 = SbomCreator.create([app, lib])
+        bom1.register_dependency(app, [lib])
+
+        # the same library with another bom-ref
+        service = Component(name="service", version="1.0", bom_ref="service")
+        lib2 = Component(name="lib", version="2.0", bom_ref="lib-b")
+        bom2 = SbomCreator.create([service, lib2])
+        bom2.register_dependency(service, [lib2])
+
+        tool = Component(name="tool", version="3.0", bom_ref="tool")
+        lib3 = Component(name="lib", version="2.0", bom_ref="lib-c")
+        bom3 = SbomCreator.create([tool, lib3])
+        bom3.register_dependency(lib3, [tool])
+
+        result = sut.merge_all_boms(bom1, [bom2, bom3])
+        self.assertEqual(["app", "lib", "service", "tool"], [c.name for c in result.components])
+
+        # all dependencies refer to the component of the first SBOM
+        deps = {str(d.ref): sorted(str(c.ref) for c in d.dependencies) for d in result.dependencies}
+        self.assertEqual({
+            "app": ["lib-a"],
+            "lib-a": ["tool"],
+            "service": ["lib-a"],
+            "tool": []}, deps)
+
+    def test_merge_multiple_boms(self) -> None:
+        sut = MergeBom()
+
+        # create argparse command line argument object
+        args = AppArguments()
+        args.command = []
+        args.command.append("bom")
+        args.command.append("merge")
+        args.command.append(os.path.join(os.path.dirname(__file__), "fixtures", self.INPUTFILE1))
+        args.command.append(os.path.join(os.path.dirname(__file__), "fixtures", self.INPUTFILE2))
+        args.command.append(os.path.join(os.path.dirname(__file__), "fixtures", self.INPUTFILE1))
+        args.outputfile = self.OUTPUTFILE
+
+        out = self.capture_stdout(sut.run, args)
+        self.assertTrue("Loading first SBOM file" in out)
+        self.assertTrue("Loading second SBOM file" in out)
+        self.assertTrue("Loading SBOM file 3" in out)
+        self.assertTrue("Writing combined SBOM with 2 components to" in out)
+
+        bom = CaPyCliBom.read_sbom(self.OUTPUTFILE)
+        self.assertEqual(2, len(bom.components))
+        self.assertEqual("2022.12.7", bom.components[0].version)
+        self.assertEqual("2022.12.999", bom.components[1].version)
+
+        self.delete_file(self.OUTPUTFILE)
+
+    def test_merge_multiple_boms_without_output(self) -> None:
+        sut = MergeBom()
+
+        args = AppArguments()
+        args.command = ["bom", "merge"]
+        for filename in [self.INPUTFILE1, self.INPUTFILE2, self.INPUTFILE1, self.INPUTFILE2]:
+            args.command.append(os.path.join(os.path.dirname(__file__), "fixtures", filename))
+
+        try:
+            self.capture_stdout(sut.run, args)
+            self.assertTrue(False, "Failed to report missing output file")
+        except SystemExit as ex:
+            self.assertEqual(ResultCode.RESULT_COMMAND_ERROR, ex.code)
+
 
 if __name__ == '__main__':
     APP = TestMergeBom()
@@ -0,0 +1,99 @@
+# -------------------------------------------------------------------------------
+# Copyright (c) 2026 Siemens
+# All Rights Reserved.
+# Author: thomas.graf@siemens.com
+#
+# SPDX-License-Identifier: MIT
+# -------------------------------------------------------------------------------
+
+import threading
+import time
+
+from capycli.common.parallel_support import (
+    KeyedLocks,
+    get_worker_count,
+    imap_ordered,
+    imap_ordered_output,
+    map_ordered
+)
+from tests.test_base import AppArguments, TestBase
+
+
+class TestParallelSupport(TestBase):
+    def test_get_worker_count(self) -> None:
+        args = AppArguments()
+        self.assertEqual(1, get_worker_count(args))
+
+        args.workers = 8
+        self.assertEqual(8, get_worker_count(args))
+
+        args.workers = -3
+        self.assertEqual(1, get_worker_count(args))
+
+        self.assertEqual(1, get_worker_count(object()))
+
+    def test_map_ordered_keeps_order(self) -> None:
+        def slow_square(value: int) -> int:
+            # later items finish first
+            time.sleep((10 - value) * 0.002)
+            return value * value
+
+        self.assertEqual([v * v for v in range(10)], map_ordered(slow_square, range(10), 4))
+        self.assertEqual([v * v for v in range(10)], map_ordered(slow_square, range(10), 1))
+
+    def test_imap_ordered_raises_exceptions(self) -> None:
+        def fail_on_three(value: int) -> int:
+            if value == 3:
+                raise ValueError("three")
+            return value
+
+        results = []
+        with self.assertRaises(ValueError):
+            for value in imap_ordered(fail_on_three, range(6), 2):
+                results.append(value)
+        self.assertEqual([0, 1, 2], results)
+
+    def test_imap_ordered_output(self) -> None:
+        def slow_print(value: int) -> int:
+            print("start", value)
+            time.sleep((6 - value) * 0.002)
+            print("end", value)
+            if value == 4:
+                raise ValueError("four")
+            return value
+
+        results = []
+
+        def consume() -> None:
+            with self.assertRaises(ValueError):
+                for value in imap_ordered_output(slow_print, range(6), 3):
+                    results.append(value)
+                    print("result", value)
+
+        out = self.capture_stdout(consume)
+        self.assertEqual([0, 1, 2, 3], results)
+        expected = "".join(f"start {v}\nend {v}\nresult {v}\n" for v in range(4)) + "start 4\nend 4\n"
+        self.assertEqual(expected, out)
+
+    def test_keyed_locks(self) -> None:
+        sut = KeyedLocks()
+        self.assertIs(sut.get("a"), sut.get("a"))
+        self.assertIsNot(sut.get("a"), sut.get("b"))
+
+        active = []
+        overlaps = []
+
+        def work(key: str) -> None:
+            with sut.get(key):
+                if key in active:
+                    overlaps.append(key)
+                active.append(key)
+                time.sleep(0.005)
+                active.remove(key)
+
+        threads = [threading.Thread(target=work, args=(key,)) for key in "aabba"]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual([], overlaps)
@@ -6,6 +6,9 @@
 # SPDX-License-Identifier: MIT
 # -------------------------------------------------------------------------------
 
+import json
+import os
+import time
 import unittest
 from typing import Any, Dict, List
 
@@ -15,7 +18,7 @@ from packageurl import PackageURL
 from capycli.bom.map_bom import MapBom
 from capycli.common.map_result import MapResultByIdQualifiers
 from capycli.common.purl_service import PurlService
-from tests.test_base import SW360_BASE_URL
+from tests.test_base import SW360_BASE_URL, TestBase
 
 sw360_purl_releases: List[Dict[str, Any]] = [
     {
@@ -244,6 +247,55 @@ class TestPurlService(unittest.TestCase):
         purl_service.build_purl_cache()
         assert "2.0.0" not in purl_service.purl_cache["gem"][None]["mini_portile2"]
 
+    @responses.activate
+    def test_purl_cachefile(self) -> None:
+        cachefile = "test_purl_cache.json"
+        try:
+            self.purl_build_cache_with_file(cachefile)
+            self.assertTrue(os.path.isfile(cachefile))
+
+            # second run: no SW360 access needed
+            responses.reset()
+            assert self.app.client is not None
+            purl_service = PurlService(self.app.client, cachefile=cachefile)
+            purl_service.build_purl_cache(("deb",))
+            assert purl_service.purl_cache["deb"]["debian"]["sed"][None][0]["href"] == sw360_purl_components[0]["_links"]["self"]["href"] # noqa
+            assert "gem" not in purl_service.purl_cache
+            purl_service.build_purl_cache(("gem",))
+            assert purl_service.purl_cache["gem"][None]["mini_portile2"]["2.4.0"][0]["href"] == sw360_purl_releases[1]["_links"]["self"]["href"] # noqa
+            assert len(purl_service.purl_cache["deb"]["debian"]["sed"][None]) == 1
+
+            # outdated cache file
+            with open(cachefile) as fin:
+                data = json.load(fin)
+            data["timestamp"] = time.time() - PurlService.CACHE_TTL - 1
+            with open(cachefile, "w") as fout:
+                json.dump(data, fout)
+            purl_service = PurlService(self.app.client, cachefile=cachefile)
+            self.assertIsNone(purl_service.read_purl_cachefile())
+
+            # forced refresh
+            purl_service = PurlService(self.app.client, cachefile=cachefile, refresh=True)
+            with self.assertRaises(Exception):
+                purl_service.build_purl_cache()
+        finally:
+            TestBase.delete_file(cachefile)
+
+    def purl_build_cache_with_file(self, cachefile: str) -> None:
+        responses.add(
+            responses.GET,
+            SW360_BASE_URL + "releases/searchByExternalIds?package-url=",
+            json={"_embedded": {"sw360:releases": sw360_purl_releases}})
+        responses.add(
+            responses.GET,
+            SW360_BASE_URL + "components/searchByExternalIds?package-url=",
+            json={"_embedded": {"sw360:components": sw360_purl_components}})
+
+        assert self.app.client is not None
+        purl_service = PurlService(self.app.client, cachefile=cachefile)
+        purl_service.build_purl_cache()
+        assert purl_service.purl_cache["gem"][None]["mini_portile2"][None][0]["href"] == sw360_purl_components[1]["_links"]["self"]["href"] # noqa
+
     @responses.activate
     def test_purl_search_release(self) -> None:
         purl_service = self.purl_build_cache()
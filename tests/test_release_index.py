@@ -0,0 +1,83 @@
+# -------------------------------------------------------------------------------
+# Copyright (c) 2026 Siemens
+# All Rights Reserved.
+# Author: thomas.graf@siemens.com
+#
+# SPDX-License-Identifier: MIT
+# -------------------------------------------------------------------------------
+
+from typing import Any, Dict, List
+
+from cyclonedx.model import ExternalReference, ExternalReferenceType, HashAlgorithm, HashType, XsUri
+from cyclonedx.model.component import Component
+from packageurl import PackageURL
+
+from capycli.common.capycli_bom_support import CaPyCliBom
+from capycli.common.release_index import ReleaseIndex
+from tests.test_base import TestBase
+
+
+class TestReleaseIndex(TestBase):
+    @staticmethod
+    def get_releases() -> List[Dict[str, Any]]:
+        return [
+            {"Id": "1111", "ComponentId": "c1", "Name": "Sed", "Version": "1.0",
+             "ExternalIds": {"package-url": "pkg:deb/debian/sed@1.0"}},
+            {"Id": "2222", "ComponentId": "c2", "Name": "other", "Version": "2.0",
+             "SourceFile": "Other-2.0.zip", "SourceFileHash": "ABCDEF"},
+            {"Id": "3333", "ComponentId": "c1", "Name": "sed", "Version": "4.8",
+             "ExternalIds": {}},
+            {"Id": "4444", "ComponentId": "c3", "Name": "unrelated", "Version": "1.0",
+             "BinaryFileHash": "123456"},
+        ]
+
+    def test_index_sets_sw360_id(self) -> None:
+        releases = self.get_releases()
+        sut = ReleaseIndex(releases)
+        self.assertEqual(releases[0]["Sw360Id"], "1111")
+        self.assertEqual(sut.by_id["4444"], [3])
+        self.assertEqual(sut.by_name["sed"], [0, 2])
+        self.assertTrue(sut.is_valid_for(releases))
+        self.assertFalse(sut.is_valid_for(self.get_releases()))
+
+    def test_find_candidates_by_name(self) -> None:
+        sut = ReleaseIndex(self.get_releases())
+        component = Component(name="SED", version="4.8")
+        candidates = sut.find_candidates(component, [], [])
+        self.assertEqual([r["Id"] for r in candidates], ["1111", "3333"])
+
+    def test_find_candidates_by_purl_and_ids(self) -> None:
+        sut = ReleaseIndex(self.get_releases())
+        component = Component(
+            name="something", version="1.0",
+            purl=PackageURL.from_string("pkg:deb/debian/sed@1.0"))
+        candidates = sut.find_candidates(component, ["4444"], [])
+        self.assertEqual([r["Id"] for r in candidates], ["1111", "4444"])
+
+        candidates = sut.find_candidates(Component(name="x"), [], ["c1"])
+        self.assertEqual([r["Id"] for r in candidates], ["1111", "3333"])
+
+    def test_find_candidates_by_hash_and_filename(self) -> None:
+        sut = ReleaseIndex(self.get_releases())
+        component = Component(name="x", version="1.0")
+        ext_ref = ExternalReference(
+            type=ExternalReferenceType.DISTRIBUTION,
+            comment=CaPyCliBom.SOURCE_FILE_COMMENT,
+            url=XsUri("other-2.0.zip"))
+        component.external_references.add(ext_ref)
+        candidates = sut.find_candidates(component, [], [])
+        self.assertEqual([r["Id"] for r in candidates], ["2222"])
+
+        component = Component(name="x", version="1.0")
+        ext_ref = ExternalReference(
+            type=ExternalReferenceType.DISTRIBUTION,
+            comment=CaPyCliBom.BINARY_FILE_COMMENT,
+            url=XsUri("x.whl"),
+            hashes=[HashType(alg=HashAlgorithm.SHA_1, content="123456")])
+        component.external_references.add(ext_ref)
+        candidates = sut.find_candidates(component, [], [])
+        self.assertEqual([r["Id"] for r in candidates], ["4444"])
+
+    def test_find_candidates_no_match(self) -> None:
+        sut = ReleaseIndex(self.get_releases())
+        self.assertEqual(sut.find_candidates(Component(name="nothing", version="1.0"), [], []), [])
@@ -0,0 +1,66 @@
+# -------------------------------------------------------------------------------
+# Copyright (c) 2026 Siemens
+# All Rights Reserved.
+# Author: thomas.graf@siemens.com
+#
+# SPDX-License-Identifier: MIT
+# -------------------------------------------------------------------------------
+
+import threading
+import time
+from typing import Any, Dict, Optional
+from unittest.mock import MagicMock
+
+from sw360 import SW360Error
+
+from capycli.common.release_service import ReleaseService
+from tests.test_base import TestBase
+
+
+def linked_release(id: str) -> Dict[str, Any]:
+    return {"name": "r" + id, "version": "1.0",
+            "_links": {"self": {"href": TestBase.MYURL + "resource/api/releases/" + id}}}
+
+
+class TestReleaseService(TestBase):
+    def test_read_releases_parallel_and_memoized(self) -> None:
+        active = []
+        max_active = []
+        lock = threading.Lock()
+
+        def get_release_by_url(href: str) -> Optional[Dict[str, Any]]:
+            with lock:
+                active.append(href)
+                max_active.append(len(active))
+            time.sleep(0.01)
+            with lock:
+                active.remove(href)
+            return {"href": href}
+
+        client = MagicMock()
+        client.get_release_by_url.side_effect = get_release_by_url
+        releases = [linked_release(str(i)) for i in range(8)]
+
+        sut = ReleaseService(client, workers=4)
+        sut.read_releases(releases)
+        self.assertEqual(8, client.get_release_by_url.call_count)
+        self.assertLessEqual(max(max_active), 4)
+        self.assertGreater(max(max_active), 1)
+
+        # everything is available without further requests
+        for release in releases:
+            href = ReleaseService.get_href(release)
+            self.assertEqual({"href": href}, sut.get_release(href))
+        sut.read_releases(releases)
+        self.assertEqual(8, client.get_release_by_url.call_count)
+
+    def test_errors_are_raised_by_get_release(self) -> None:
+        client = MagicMock()
+        client.get_release_by_url.side_effect = SW360Error(message="unittest")
+        release = linked_release("1")
+
+        sut = ReleaseService(client, workers=2)
+        sut.read_releases([release])
+        with self.assertRaises(SW360Error):
+            sut.get_release(ReleaseService.get_href(release))
+        self.assertEqual(1, client.get_release_by_url.call_count)
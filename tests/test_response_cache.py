@@ -0,0 +1,118 @@
+# -------------------------------------------------------------------------------
+# Copyright (c) 2026 Siemens
+# All Rights Reserved.
+# Author: thomas.graf@siemens.com
+#
+# SPDX-License-Identifier: MIT
+# -------------------------------------------------------------------------------
+
+import os
+import shutil
+import tempfile
+import time
+
+import responses
+
+from capycli.common import http_support
+from capycli.common.response_cache import ResponseCache
+from tests.test_base import TestBase
+
+
+class TestResponseCache(TestBase):
+    URL = "https://pypi.org/pypi/chardet/3.0.4/json"
+
+    def setUp(self) -> None:
+        self.folder = tempfile.mkdtemp()
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.folder, ignore_errors=True)
+        for name in ("CAPYCLI_HTTP_CACHE", "CAPYCLI_HTTP_OFFLINE"):
+            os.environ.pop(name, None)
+
+    @responses.activate
+    def test_get_stores_and_reuses_response(self) -> None:
+        responses.add(responses.GET, self.URL, json={"info": {"name": "chardet"}},
+                      headers={"ETag": '"abc"'})
+        sut = ResponseCache(self.folder)
+
+        response = sut.get(self.URL, http_support.get)
+        self.assertTrue(response.ok)
+        response = sut.get(self.URL, http_support.get)
+        self.assertTrue(response.ok)
+        self.assertEqual(response.json()["info"]["name"], "chardet")
+        self.assertEqual(response.headers["ETag"], '"abc"')
+        self.assertEqual(len(responses.calls), 1)
+
+        # a different content type is a different document
+        sut.get(self.URL, http_support.get, headers={"Accept": "text/xml"})
+        self.assertEqual(len(responses.calls), 2)
+
+    @responses.activate
+    def test_get_revalidates_stale_response(self) -> None:
+        responses.add(responses.GET, self.URL, json={"info": {}},
+                      headers={"ETag": '"abc"', "Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"})
+        sut = ResponseCache(self.folder, ttl=0)
+        sut.get(self.URL, http_support.get)
+
+        responses.replace(responses.GET, self.URL, status=304)
+        response = sut.get(self.URL, http_support.get)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"info": {}})
+        request_headers = responses.calls[1].request.headers
+        self.assertEqual(request_headers["If-None-Match"], '"abc"')
+        self.assertEqual(request_headers["If-Modified-Since"], "Wed, 21 Oct 2015 07:28:00 GMT")
+
+        responses.replace(responses.GET, self.URL, json={"info": {"version": "2"}})
+        response = sut.get(self.URL, http_support.get)
+        self.assertEqual(response.json(), {"info": {"version": "2"}})
+
+    @responses.activate
+    def test_offline_mode(self) -> None:
+        responses.add(responses.GET, self.URL, json={"info": {}})
+        ResponseCache(self.folder, ttl=0).get(self.URL, http_support.get)
+
+        sut = ResponseCache(self.folder, ttl=0, offline=True)
+        self.assertTrue(sut.get(self.URL, http_support.get).ok)
+        response = sut.get("https://pypi.org/pypi/other/1.0/json", http_support.get)
+        self.assertEqual(response.status_code, 504)
+        self.assertEqual(len(responses.calls), 1)
+
+    @responses.activate
+    def test_eviction(self) -> None:
+        sut = ResponseCache(self.folder, max_size=5000)
+        for i in range(5):
+            url = f"https://registry.npmjs.org/p{i}/1.0"
+            responses.add(responses.GET, url, body="x" * 800)
+            sut.get(url, http_support.get)
+            key = sut.get_key(url)
+            # make sure that the access times differ
+            past = time.time() - 100 + i
+            os.utime(sut.get_paths(key)[1], (past, past))
+
+        # access the oldest entry again, so that it is kept
+        self.assertIsNotNone(sut.load(sut.get_key("https://registry.npmjs.org/p0/1.0")))
+        responses.add(responses.GET, "https://registry.npmjs.org/p5/1.0", body="x" * 800)
+        sut.get("https://registry.npmjs.org/p5/1.0", http_support.get)
+
+        self.assertLessEqual(sut.get_cache_size(), 5000)
+        self.assertIsNotNone(sut.load(sut.get_key("https://registry.npmjs.org/p0/1.0")))
+        self.assertIsNotNone(sut.load(sut.get_key("https://registry.npmjs.org/p5/1.0")))
+        self.assertIsNone(sut.load(sut.get_key("https://registry.npmjs.org/p1/1.0")))
+
+    @responses.activate
+    def test_get_cached(self) -> None:
+        responses.add(responses.GET, self.URL, json={"info": {}})
+        http_support.get_cached(self.URL)
+        http_support.get_cached(self.URL)
+        self.assertEqual(len(responses.calls), 2)
+
+        os.environ["CAPYCLI_HTTP_CACHE"] = self.folder
+        http_support.get_cached(self.URL)
+        http_support.get_cached(self.URL)
+        self.assertEqual(len(responses.calls), 3)
+
+        os.environ["CAPYCLI_HTTP_OFFLINE"] = "1"
+        cache = http_support.get_response_cache()
+        self.assertIsNotNone(cache)
+        self.assertTrue(cache.offline)  # type: ignore
+        self.assertEqual(http_support.get_cached("https://pypi.org/pypi/x/1/json").status_code, 504)
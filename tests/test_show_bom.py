@@ -7,8 +7,10 @@
 # -------------------------------------------------------------------------------
 
 import os
+from unittest.mock import patch
 
 from capycli.bom.show_bom import ShowBom
+from capycli.common.capycli_bom_support import CaPyCliBom
 from capycli.main.result_codes import ResultCode
 from tests.test_base import AppArguments, TestBase
 
@@ -76,3 +78,31 @@ class TestShowBom(TestBase):
         self.assertTrue("tomli, 2.0.1" in out)
         self.assertTrue("wheel, 0.34.2" in out)
         self.assertTrue("4 items in bill of material" in out)
+
+    def test_simple_bom_without_object_model(self) -> None:
+        # without -v, the components are shown without creating the CycloneDX object model
+        sut = ShowBom()
+        args = AppArguments()
+        args.command = []
+        args.command.append("bom")
+        args.command.append("show")
+        args.inputfile = os.path.join(os.path.dirname(__file__), "fixtures", TestShowBom.INPUTFILE)
+        with patch.object(CaPyCliBom, "read_sbom", side_effect=AssertionError("object model created")):
+            out = self.capture_stdout(sut.run, args)
+
+        self.assertTrue("colorama, 0.4.3" in out)
+        self.assertTrue("wheel, 0.34.2" in out)
+        self.assertTrue("4 items in bill of material" in out)
+
+    def test_bom_error_reading_sbom(self) -> None:
+        sut = ShowBom()
+        args = AppArguments()
+        args.command = []
+        args.command.append("bom")
+        args.command.append("show")
+        args.inputfile = os.path.join(os.path.dirname(__file__), "fixtures", "plaintext.txt")
+        try:
+            self.capture_stdout(sut.run, args)
+            self.assertTrue(False, "Failed to report invalid SBOM")
+        except SystemExit as ex:
+            self.assertEqual(ResultCode.RESULT_ERROR_READING_BOM, ex.code)
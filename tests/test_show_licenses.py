@@ -6,8 +6,10 @@
 # SPDX-License-Identifier: MIT
 # -------------------------------------------------------------------------------
 
+import hashlib
 import os
 import shutil
+import tempfile
 
 import responses
 
@@ -477,6 +479,96 @@ class TestShowLicenses(TestBase):
         if os.path.exists(sut.TEMPFOLDER):
             shutil.rmtree(sut.TEMPFOLDER)
 
+    @responses.activate
+    def test_project_licenses_parallel(self) -> None:
+        sut = ShowLicenses()
+
+        args = AppArguments()
+        args.command = ["project", "licenses"]
+        args.sw360_token = TestBase.MYTOKEN
+        args.sw360_url = TestBase.MYURL
+        args.id = "p001"
+        args.workers = 2
+
+        self.add_login_response()
+        responses.add(
+            responses.GET,
+            url=self.MYURL + "resource/api/projects/p001",
+            json=self.get_project_for_test())
+        self.get_wheel_for_test()
+        self.get_cli_for_test()
+        responses.add(
+            method=responses.GET,
+            url=self.MYURL + "resource/api/releases/r002/attachments/r002a002",
+            body=self.get_cli_file_gpl(),
+            content_type="application/text")
+
+        sut.nodelete = True
+        out = self.capture_stdout(sut.run, args)
+        # the attachment id makes the names of the downloaded files unique
+        self.assertTrue(os.path.isfile(os.path.join(sut.TEMPFOLDER, "r002a002_CLIXML_clipython-1.3.0.xml")))
+        # the results are shown in release order
+        self.assertTrue(out.index("cli-support, 1.3") < out.index("GNU General Public License, v2.0 (GPL-2.0)")
+                        < out.index("wheel, 0.38.4") < out.index("License summary"))
+        self.assertEqual(["GNU General Public License, v2.0"], sut.global_license_list)
+
+        if os.path.exists(sut.TEMPFOLDER):
+            shutil.rmtree(sut.TEMPFOLDER)
+
+    @responses.activate
+    def test_project_licenses_cached_cli_file(self) -> None:
+        store_folder = tempfile.mkdtemp()
+        os.environ["CAPYCLI_ARTIFACT_STORE"] = store_folder
+
+        args = AppArguments()
+        args.command = ["project", "licenses"]
+        args.sw360_token = TestBase.MYTOKEN
+        args.sw360_url = TestBase.MYURL
+        args.id = "p001"
+
+        cli_file = self.get_cli_file_gpl()
+        sha1 = hashlib.sha1(cli_file.encode("utf-8")).hexdigest()
+
+        self.add_login_response()
+        responses.add(
+            responses.GET,
+            url=self.MYURL + "resource/api/projects/p001",
+            json=self.get_project_for_test())
+        self.get_wheel_for_test()
+        responses.add(
+            responses.GET,
+            url=self.MYURL + "resource/api/releases/r002",
+            json=self.get_release_cli_for_test())
+        responses.add(
+            responses.GET,
+            url=self.MYURL + "resource/api/attachments/r002a001",
+            json={"filename": "clipython-1.3.0.zip", "sha1": "0" * 40, "attachmentType": "SOURCE"})
+        responses.add(
+            responses.GET,
+            url=self.MYURL + "resource/api/attachments/r002a002",
+            json={"filename": "CLIXML_clipython-1.3.0.xml", "sha1": sha1,
+                  "attachmentType": "COMPONENT_LICENSE_INFO_XML"})
+        download = responses.add(
+            responses.GET,
+            url=self.MYURL + "resource/api/releases/r002/attachments/r002a002",
+            body=cli_file,
+            content_type="application/text")
+
+        try:
+            for _ in range(2):
+                sut = ShowLicenses()
+                out = self.capture_stdout(sut.run, args)
+                self.assertTrue("GNU General Public License, v2.0 (GPL-2.0)" in out)
+                self.assertEqual(["GNU General Public License, v2.0"], sut.global_license_list)
+
+            # the second run takes the CLI file and its licenses from the store
+            self.assertEqual(1, download.call_count)
+        finally:
+            os.environ.pop("CAPYCLI_ARTIFACT_STORE", None)
+            shutil.rmtree(store_folder, ignore_errors=True)
+            if os.path.exists(ShowLicenses.TEMPFOLDER):
+                shutil.rmtree(ShowLicenses.TEMPFOLDER)
+
 
 if __name__ == "__main__":
     APP = TestShowLicenses()
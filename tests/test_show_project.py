@@ -171,6 +171,31 @@ class TestShowProject(TestBase):
         self.assertTrue("cli-support, 1.3 = MAINLINE, APPROVED" in out)
         self.assertTrue("wheel, 0.38.4 = SPECIFIC, APPROVED" in out)
 
+    @responses.activate
+    def test_project_show_by_id_parallel(self) -> None:
+        sut = ShowProject()
+
+        args = AppArguments()
+        args.command = ["project", "show"]
+        args.sw360_token = TestBase.MYTOKEN
+        args.sw360_url = TestBase.MYURL
+        args.id = "p001"
+        args.workers = 4
+
+        self.add_login_response()
+        responses.add(responses.GET, url=self.MYURL + "resource/api/projects/p001",
+                      json=self.get_project_for_test())
+        responses.add(responses.GET, url=self.MYURL + "resource/api/releases/r001",
+                      json=self.get_release_wheel_for_test())
+        responses.add(responses.GET, url=self.MYURL + "resource/api/releases/r002",
+                      json=self.get_release_cli_for_test())
+
+        out = self.capture_stdout(sut.run, args)
+        self.assertTrue(out.index("cli-support, 1.3 = MAINLINE, APPROVED") < out.index(
+            "wheel, 0.38.4 = SPECIFIC, APPROVED"))
+        # every release is read only once
+        self.assertEqual(2, len([c for c in responses.calls if "/releases/" in c.request.url]))
+
     @responses.activate
     def test_project_show_by_name(self) -> None:
         sut = ShowProject()